@@ -8,8 +8,25 @@ using Dates
 using UUIDs
 using Logging
 using Statistics
+using HTTP
 const Threads = Base.Threads
 
+# Every detective module includes tool_analyze_wallet.jl; they all pick up this one
+# keep-alive pool instead of opening a separate pool (and TLS sessions) per detective.
+const SHARED_AI_HTTP_POOL = HTTP.Pool(try parse(Int, get(ENV, "AI_HTTP_POOL_SIZE", "16")) catch; 16 end)
+# Same for its counterparty identity and AI verdict caches, so a hit in one detective
+# serves the others instead of each module keeping its own copy
+include("../utils/TTLCaches.jl")
+using .TTLCaches: TTLCache
+const SHARED_IDENTITY_CACHE = TTLCache{String, Dict{String,Any}}(
+    Inf, try parse(Int, get(ENV, "IDENTITY_CACHE_MAX", "4096")) catch; 4096 end)
+const SHARED_AI_VERDICT_CACHE = TTLCache{UInt64, String}(
+    try parse(Float64, get(ENV, "AI_VERDICT_CACHE_TTL_S", "600")) catch; 600.0 end,
+    try parse(Int, get(ENV, "AI_VERDICT_CACHE_MAX", "512")) catch; 512 end)
+
+# Wall-clock budget for each detective in a multi-detective investigation
+const DETECTIVE_TIMEOUT_S = try parse(Float64, get(ENV, "DETECTIVE_TIMEOUT_S", "180")) catch; 180.0 end
+
 # CommonTypes will be available from parent module JuliaOS
 include("CommonTypes.jl")
 using .CommonTypes
@@ -142,7 +159,7 @@ end
 function create_detective_by_type(detective_type::String)
     """Factory function to create specific detective types"""
     if detective_type == "poirot"
-        return create_poirot_agent()
+        return get_poirot()
     elseif detective_type == "marple"
         return create_marple_agent()
     elseif detective_type == "spade"
@@ -288,8 +305,19 @@ function investigate_wallet_multi_detective(wallet_address::String, investigatio
         tasks[detective_type] = Threads.@spawn investigate_wallet(detective_type, wallet_address, investigation_id)
     end
 
-    # Collect results
+    # Collect results; one stuck detective must not hold up the consensus, so every
+    # detective shares one deadline and late ones are reported as timed out
+    deadline = time() + DETECTIVE_TIMEOUT_S
     for (detective_type, t) in tasks
+        if timedwait(() -> istaskdone(t), max(deadline - time(), 0.0); pollint=0.1) === :timed_out
+            @warn "Detective timed out; continuing with partial results" detective=detective_type timeout_s=DETECTIVE_TIMEOUT_S
+            results[detective_type] = Dict(
+                "detective" => detective_type,
+                "error" => "Investigation timed out after $(DETECTIVE_TIMEOUT_S)s",
+                "status" => "timeout"
+            )
+            continue
+        end
         try
             results[detective_type] = fetch(t)
         catch e
@@ -378,18 +406,20 @@ function create_detective_by_type(detective_type::String)
     end
 end
 
+const DETECTIVE_REGISTRY = Dict(
+    "available_detectives" => ["poirot", "marple", "spade", "marlowee", "dupin", "shadow", "raven"],
+    "total_count" => 7,
+    "status" => "active",
+    "version" => "2.0_refactored"
+)
+
 """
     get_detective_registry() -> Dict{String, Any}
 
 Get the registry of all available detective agents.
 """
 function get_detective_registry()
-    return Dict(
-        "available_detectives" => ["poirot", "marple", "spade", "marlowee", "dupin", "shadow", "raven"],
-        "total_count" => 7,
-        "status" => "active",
-        "version" => "2.0_refactored"
-    )
+    return copy(DETECTIVE_REGISTRY)
 end
 
 """
@@ -418,72 +448,67 @@ function investigate_wallet(agent::Dict, wallet_address::String, investigation_i
     return investigate_wallet(detective_type, wallet_address, investigation_id)
 end
 
-# Helper functions for detective metadata
-function get_detective_name(detective_type::String)
-    detective_names = Dict(
-        "poirot" => "Hercule Poirot",
-        "marple" => "Miss Jane Marple",
-        "spade" => "Sam Spade",
-        "marlowee" => "Philip Marlowe",
-        "dupin" => "Auguste Dupin",
-        "shadow" => "The Shadow",
-        "raven" => "Edgar Allan Raven"
-    )
-    return get(detective_names, detective_type, "Unknown Detective")
-end
+# Detective metadata tables, built once at load; the getters below only look up.
+const DETECTIVE_NAMES = Dict(
+    "poirot" => "Hercule Poirot",
+    "marple" => "Miss Jane Marple",
+    "spade" => "Sam Spade",
+    "marlowee" => "Philip Marlowe",
+    "dupin" => "Auguste Dupin",
+    "shadow" => "The Shadow",
+    "raven" => "Edgar Allan Raven"
+)
 
-function get_detective_specialty(detective_type::String)
-    specialties = Dict(
-        "poirot" => "methodical_transaction_analysis",
-        "marple" => "behavioral_pattern_detection",
-        "spade" => "risk_assessment_compliance",
-        "marlowee" => "deep_analysis_investigation",
-        "dupin" => "analytical_reasoning",
-        "shadow" => "stealth_investigation",
-        "raven" => "dark_investigation_synthesis"
-    )
-    return get(specialties, detective_type, "general_investigation")
-end
+const DETECTIVE_SPECIALTIES = Dict(
+    "poirot" => "methodical_transaction_analysis",
+    "marple" => "behavioral_pattern_detection",
+    "spade" => "risk_assessment_compliance",
+    "marlowee" => "deep_analysis_investigation",
+    "dupin" => "analytical_reasoning",
+    "shadow" => "stealth_investigation",
+    "raven" => "dark_investigation_synthesis"
+)
 
-function get_detective_skills(detective_type::String)
-    skills_map = Dict(
-        "poirot" => ["transaction_analysis", "methodical_investigation", "pattern_recognition"],
-        "marple" => ["behavioral_analysis", "social_patterns", "intuitive_detection"],
-        "spade" => ["risk_assessment", "compliance_checking", "threat_evaluation"],
-        "marlowee" => ["corruption_detection", "deep_analysis", "cynical_investigation"],
-        "dupin" => ["analytical_reasoning", "mathematical_analysis", "logical_deduction"],
-        "shadow" => ["stealth_analysis", "hidden_patterns", "covert_investigation"],
-        "raven" => ["dark_psychology", "synthesis", "narrative_creation"]
-    )
-    return get(skills_map, detective_type, ["general_investigation"])
-end
+const DETECTIVE_SKILLS = Dict(
+    "poirot" => ["transaction_analysis", "methodical_investigation", "pattern_recognition"],
+    "marple" => ["behavioral_analysis", "social_patterns", "intuitive_detection"],
+    "spade" => ["risk_assessment", "compliance_checking", "threat_evaluation"],
+    "marlowee" => ["corruption_detection", "deep_analysis", "cynical_investigation"],
+    "dupin" => ["analytical_reasoning", "mathematical_analysis", "logical_deduction"],
+    "shadow" => ["stealth_analysis", "hidden_patterns", "covert_investigation"],
+    "raven" => ["dark_psychology", "synthesis", "narrative_creation"]
+)
 
-function get_detective_persona(detective_type::String)
-    personas = Dict(
-        "poirot" => "Meticulous Belgian detective with methodical approach to blockchain analysis",
-        "marple" => "Observant elderly sleuth with intuitive understanding of human behavior",
-        "spade" => "Hard-boiled private investigator focused on risk and compliance",
-        "marlowee" => "Cynical detective specializing in corruption and power structure analysis",
-        "dupin" => "Analytical reasoner using pure logic and mathematical deduction",
-        "shadow" => "Mysterious investigator operating in the shadows of blockchain networks",
-        "raven" => "Dark analyst providing comprehensive investigation synthesis"
-    )
-    return get(personas, detective_type, "General purpose detective agent")
-end
+const DETECTIVE_PERSONAS = Dict(
+    "poirot" => "Meticulous Belgian detective with methodical approach to blockchain analysis",
+    "marple" => "Observant elderly sleuth with intuitive understanding of human behavior",
+    "spade" => "Hard-boiled private investigator focused on risk and compliance",
+    "marlowee" => "Cynical detective specializing in corruption and power structure analysis",
+    "dupin" => "Analytical reasoner using pure logic and mathematical deduction",
+    "shadow" => "Mysterious investigator operating in the shadows of blockchain networks",
+    "raven" => "Dark analyst providing comprehensive investigation synthesis"
+)
 
-function get_detective_catchphrase(detective_type::String)
-    catchphrases = Dict(
-        "poirot" => "These little grey cells, they show me the truth in the blockchain!",
-        "marple" => "Human nature is the same everywhere, even in crypto transactions.",
-        "spade" => "The facts, ma'am. Just the blockchain facts.",
-        "marlowee" => "In this crypto city, every wallet tells a story of corruption or virtue.",
-        "dupin" => "Through pure analytical reasoning, all blockchain mysteries unfold.",
-        "shadow" => "Who knows what evil lurks in the hearts of crypto wallets? The Shadow knows!",
-        "raven" => "Nevermore shall suspicious transactions escape our dark investigation."
-    )
-    return get(catchphrases, detective_type, "Justice will prevail in the blockchain!")
+const DETECTIVE_CATCHPHRASES = Dict(
+    "poirot" => "These little grey cells, they show me the truth in the blockchain!",
+    "marple" => "Human nature is the same everywhere, even in crypto transactions.",
+    "spade" => "The facts, ma'am. Just the blockchain facts.",
+    "marlowee" => "In this crypto city, every wallet tells a story of corruption or virtue.",
+    "dupin" => "Through pure analytical reasoning, all blockchain mysteries unfold.",
+    "shadow" => "Who knows what evil lurks in the hearts of crypto wallets? The Shadow knows!",
+    "raven" => "Nevermore shall suspicious transactions escape our dark investigation."
+)
+
+get_detective_name(detective_type::String) = get(DETECTIVE_NAMES, detective_type, "Unknown Detective")
+get_detective_specialty(detective_type::String) = get(DETECTIVE_SPECIALTIES, detective_type, "general_investigation")
+# Copy so callers that push! into the result cannot mutate the shared table
+function get_detective_skills(detective_type::String)
+    return copy(get(DETECTIVE_SKILLS, detective_type, ["general_investigation"]))
 end
 
+get_detective_persona(detective_type::String) = get(DETECTIVE_PERSONAS, detective_type, "General purpose detective agent")
+get_detective_catchphrase(detective_type::String) = get(DETECTIVE_CATCHPHRASES, detective_type, "Justice will prevail in the blockchain!")
+
 # Update exports for framework compatibility
 export create_detective_by_type, get_detective_registry, investigate_with_agent
 export get_detective_name, get_detective_specialty, get_detective_skills
@@ -74,7 +74,7 @@ Conducts analytical reasoning investigation using real blockchain data.
 Dupin's approach: pure logic, methodical deduction, and systematic analysis.
 """
 function investigate_dupin_style(wallet_address::String, investigation_id::String)
-    @info "🧠 Dupin: Beginning analytical reasoning investigation for wallet: $wallet_address"
+    @info "🧠 Dupin: Beginning analytical reasoning investigation" wallet=wallet_address
 
     try
         # Configure analysis tool for methodical investigation
@@ -255,10 +255,10 @@ function synthesize_patterns_dupin(wallet_data::Dict)
     tx_count = tx_summary["total_transactions"]
 
     # Pattern categorization through analytical synthesis
-    behavioral_patterns = filter(p -> occursin("behavior", lowercase(p)) || occursin("pattern", lowercase(p)), patterns)
-    temporal_patterns = filter(p -> occursin("time", lowercase(p)) || occursin("timing", lowercase(p)), patterns)
-    value_patterns = filter(p -> occursin("value", lowercase(p)) || occursin("amount", lowercase(p)), patterns)
-    frequency_patterns = filter(p -> occursin("frequent", lowercase(p)) || occursin("regular", lowercase(p)), patterns)
+    behavioral_patterns = filter(p -> occursin(r"behavior|pattern"i, p), patterns)
+    temporal_patterns = filter(p -> occursin(r"time|timing"i, p), patterns)
+    value_patterns = filter(p -> occursin(r"value|amount"i, p), patterns)
+    frequency_patterns = filter(p -> occursin(r"frequent|regular"i, p), patterns)
 
     # Analytical synthesis
     pattern_synthesis = if length(patterns) == 0
@@ -319,7 +319,7 @@ function analyze_temporal_logic_dupin(wallet_data::Dict)
     patterns = risk_assessment["patterns"]
 
     # Temporal reasoning chain
-    temporal_indicators = filter(p -> occursin("time", lowercase(p)) || occursin("timing", lowercase(p)), patterns)
+    temporal_indicators = filter(p -> occursin(r"time|timing"i, p), patterns)
 
     if length(temporal_indicators) == 0
         return "no_temporal_anomalies_detected"
@@ -17,9 +17,15 @@ import ..AgentCore: AbstractLLMIntegration, DetectiveMemory, InvestigationTask #
 # Config is now loaded by framework
 import ..Config: get_config
 
-export chat, chat_stream, get_provider_status, # Export the new status function
+include("../utils/TTLCaches.jl")
+using .TTLCaches
+include("../utils/PromptLayout.jl")
+using .PromptLayout: cacheable_prompt
+
+export chat, chat_stream, chat_first_json, each_json_object, each_line, get_provider_status, # Export the new status function
        analyze_wallet_with_llm, generate_investigation_report, get_detective_insights,
-       create_detective_prompt, format_investigation_for_llm
+       create_detective_prompt, create_detective_system_prompt, create_detective_user_prompt,
+       format_investigation_for_llm, analysis_cache_stats, normalize_risk_level
 
 # --- Concrete Implementations of AbstractLLMIntegration ---
 struct OpenAILLMIntegration <: AbstractLLMIntegration end
@@ -30,6 +36,10 @@ struct CohereLLMIntegration <: AbstractLLMIntegration end
 # struct GeminiLLMIntegration <: AbstractLLMIntegration end  # REMOVED - not used
 struct EchoLLMIntegration <: AbstractLLMIntegration end # Fallback
 
+# One keep-alive connection pool for every agent's LLM calls in this process, so
+# concurrent detectives reuse TLS connections instead of handshaking per request.
+const LLM_HTTP_POOL = HTTP.Pool(try parse(Int, get(ENV, "LLM_HTTP_POOL_SIZE", "32")) catch; 32 end)
+
 # --- Provider Availability Checks (Conceptual) ---
 is_openai_available() = true
 is_anthropic_available() = true # For direct HTTP, assume available if configured
@@ -97,6 +107,11 @@ function chat(llm::OpenAILLMIntegration, prompt::String; cfg::Dict)
         "max_tokens" => max_tokens_to_sample
     )
 
+    # JSON mode: the model is constrained to emit a single JSON object
+    if get(cfg, "response_format", "") == "json"
+        payload["response_format"] = Dict("type" => "json_object")
+    end
+
     # Add support for streaming output
     if get(cfg, "stream", false)
         payload["stream"] = true
@@ -107,7 +122,7 @@ function chat(llm::OpenAILLMIntegration, prompt::String; cfg::Dict)
     json_payload = JSON3.write(payload)
     @debug "Sending request to OpenAI" endpoint=chat_endpoint model=model
     try
-        response = HTTP.post(chat_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60))
+        response = HTTP.post(chat_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60), pool=LLM_HTTP_POOL)
         response_body_str = String(response.body)
         @debug "OpenAI Response Status: $(response.status)"
 
@@ -115,6 +130,9 @@ function chat(llm::OpenAILLMIntegration, prompt::String; cfg::Dict)
             json_response = JSON3.read(response_body_str)
             if haskey(json_response, "choices") && !isempty(json_response.choices) &&
                haskey(json_response.choices[1], "message") && haskey(json_response.choices[1].message, "content")
+                if get(json_response.choices[1], :finish_reason, "") == "length"
+                    @warn "LLM reply truncated at max_tokens" model=get(cfg, "model", "") max_tokens=get(cfg, "max_tokens", nothing)
+                end
                 return json_response.choices[1].message.content
             else
                 @error "OpenAI response format error." full_response=json_response
@@ -175,45 +193,47 @@ function chat_stream(llm::OpenAILLMIntegration, prompt::String; cfg::Dict)
         "max_tokens" => max_tokens_to_sample,
         "stream" => true
     )
+    if get(cfg, "response_format", "") == "json"
+        payload["response_format"] = Dict("type" => "json_object")
+    end
 
     json_payload = JSON3.write(payload)
 
     return Channel{String}(10) do ch
         try
-            HTTP.open("POST", chat_endpoint, headers) do stream
+            HTTP.open("POST", chat_endpoint, headers; pool=LLM_HTTP_POOL) do stream
                 write(stream, json_payload)
                 HTTP.closewrite(stream)
                 r = HTTP.startread(stream)
                 isdone = false
+                pending = ""  # a read can end mid-line; carry the partial SSE line over
                 while !isdone
                     if eof(stream)
                         break
                     end
-                    masterchunk = String(readavailable(stream))
-                    chunks = String.(filter(!isempty, split(masterchunk, "\n")))
-                    for chunk in chunks
-                        if occursin(chunk, "data: [DONE]")
-                            isdone = true
-                            break
-                        end
+                    lines = split(pending * String(readavailable(stream)), "\n")
+                    pending = String(pop!(lines))
+                    for line in lines
+                        chunk = strip(line)
                         if startswith(chunk, "data: ")
                             data = chunk[7:end] # Remove "data: " prefix
                             if data == "[DONE]"
+                                isdone = true
                                 break
                             end
-                            try
+                            content = try
                                 json_response = JSON3.read(data)
                                 if haskey(json_response, "choices") && !isempty(json_response.choices) &&
                                    haskey(json_response.choices[1], "delta")
-                                    delta = json_response.choices[1].delta
-                                    if haskey(delta, "content")
-                                        content = delta["content"]
-                                        put!(ch, content)  # Push to Channel
-                                    end
+                                    get(json_response.choices[1].delta, "content", nothing)
                                 end
                             catch e
                                 @warn "Error parsing streaming response" error=e
+                                nothing
                             end
+                            # Outside the try: once the consumer closes the channel, put!
+                            # throws and ends the request instead of reading the rest
+                            content isa AbstractString && put!(ch, String(content))
                         end
                     end
                 end
@@ -225,6 +245,90 @@ function chat_stream(llm::OpenAILLMIntegration, prompt::String; cfg::Dict)
     end
 end
 
+"""
+    each_json_object(f, chunks) -> String
+
+Consumes streamed text `chunks` and calls `f(object_text)` as soon as each top-level
+JSON object closes, while later chunks are still arriving. Returning `false` from `f`
+stops consuming. Returns the text read so far.
+"""
+function each_json_object(f, chunks)
+    full = IOBuffer()
+    obj = IOBuffer()
+    depth = 0
+    in_string = false
+    escaped = false
+    for chunk in chunks
+        print(full, chunk)
+        for c in chunk
+            depth == 0 && c != '{' && continue
+            print(obj, c)
+            if in_string
+                if escaped
+                    escaped = false
+                elseif c == '\\'
+                    escaped = true
+                elseif c == '"'
+                    in_string = false
+                end
+            elseif c == '"'
+                in_string = true
+            elseif c == '{'
+                depth += 1
+            elseif c == '}'
+                depth -= 1
+                if depth == 0 && f(String(take!(obj))) === false
+                    return String(take!(full))
+                end
+            end
+        end
+    end
+    return String(take!(full))
+end
+
+"""
+    each_line(f, chunks) -> String
+
+Calls `f(line)` for every line of a streamed reply the moment its newline arrives
+(the trailing partial line is flushed at the end), and returns the full text.
+"""
+function each_line(f, chunks)
+    full = IOBuffer()
+    line = IOBuffer()
+    for chunk in chunks
+        print(full, chunk)
+        for c in chunk
+            if c == '\n'
+                f(String(take!(line)))
+            else
+                print(line, c)
+            end
+        end
+    end
+    rest = String(take!(line))
+    isempty(rest) || f(rest)
+    return String(take!(full))
+end
+
+"""
+    chat_first_json(llm::AbstractLLMIntegration, prompt::String; cfg::Dict) -> String
+
+Streams the reply and returns the first complete JSON object the moment its closing
+brace arrives, cancelling the rest of the stream. Falls back to the whole text when
+the reply holds no JSON object. Providers without streaming go through the generic
+`chat_stream` fallback and behave like `chat`.
+"""
+function chat_first_json(llm::AbstractLLMIntegration, prompt::String; cfg::Dict)
+    ch = chat_stream(llm, prompt; cfg)
+    first_object = nothing
+    text = each_json_object(ch) do obj
+        first_object = obj
+        false
+    end
+    isopen(ch) && close(ch)  # stops the producer and drops the remaining tokens
+    return something(first_object, text)
+end
+
 # Helper function: process OpenAI streaming response
 function process_openai_stream_response(response_body::String)
     result = ""
@@ -285,18 +389,22 @@ function chat(llm::AnthropicLLMIntegration, prompt::String; cfg::Dict)
         "temperature" => temperature
     )
     if !isempty(system_prompt_content)
-        payload["system"] = system_prompt_content
+        # Mark static system prompts as cacheable so repeated calls reuse the prefix
+        payload["system"] = if get(cfg, "cache_system_prompt", false)
+            [Dict("type" => "text", "text" => system_prompt_content, "cache_control" => Dict("type" => "ephemeral"))]
+        else
+            system_prompt_content
+        end
+    end
+    # Add other Anthropic specific parameters from cfg if needed (e.g., top_p, top_k)
+    if get(cfg, "stream", false)
+        return chat_stream(llm, prompt; cfg)
     end
-    # Add other Anthropic specific parameters from cfg if needed (e.g., top_p, top_k, stream)
-    # if haskey(cfg, "stream") && cfg["stream"] == true
-    #     payload["stream"] = true
-    #     # Note: Handling streaming responses would require different logic below
-    # end
 
     json_payload = JSON3.write(payload)
     @debug "Sending request to Anthropic Messages API" endpoint=messages_endpoint model=model
     try
-        response = HTTP.post(messages_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60))
+        response = HTTP.post(messages_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60), pool=LLM_HTTP_POOL)
         response_body_str = String(response.body)
         @debug "Anthropic Response Status: $(response.status)"
 
@@ -306,6 +414,9 @@ function chat(llm::AnthropicLLMIntegration, prompt::String; cfg::Dict)
             if haskey(json_response, "content") && !isempty(json_response.content) &&
                haskey(json_response.content[1], "type") && json_response.content[1].type == "text" &&
                haskey(json_response.content[1], "text")
+                if get(json_response, :stop_reason, "") == "max_tokens"
+                    @warn "LLM reply truncated at max_tokens" model=model max_tokens=max_tokens_to_sample
+                end
                 return json_response.content[1].text
             else
                 @error "Anthropic response format error." full_response=json_response
@@ -331,6 +442,80 @@ function chat(llm::AnthropicLLMIntegration, prompt::String; cfg::Dict)
 end
 
 
+"""
+    chat_stream(llm::AnthropicLLMIntegration, prompt::String; cfg::Dict)
+
+Streaming chat implementation for Anthropic (server-sent events).
+Returns a Channel that yields text deltas as they arrive.
+"""
+function chat_stream(llm::AnthropicLLMIntegration, prompt::String; cfg::Dict)
+    api_key = get(ENV, "ANTHROPIC_API_KEY", get(cfg, "api_key", ""))
+    if isempty(api_key)
+        @error "Anthropic API key not found in ENV or agent configuration."
+        return Channel{String}(0) do ch; close(ch); end
+    end
+
+    anthropic_api_base = get(cfg, "api_base", "https://api.anthropic.com/v1")
+    messages_endpoint = "$anthropic_api_base/messages"
+    headers = Dict(
+        "Content-Type" => "application/json",
+        "x-api-key" => api_key,
+        "anthropic-version" => get(cfg, "anthropic_version", "2023-06-01")
+    )
+
+    payload = Dict(
+        "model" => get(cfg, "model", "claude-3-haiku-20240307"),
+        "messages" => [Dict("role" => "user", "content" => prompt)],
+        "max_tokens" => get(cfg, "max_tokens", 1024),
+        "temperature" => get(cfg, "temperature", 0.7),
+        "stream" => true
+    )
+    system_prompt_content = get(cfg, "system_prompt", "")
+    if !isempty(system_prompt_content)
+        payload["system"] = if get(cfg, "cache_system_prompt", false)
+            [Dict("type" => "text", "text" => system_prompt_content, "cache_control" => Dict("type" => "ephemeral"))]
+        else
+            system_prompt_content
+        end
+    end
+
+    json_payload = JSON3.write(payload)
+
+    return Channel{String}(10) do ch
+        try
+            HTTP.open("POST", messages_endpoint, headers; pool=LLM_HTTP_POOL) do stream
+                write(stream, json_payload)
+                HTTP.closewrite(stream)
+                HTTP.startread(stream)
+                pending = ""  # SSE lines can be split across reads
+                while !eof(stream)
+                    pending *= String(readavailable(stream))
+                    lines = split(pending, "\n")
+                    pending = String(pop!(lines))
+                    for line in lines
+                        startswith(line, "data: ") || continue
+                        try
+                            event = JSON3.read(line[7:end])
+                            if get(event, :type, "") == "content_block_delta" && get(event.delta, :type, "") == "text_delta"
+                                put!(ch, String(event.delta.text))
+                            elseif get(event, :type, "") == "message_stop"
+                                break
+                            end
+                        catch e
+                            @warn "Error parsing Anthropic streaming event" error=e
+                        end
+                    end
+                end
+                HTTP.closeread(stream)
+            end
+        catch e
+            @error "Exception during Anthropic streaming call" exception=(e, catch_backtrace())
+        finally
+            close(ch)
+        end
+    end
+end
+
 # --- Placeholder Implementations for Other Providers (using direct HTTP) ---
 function chat(llm::LlamaLLMIntegration, prompt::String; cfg::Dict)
     endpoint_url = get(cfg, "endpoint_url", get(ENV, "LLAMA_ENDPOINT_URL", ""))
@@ -391,7 +576,7 @@ function chat(llm::LlamaLLMIntegration, prompt::String; cfg::Dict)
     json_payload = JSON3.write(payload)
     @debug "Sending request to Llama endpoint" endpoint=endpoint_url model=model_identifier
     try
-        response = HTTP.post(endpoint_url, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 120))
+        response = HTTP.post(endpoint_url, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 120), pool=LLM_HTTP_POOL)
         response_body_str = String(response.body)
         @debug "Llama Endpoint Response Status: $(response.status)"
 
@@ -400,6 +585,9 @@ function chat(llm::LlamaLLMIntegration, prompt::String; cfg::Dict)
             # Assuming OpenAI-compatible response structure:
             if haskey(json_response, "choices") && !isempty(json_response.choices) &&
                haskey(json_response.choices[1], "message") && haskey(json_response.choices[1].message, "content")
+                if get(json_response.choices[1], :finish_reason, "") == "length"
+                    @warn "LLM reply truncated at max_tokens" model=get(cfg, "model", "") max_tokens=get(cfg, "max_tokens", nothing)
+                end
                 return json_response.choices[1].message.content
             # Fallback for some other common structures (e.g. direct text or Groq-like)
             elseif haskey(json_response, "text") # Direct text
@@ -477,7 +665,7 @@ function chat(llm::MistralLLMIntegration, prompt::String; cfg::Dict)
     json_payload = JSON3.write(payload)
     @debug "Sending request to Mistral AI" endpoint=chat_endpoint model=model
     try
-        response = HTTP.post(chat_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60))
+        response = HTTP.post(chat_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60), pool=LLM_HTTP_POOL)
         response_body_str = String(response.body)
         @debug "Mistral AI Response Status: $(response.status)"
 
@@ -485,6 +673,9 @@ function chat(llm::MistralLLMIntegration, prompt::String; cfg::Dict)
             json_response = JSON3.read(response_body_str)
             if haskey(json_response, "choices") && !isempty(json_response.choices) &&
                haskey(json_response.choices[1], "message") && haskey(json_response.choices[1].message, "content")
+                if get(json_response.choices[1], :finish_reason, "") == "length"
+                    @warn "LLM reply truncated at max_tokens" model=get(cfg, "model", "") max_tokens=get(cfg, "max_tokens", nothing)
+                end
                 return json_response.choices[1].message.content
             else
                 @error "Mistral AI response format error." full_response=json_response
@@ -567,7 +758,7 @@ function chat(llm::CohereLLMIntegration, prompt::String; cfg::Dict)
     json_payload = JSON3.write(payload)
     @debug "Sending request to Cohere" endpoint=chat_endpoint model=model
     try
-        response = HTTP.post(chat_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60))
+        response = HTTP.post(chat_endpoint, headers, json_payload; readtimeout=get(cfg, "request_timeout_seconds", 60), pool=LLM_HTTP_POOL)
         response_body_str = String(response.body)
         @debug "Cohere Response Status: $(response.status)"
 
@@ -611,6 +802,51 @@ end
 
 # --- Provider Status Check Functions ---
 
+# Network status probes (OpenAI /models, Llama HEAD) are cached per endpoint so
+# repeated status polls and agent boots don't each pay a round-trip. Only "ok"
+# results are cached; LLM_SKIP_HEALTHCHECK=true skips the network probe entirely.
+# On a cold cache, concurrent callers (N agents booting together) wait on the one
+# probe already in flight for that endpoint instead of each starting their own.
+const LLM_STATUS_CACHE_TTL_S = try parse(Float64, get(ENV, "LLM_STATUS_CACHE_TTL_S", "300")) catch; 300.0 end
+const LLM_SKIP_HEALTHCHECK = lowercase(get(ENV, "LLM_SKIP_HEALTHCHECK", "false")) == "true"
+const _STATUS_CACHE = TTLCache{String, Dict{String, Any}}(LLM_STATUS_CACHE_TTL_S)
+# Guarded by the status cache's own lock, so lookups, probe starts and result
+# handoffs are ordered against each other
+const _STATUS_INFLIGHT = Dict{String, Task}()
+
+function _cached_status(probe::Function, key::String)::Dict{String, Any}
+    hit, task = lock(_STATUS_CACHE.lock) do
+        entry = cache_get(_STATUS_CACHE, key)
+        entry !== nothing && return entry, nothing
+        task = get!(_STATUS_INFLIGHT, key) do
+            Threads.@spawn begin
+                status = nothing
+                try
+                    status = probe()
+                finally
+                    # Cache the result and retire the in-flight entry together, so no
+                    # caller can see neither and start a second probe
+                    lock(_STATUS_CACHE.lock) do
+                        if status !== nothing && get(status, "status", "") == "ok"
+                            cache_put!(_STATUS_CACHE, key, status)
+                        end
+                        delete!(_STATUS_INFLIGHT, key)
+                    end
+                end
+                status
+            end
+        end
+        nothing, task
+    end
+    hit !== nothing && return hit
+    # Surface the probe's own error rather than the TaskFailedException wrapping it
+    return try
+        fetch(task)
+    catch e
+        e isa TaskFailedException ? throw(e.task.exception) : rethrow()
+    end
+end
+
 """
     get_provider_status(llm::AbstractLLMIntegration, cfg::Dict)::Dict{String, Any}
 
@@ -628,20 +864,26 @@ function get_provider_status(llm::OpenAILLMIntegration, cfg::Dict)::Dict{String,
         return Dict("provider" => provider_name, "status" => "misconfigured", "message" => "OpenAI API key not found.")
     end
 
+    if LLM_SKIP_HEALTHCHECK
+        return Dict("provider" => provider_name, "status" => "configured", "message" => "OpenAI API key is present. Health check skipped (LLM_SKIP_HEALTHCHECK).")
+    end
+
     openai_api_base = get(cfg, "api_base", "https://api.openai.com/v1")
     models_endpoint = "$openai_api_base/models"
     headers = Dict("Authorization" => "Bearer $api_key")
 
-    try
-        response = HTTP.get(models_endpoint, headers; readtimeout=get(cfg, "status_check_timeout_seconds", 10))
-        if response.status == 200
-            # Optionally parse response.data to list some models or confirm structure
-            return Dict("provider" => provider_name, "status" => "ok", "message" => "Successfully connected and listed models.")
-        else
-            return Dict("provider" => provider_name, "status" => "error", "message" => "API request to list models failed with status $(response.status).", "details" => String(response.body))
+    return _cached_status(models_endpoint) do
+        try
+            response = HTTP.get(models_endpoint, headers; readtimeout=get(cfg, "status_check_timeout_seconds", 10), pool=LLM_HTTP_POOL)
+            if response.status == 200
+                # Optionally parse response.data to list some models or confirm structure
+                Dict{String, Any}("provider" => provider_name, "status" => "ok", "message" => "Successfully connected and listed models.")
+            else
+                Dict{String, Any}("provider" => provider_name, "status" => "error", "message" => "API request to list models failed with status $(response.status).", "details" => String(response.body))
+            end
+        catch e
+            Dict{String, Any}("provider" => provider_name, "status" => "error", "message" => "Exception during OpenAI status check: $(string(e))")
         end
-    catch e
-        return Dict("provider" => provider_name, "status" => "error", "message" => "Exception during OpenAI status check: $(string(e))")
     end
 end
 
@@ -667,16 +909,21 @@ function get_provider_status(llm::LlamaLLMIntegration, cfg::Dict)::Dict{String,
     # This is highly dependent on the specific Llama hosting.
     # For now, if endpoint_url is set, consider it "configured".
     # A real check might try HTTP.request("HEAD", endpoint_url) or similar.
-    try
-        # Attempt a HEAD request as a basic connectivity check
-        response = HTTP.request("HEAD", endpoint_url; readtimeout=get(cfg, "status_check_timeout_seconds", 10))
-        if response.status >= 200 && response.status < 400 # Broad success range
-            return Dict("provider" => provider_name, "status" => "ok", "endpoint" => endpoint_url, "message" => "Endpoint reachable (HEAD request successful with status $(response.status)).")
-        else
-            return Dict("provider" => provider_name, "status" => "error", "endpoint" => endpoint_url, "message" => "Endpoint check (HEAD request) failed with status $(response.status).")
+    if LLM_SKIP_HEALTHCHECK
+        return Dict("provider" => provider_name, "status" => "configured", "endpoint" => endpoint_url, "message" => "Health check skipped (LLM_SKIP_HEALTHCHECK).")
+    end
+    return _cached_status(endpoint_url) do
+        try
+            # Attempt a HEAD request as a basic connectivity check
+            response = HTTP.request("HEAD", endpoint_url; readtimeout=get(cfg, "status_check_timeout_seconds", 10), pool=LLM_HTTP_POOL)
+            if response.status >= 200 && response.status < 400 # Broad success range
+                Dict{String, Any}("provider" => provider_name, "status" => "ok", "endpoint" => endpoint_url, "message" => "Endpoint reachable (HEAD request successful with status $(response.status)).")
+            else
+                Dict{String, Any}("provider" => provider_name, "status" => "error", "endpoint" => endpoint_url, "message" => "Endpoint check (HEAD request) failed with status $(response.status).")
+            end
+        catch e
+            Dict{String, Any}("provider" => provider_name, "status" => "error", "endpoint" => endpoint_url, "message" => "Exception during Llama endpoint status check: $(string(e))")
         end
-    catch e
-        return Dict("provider" => provider_name, "status" => "error", "endpoint" => endpoint_url, "message" => "Exception during Llama endpoint status check: $(string(e))")
     end
 end
 
@@ -732,6 +979,30 @@ end
 # DETECTIVE-SPECIFIC LLM FUNCTIONS
 # ----------------------------------------------------------------------
 
+"""
+    model_for_tier(tier::String) -> String
+
+Concrete model id for a task tier. "heavy" is used for wallet analysis and full
+reports; "light" for short pattern commentary and quick scans. Each tier can be
+overridden with `detective.ai_analysis.models.<tier>` or `LLM_MODEL_<TIER>`.
+"""
+function model_for_tier(tier::String)
+    default = tier == "light" ? get(ENV, "LLM_MODEL_LIGHT", "gpt-4o-mini") :
+                                get(ENV, "LLM_MODEL_HEAVY", get_config("detective.ai_analysis.model", "gpt-4"))
+    return get_config("detective.ai_analysis.models.$tier", default)
+end
+
+# Output ceilings per task, sized to what each reply actually needs (a JSON verdict,
+# a sectioned report, a few paragraphs of commentary). LLM_OUTPUT_STYLE=concise
+# halves them. Replies that hit the ceiling are logged by the provider `chat`.
+const MAX_OUTPUT_TOKENS = Dict("analysis" => 1200, "report" => 2500, "insights" => 700)
+const LLM_OUTPUT_STYLE = lowercase(get(ENV, "LLM_OUTPUT_STYLE", "standard"))
+
+function max_output_tokens(task::String)
+    ceiling = MAX_OUTPUT_TOKENS[task]
+    return LLM_OUTPUT_STYLE == "concise" ? ceiling ÷ 2 : ceiling
+end
+
 const DETECTIVE_PERSONALITIES = Dict(
     "poirot" => "You are Hercule Poirot, the meticulous Belgian detective. Approach this blockchain analysis with your characteristic attention to detail, logical methodology, and systematic reasoning. Focus on methodical patterns and financial inconsistencies.",
 
@@ -748,146 +1019,334 @@ const DETECTIVE_PERSONALITIES = Dict(
     "raven" => "You are The Raven, analyzing the dark psychology behind blockchain activities. Focus on behavioral patterns, psychological motivations, and dark intentions behind transactions."
 )
 
+const DETECTIVE_ANALYSIS_REQUIREMENTS = """
+Analyze the blockchain data in your own methodology. risk_score 0=safe..1=highly suspicious; confidence 0..1.
+Reply with JSON only:
+{"risk_score":0.0,"confidence":0.0,"risk_level":"LOW|MEDIUM|HIGH|CRITICAL","key_findings":[],"suspicious_patterns":[],"behavioral_analysis":"transaction behavior+timing","detective_insights":"","recommendations":["next investigative steps"],"summary":""}
 """
-    create_detective_prompt(detective_type::String, wallet_data::Dict{String, Any}, investigation_type::String="standard") -> String
 
-Creates a detective-specific prompt for LLM analysis of blockchain data.
+# Built once at load time so every call sends a byte-identical system prompt
+const DETECTIVE_SYSTEM_PROMPTS = Dict(
+    detective => personality * "\n\n" * DETECTIVE_ANALYSIS_REQUIREMENTS
+    for (detective, personality) in DETECTIVE_PERSONALITIES
+)
+
+const ANALYSIS_DEPTH_HINTS = Dict(
+    "quick" => "Provide a rapid analysis focusing on immediate red flags. Keep response concise.",
+    "deep" => "Conduct a thorough, detailed analysis. Examine all patterns and provide comprehensive insights.",
+    "standard" => "Provide a balanced analysis with key findings and actionable insights."
+)
+
 """
-function create_detective_prompt(detective_type::String, wallet_data::Dict{String, Any}, investigation_type::String="standard")
-    personality = get(DETECTIVE_PERSONALITIES, detective_type, DETECTIVE_PERSONALITIES["poirot"])
+    create_detective_system_prompt(detective_type::String) -> String
 
-    analysis_depth = if investigation_type == "quick"
-        "Provide a rapid analysis focusing on immediate red flags. Keep response concise."
-    elseif investigation_type == "deep"
-        "Conduct a thorough, detailed analysis. Examine all patterns and provide comprehensive insights."
-    else
-        "Provide a balanced analysis with key findings and actionable insights."
-    end
+Static part of a detective analysis prompt: personality plus the analysis
+requirements. It does not depend on the wallet, so it is sent as the system
+prompt where providers can serve it from their prompt cache.
+"""
+function create_detective_system_prompt(detective_type::String)
+    return get(DETECTIVE_SYSTEM_PROMPTS, detective_type, DETECTIVE_SYSTEM_PROMPTS["poirot"])
+end
 
-    formatted_data = format_investigation_for_llm(wallet_data)
+"""
+    create_detective_user_prompt(wallet_data::Dict{String, Any}, investigation_type::String="standard") -> String
 
-    prompt = """
-$personality
+Per-wallet part of a detective analysis prompt: analysis depth and the formatted investigation data.
+"""
+function create_detective_user_prompt(wallet_data::Dict{String, Any}, investigation_type::String="standard")
+    analysis_depth = get(ANALYSIS_DEPTH_HINTS, investigation_type, ANALYSIS_DEPTH_HINTS["standard"])
+    # Assemble the whole prompt in one buffer; the formatted data is written in place
+    io = IOBuffer()
+    print(io, analysis_depth, "\n\nBLOCKCHAIN INVESTIGATION DATA:\n")
+    format_investigation_for_llm(io, wallet_data)
+    print(io, '\n')
+    return String(take!(io))
+end
 
-$analysis_depth
-
-BLOCKCHAIN INVESTIGATION DATA:
-$formatted_data
-
-ANALYSIS REQUIREMENTS:
-Please analyze this blockchain data and provide:
-
-1. **Risk Assessment**: Assign a risk score from 0.0 (safe) to 1.0 (highly suspicious)
-2. **Key Findings**: List the most important discoveries
-3. **Suspicious Patterns**: Identify specific patterns that raise concerns
-4. **Behavioral Analysis**: Analyze transaction behaviors and timing
-5. **Recommendations**: Suggest next investigative steps
-6. **Confidence Level**: Rate your confidence in this analysis (0.0-1.0)
-
-**Detective Focus**: Apply your unique investigative methodology and provide insights that reflect your specialized approach to pattern recognition.
-
-Please structure your response as JSON:
-{
-    "risk_score": 0.0-1.0,
-    "confidence": 0.0-1.0,
-    "risk_level": "LOW|MEDIUM|HIGH|CRITICAL",
-    "key_findings": ["finding1", "finding2"],
-    "suspicious_patterns": ["pattern1", "pattern2"],
-    "behavioral_analysis": "description of transaction behavior",
-    "detective_insights": "your specialized observations",
-    "recommendations": ["action1", "action2"],
-    "summary": "brief overall assessment"
-}
 """
+    create_detective_prompt(detective_type::String, wallet_data::Dict{String, Any}, investigation_type::String="standard") -> String
 
-    return prompt
+Creates a detective-specific prompt for LLM analysis of blockchain data, for callers
+that send a single message: the system part followed by the per-wallet part.
+"""
+function create_detective_prompt(detective_type::String, wallet_data::Dict{String, Any}, investigation_type::String="standard")
+    return cacheable_prompt(create_detective_system_prompt(detective_type), create_detective_user_prompt(wallet_data, investigation_type))
 end
 
 """
     format_investigation_for_llm(wallet_data::Dict{String, Any}) -> String
+    format_investigation_for_llm(io::IO, wallet_data::Dict{String, Any})
 
-Formats wallet investigation data for LLM analysis.
+Formats wallet investigation data for LLM analysis. The `io` method streams the
+sections straight into a caller's buffer instead of re-concatenating a growing String.
 """
-function format_investigation_for_llm(wallet_data::Dict{String, Any})
-    formatted = "WALLET INVESTIGATION SUMMARY:\n"
+format_investigation_for_llm(wallet_data::Dict{String, Any}) = sprint(format_investigation_for_llm, wallet_data)
+
+function format_investigation_for_llm(io::IO, wallet_data::Dict{String, Any})
+    print(io, "WALLET INVESTIGATION SUMMARY:\n")
 
     # Basic wallet info
     if haskey(wallet_data, "address")
-        formatted *= "Wallet Address: $(wallet_data["address"])\n"
+        print(io, "Wallet Address: ", wallet_data["address"], '\n')
     end
 
     if haskey(wallet_data, "balance")
-        formatted *= "Current Balance: $(wallet_data["balance"])\n"
+        print(io, "Current Balance: ", wallet_data["balance"], '\n')
     end
 
     # Transaction analysis
     if haskey(wallet_data, "transactions") && !isempty(wallet_data["transactions"])
         transactions = wallet_data["transactions"]
-        formatted *= "\nTRANSACTION ANALYSIS:\n"
-        formatted *= "Total Transactions: $(length(transactions))\n"
-
-        # Recent activity
-        formatted *= "\nRECENT TRANSACTIONS (last 5):\n"
-        recent = transactions[1:min(5, length(transactions))]
-        for (i, tx) in enumerate(recent)
-            amount = get(tx, "amount", "unknown")
-            type_str = get(tx, "type", "transfer")
-            timestamp = get(tx, "timestamp", "unknown")
-            formatted *= "  $i. [$timestamp] $type_str: $amount\n"
+        print(io, "\nTRANSACTION ANALYSIS:\n")
+        print(io, "Total Transactions: ", length(transactions), '\n')
+
+        # Recent activity: similar transactions collapsed into one counted line each,
+        # emitted until the token budget is spent
+        groups = _group_recent_transactions(transactions)
+        print(io, "\nRECENT TRANSACTIONS (grouped, latest ", min(PROMPT_TX_WINDOW, length(transactions)), "):\n")
+        budget = PROMPT_TX_TOKEN_BUDGET * PROMPT_CHARS_PER_TOKEN
+        for (i, g) in enumerate(groups)
+            line = string("  ", g.count, "× ", g.type, ": ", g.amount, " [", g.first_seen,
+                          g.count > 1 ? string(" .. ", g.last_seen) : "", "]\n")
+            budget -= ncodeunits(line)
+            if budget < 0
+                print(io, "  … ", length(groups) - i + 1, " more groups omitted\n")
+                break
+            end
+            print(io, line)
+        end
+
+        stats = transaction_amount_stats(transactions)
+        if stats.count > 0
+            print(io, "\nAMOUNT STATISTICS (", stats.count, " numeric):\n")
+            print(io, "Mean: ", round(stats.mean, digits=4), " | Std Dev: ", round(stats.std, digits=4),
+                  " | Whole-number amounts: ", round(100 * stats.round_ratio, digits=1), "%\n")
+            stats.gap_std_s > 0 && print(io, "Inter-arrival Std Dev: ", round(stats.gap_std_s, digits=1), "s\n")
         end
 
         # Pattern indicators
         if haskey(wallet_data, "patterns")
-            formatted *= "\nDETECTED PATTERNS:\n"
+            print(io, "\nDETECTED PATTERNS:\n")
             for pattern in wallet_data["patterns"]
-                formatted *= "- $pattern\n"
+                print(io, "- ", pattern, '\n')
             end
         end
     end
 
     # Risk indicators
     if haskey(wallet_data, "risk_indicators")
-        formatted *= "\nRISK INDICATORS:\n"
+        print(io, "\nRISK INDICATORS:\n")
         for indicator in wallet_data["risk_indicators"]
-            formatted *= "- $indicator\n"
+            print(io, "- ", indicator, '\n')
         end
     end
 
     # Connected addresses
     if haskey(wallet_data, "connected_addresses") && !isempty(wallet_data["connected_addresses"])
-        formatted *= "\nCONNECTED ADDRESSES:\n"
-        for addr in wallet_data["connected_addresses"][1:min(5, length(wallet_data["connected_addresses"]))]
-            formatted *= "- $addr\n"
+        addresses = wallet_data["connected_addresses"]
+        print(io, "\nCONNECTED ADDRESSES:\n")
+        for addr in @view addresses[1:min(5, length(addresses))]
+            print(io, "- ", addr, '\n')
+        end
+    end
+
+    return nothing
+end
+
+# Recent-transaction block of the wallet prompt: how many transactions are scanned, and
+# the rough token budget (about 4 bytes per token) their grouped lines may take
+const PROMPT_TX_WINDOW = try parse(Int, get(ENV, "PROMPT_TX_WINDOW", "50")) catch; 50 end
+const PROMPT_TX_TOKEN_BUDGET = try parse(Int, get(ENV, "PROMPT_TX_TOKEN_BUDGET", "400")) catch; 400 end
+const PROMPT_CHARS_PER_TOKEN = 4
+
+"""
+    _group_recent_transactions(transactions) -> Vector{NamedTuple}
+
+Groups the latest `PROMPT_TX_WINDOW` transactions by type and amount rounded to two
+significant digits, in order of first appearance, with a count and the first/last
+timestamp of each group. Wallets with many repeated transfers collapse to a few lines.
+"""
+function _group_recent_transactions(transactions)
+    index = Dict{Tuple{Any, Any}, Int}()
+    groups = NamedTuple{(:type, :amount, :count, :first_seen, :last_seen), Tuple{Any, Any, Int, Any, Any}}[]
+    for tx in Iterators.take(transactions, PROMPT_TX_WINDOW)
+        amount = get(tx, "amount", "unknown")
+        amount = amount isa Real ? round(amount, sigdigits=2) : amount
+        type_str = get(tx, "type", "transfer")
+        timestamp = get(tx, "timestamp", "unknown")
+        i = get(index, (type_str, amount), 0)
+        if i == 0
+            push!(groups, (type=type_str, amount=amount, count=1, first_seen=timestamp, last_seen=timestamp))
+            index[(type_str, amount)] = length(groups)
+        else
+            g = groups[i]
+            groups[i] = (type=g.type, amount=g.amount, count=g.count + 1, first_seen=g.first_seen, last_seen=timestamp)
+        end
+    end
+    return groups
+end
+
+"""
+    transaction_amount_stats(transactions) -> NamedTuple
+
+One pass over the numeric `amount` and `timestamp` fields: mean and standard deviation
+of the amounts, share of whole-number amounts, and standard deviation of the gaps
+between consecutive timestamps in seconds. Non-numeric values are skipped.
+"""
+function transaction_amount_stats(transactions)
+    n, mean, m2, whole = 0, 0.0, 0.0, 0
+    gn, gmean, gm2 = 0, 0.0, 0.0
+    prev = nothing
+    for tx in transactions
+        a = get(tx, "amount", nothing)
+        if a isa Real
+            n += 1
+            d = a - mean
+            mean += d / n
+            m2 += d * (a - mean)
+            whole += isinteger(a)
+        end
+        t = get(tx, "timestamp", nothing)
+        if t isa Real
+            if prev !== nothing
+                g = abs(t - prev)
+                gn += 1
+                d = g - gmean
+                gmean += d / gn
+                gm2 += d * (g - gmean)
+            end
+            prev = t
         end
     end
+    return (count=n, mean=mean, std=(n > 1 ? sqrt(m2 / (n - 1)) : 0.0),
+            round_ratio=(n > 0 ? whole / n : 0.0), gap_std_s=(gn > 1 ? sqrt(gm2 / (gn - 1)) : 0.0))
+end
 
-    return formatted
+"""
+    parse_llm_json(text::AbstractString)
+    parse_llm_json(text::AbstractString, ::Type{T})
+
+Parses a JSON object out of an LLM reply in one pass. Models without a JSON mode
+often wrap the object in a ```json fence or add a sentence around it; only the
+outermost `{...}` span is handed to JSON3, so those replies no longer fall
+through to the text fallback. With a type, JSON3 materializes straight into `T`
+(e.g. `Dict{String, Any}`) instead of building a lazy object to copy afterwards.
+"""
+function parse_llm_json(text::AbstractString, T::Type...)
+    first_brace = findfirst('{', text)
+    last_brace = findlast('}', text)
+    if first_brace === nothing || last_brace === nothing || last_brace < first_brace
+        return JSON3.read(text, T...)  # let JSON3 report the error
+    end
+    return JSON3.read(SubString(text, first_brace, last_brace), T...)
 end
 
+# Risk labels models actually return, lowercased, mapped onto the four levels the rest of
+# the pipeline compares against; built once at load
+const LLM_RISK_LEVELS = Dict(
+    "none" => "LOW", "minimal" => "LOW", "low" => "LOW",
+    "medium" => "MEDIUM", "moderate" => "MEDIUM",
+    "elevated" => "HIGH", "high" => "HIGH",
+    "severe" => "CRITICAL", "critical" => "CRITICAL", "extreme" => "CRITICAL"
+)
+
+"""
+    normalize_risk_level(level) -> String
+
+Case-insensitive lookup of an LLM risk label ("Moderate", "high ", ...) into
+LOW/MEDIUM/HIGH/CRITICAL; unknown labels fall back to MEDIUM.
+"""
+normalize_risk_level(level) = get(LLM_RISK_LEVELS, lowercase(strip(string(level))), "MEDIUM")
+
+# Stream detective analyses and parse the JSON as soon as it closes instead of waiting
+# for the complete response
+const LLM_STREAM_ANALYSIS = lowercase(get(ENV, "LLM_STREAM_ANALYSIS", "false")) == "true"
+
+# Completed analyses keyed by a hash of the call inputs (provider, detective, depth, model,
+# wallet data, patterns), so a hit returns before any prompt is built. Wallets that
+# are re-investigated within the TTL (swarm re-runs, repeated API calls) skip the LLM.
+const ANALYSIS_CACHE_TTL_S = try parse(Float64, get(ENV, "LLM_ANALYSIS_CACHE_TTL_S", "3600")) catch; 3600.0 end
+const ANALYSIS_CACHE_MAX = try parse(Int, get(ENV, "LLM_ANALYSIS_CACHE_MAX", "1024")) catch; 1024 end
+# Balances are keyed at this many significant digits, so dust movements between two
+# looks at the same wallet still hit
+const ANALYSIS_CACHE_BALANCE_DIGITS = try parse(Int, get(ENV, "LLM_ANALYSIS_CACHE_BALANCE_DIGITS", "3")) catch; 3 end
+const _ANALYSIS_CACHE = TTLCache{UInt64, Dict{String, Any}}(ANALYSIS_CACHE_TTL_S, ANALYSIS_CACHE_MAX)
+
+_cache_balance(b::Real) = round(Float64(b); sigdigits=ANALYSIS_CACHE_BALANCE_DIGITS)
+_cache_balance(b) = b
+
+# The parts of wallet_data that format_investigation_for_llm actually reads. Hashing this
+# view instead of the whole Dict ignores fields the model never sees (full tx history,
+# ids, timestamps of the fetch) and avoids hashing every transaction.
+function _analysis_cache_view(wallet_data::Dict{String, Any})
+    txs = get(wallet_data, "transactions", ())
+    addrs = get(wallet_data, "connected_addresses", ())
+    return (
+        get(wallet_data, "address", nothing),
+        _cache_balance(get(wallet_data, "balance", nothing)),
+        length(txs),
+        _group_recent_transactions(txs),
+        isempty(txs) ? nothing : transaction_amount_stats(txs),
+        isempty(txs) ? nothing : get(wallet_data, "patterns", nothing),
+        get(wallet_data, "risk_indicators", nothing),
+        collect(Iterators.take(addrs, 5))
+    )
+end
+
+function _analysis_cache_get(key::UInt64)
+    hit = cache_get(_ANALYSIS_CACHE, key)
+    hit === nothing && return nothing
+    # Shallow copy so callers can annotate the result without touching the cached entry
+    return merge(hit, Dict{String, Any}("cache_hit" => true))
+end
+
+"""
+    analysis_cache_stats() -> Dict{String, Any}
+
+Hit/miss counters, hit rate and current size of the detective analysis cache.
+"""
+analysis_cache_stats() = cache_stats(_ANALYSIS_CACHE)
+
 """
     analyze_wallet_with_llm(llm::AbstractLLMIntegration, wallet_data::Dict{String, Any}, detective_type::String="poirot", investigation_type::String="standard") -> Dict{String, Any}
 
 Analyzes wallet data using LLM with detective-specific approach.
 """
 function analyze_wallet_with_llm(llm::AbstractLLMIntegration, wallet_data::Dict{String, Any}, detective_type::String="poirot", investigation_type::String="standard")
-    # Create detective-specific prompt
-    prompt = create_detective_prompt(detective_type, wallet_data, investigation_type)
+    model = model_for_tier(investigation_type == "quick" ? "light" : "heavy")
+
+    # Same provider, detective, depth, model and data means the same question: reuse the
+    # answer. The key only needs the inputs, so hits never format the prompt.
+    cache_key = hash((typeof(llm), detective_type, investigation_type, model, _analysis_cache_view(wallet_data)))
+    cached = _analysis_cache_get(cache_key)
+    cached !== nothing && return cached
+
+    # Create detective-specific prompt: static system prompt first, wallet data last
+    prompt = create_detective_user_prompt(wallet_data, investigation_type)
 
     # Configure LLM for analysis
     llm_config = Dict{String, Any}(
-        "model" => get_config("detective.ai_analysis.model", "gpt-4"),
+        "model" => model,
         "temperature" => get_config("detective.ai_analysis.temperature", 0.1),
-        "max_tokens" => get_config("detective.ai_analysis.max_tokens", 4000)
+        "max_tokens" => get_config("detective.ai_analysis.max_tokens", max_output_tokens("analysis")),
+        "system_prompt" => create_detective_system_prompt(detective_type),
+        "cache_system_prompt" => true,
+        "response_format" => "json"
     )
 
     try
         # Get LLM response
-        response = chat(llm, prompt, cfg=llm_config)
+        response = LLM_STREAM_ANALYSIS ? chat_first_json(llm, prompt; cfg=llm_config) : chat(llm, prompt, cfg=llm_config)
 
         # Try to parse JSON response
+        parsed = true
         analysis_result = try
-            JSON3.read(response)
+            # Parsed straight into an owned Dict so the risk label can be normalized in place
+            obj = parse_llm_json(response, Dict{String, Any})
+            obj["risk_level"] = normalize_risk_level(get(obj, "risk_level", "MEDIUM"))
+            obj
         catch json_error
+            parsed = false
             @warn "Failed to parse LLM response as JSON: $json_error"
             # Fallback to text analysis
             Dict{String, Any}(
@@ -914,6 +1373,7 @@ function analyze_wallet_with_llm(llm::AbstractLLMIntegration, wallet_data::Dict{
         )
 
         @debug "LLM analysis completed for wallet $(get(wallet_data, "address", "unknown"))"
+        parsed && cache_put!(_ANALYSIS_CACHE, cache_key, result)
         return result
 
     catch e
@@ -931,22 +1391,33 @@ function analyze_wallet_with_llm(llm::AbstractLLMIntegration, wallet_data::Dict{
 end
 
 """
-    generate_investigation_report(llm::AbstractLLMIntegration, investigation::InvestigationTask, memory::DetectiveMemory) -> Dict{String, Any}
+    generate_investigation_report(llm::AbstractLLMIntegration, investigation::InvestigationTask, memory::DetectiveMemory; on_chunk=nothing) -> Dict{String, Any}
 
 Generates a comprehensive investigation report using LLM.
+When `on_chunk` is given, the report is streamed and `on_chunk(text)` is called for
+each piece as it arrives; the returned dict still carries the full report.
 """
-function generate_investigation_report(llm::AbstractLLMIntegration, investigation::InvestigationTask, memory::DetectiveMemory)
+function generate_investigation_report(llm::AbstractLLMIntegration, investigation::InvestigationTask, memory::DetectiveMemory; on_chunk::Union{Function, Nothing}=nothing)
     # Create comprehensive report prompt
     prompt = create_report_prompt(investigation, memory)
 
     llm_config = Dict{String, Any}(
-        "model" => get_config("detective.ai_analysis.model", "gpt-4"),
+        "model" => model_for_tier("heavy"),
         "temperature" => 0.2,  # Slightly higher for report generation
-        "max_tokens" => 6000   # More tokens for comprehensive reports
+        "max_tokens" => max_output_tokens("report")
     )
 
     try
-        response = chat(llm, prompt, cfg=llm_config)
+        response = if on_chunk === nothing
+            chat(llm, prompt, cfg=llm_config)
+        else
+            buf = IOBuffer()
+            for chunk in chat_stream(llm, prompt; cfg=llm_config)
+                on_chunk(chunk)
+                print(buf, chunk)
+            end
+            String(take!(buf))
+        end
 
         return Dict{String, Any}(
             "report" => response,
@@ -966,35 +1437,49 @@ function generate_investigation_report(llm::AbstractLLMIntegration, investigatio
     end
 end
 
+const PATTERN_INSIGHTS_INSTRUCTIONS = """
+I've identified blockchain patterns during an investigation (listed below).
+
+Based on your detective expertise, please provide insights on:
+1. What do these patterns suggest about the wallet's purpose?
+2. Which patterns are most concerning and why?
+3. What additional investigation angles would you pursue?
+4. How do these patterns fit together in your analysis?
+
+Provide your response in your characteristic investigative style, focusing on actionable insights.
+"""
+
 """
     get_detective_insights(llm::AbstractLLMIntegration, patterns::Vector{String}, detective_type::String="poirot") -> Dict{String, Any}
 
 Gets detective insights on specific patterns using LLM.
 """
 function get_detective_insights(llm::AbstractLLMIntegration, patterns::Vector{String}, detective_type::String="poirot")
+    # Nothing detected means nothing to interpret: answer without a round trip
+    if isempty(patterns)
+        return Dict{String, Any}(
+            "insights" => "No suspicious patterns were detected, so there is nothing to interpret.",
+            "detective_type" => detective_type,
+            "patterns_analyzed" => patterns,
+            "success" => true,
+            "skipped" => "no_patterns",
+            "timestamp" => string(now())
+        )
+    end
     personality = get(DETECTIVE_PERSONALITIES, detective_type, DETECTIVE_PERSONALITIES["poirot"])
 
     prompt = """
 $personality
 
-I've identified the following blockchain patterns during an investigation:
-
+$PATTERN_INSIGHTS_INSTRUCTIONS
 DETECTED PATTERNS:
 $(join(patterns, "\n- "))
-
-Based on your detective expertise, please provide insights on:
-1. What do these patterns suggest about the wallet's purpose?
-2. Which patterns are most concerning and why?
-3. What additional investigation angles would you pursue?
-4. How do these patterns fit together in your analysis?
-
-Provide your response in your characteristic investigative style, focusing on actionable insights.
 """
 
     llm_config = Dict{String, Any}(
-        "model" => get_config("detective.ai_analysis.model", "gpt-4"),
+        "model" => model_for_tier("light"),
         "temperature" => 0.3,
-        "max_tokens" => 2000
+        "max_tokens" => max_output_tokens("insights")
     )
 
     try
@@ -1016,6 +1501,72 @@ Provide your response in your characteristic investigative style, focusing on ac
 end
 
 # Helper functions
+
+# Cap nested lists (transactions, samples, linked addresses...) before serializing
+# results into a prompt; the first few items carry the signal, the rest is token bulk.
+const PROMPT_MAX_LIST_ITEMS = 5
+# Opaque tokens (signatures, hashes, encoded blobs) longer than this keep only head and
+# tail; addresses (<= 44 chars) and prose with spaces pass through untouched
+const PROMPT_MAX_TOKEN_CHARS = 64
+
+_prompt_empty(v) = v === nothing || (v isa Union{AbstractString, AbstractVector, AbstractDict} && isempty(v))
+
+_trim_for_prompt(x) = x
+_trim_for_prompt(x::AbstractString) =
+    length(x) > PROMPT_MAX_TOKEN_CHARS && !any(isspace, x) ? first(x, 8) * "…" * last(x, 8) : x
+_trim_for_prompt(x::AbstractVector) = [_trim_for_prompt(v) for v in Iterators.take(x, PROMPT_MAX_LIST_ITEMS)]
+# Null and empty fields carry no signal but still cost key tokens
+_trim_for_prompt(x::AbstractDict) = Dict(k => _trim_for_prompt(v) for (k, v) in x if !_prompt_empty(v))
+
+# Hard ceiling on serialized results embedded in a prompt, after list trimming
+const PROMPT_MAX_RESULT_CHARS = try parse(Int, get(ENV, "PROMPT_MAX_RESULT_CHARS", "16000")) catch; 16000 end
+
+function _prompt_json(x)
+    s = sprint(_write_canonical_json, _trim_for_prompt(x))
+    ncodeunits(s) > PROMPT_MAX_RESULT_CHARS && length(s) > PROMPT_MAX_RESULT_CHARS || return s
+    return first(s, PROMPT_MAX_RESULT_CHARS) * "...[truncated]"
+end
+
+# Compact JSON with sorted keys: identical data always yields identical prompt bytes,
+# which keeps provider prompt caches hitting regardless of Dict insertion order.
+function _write_canonical_json(io::IO, x)
+    if x isa AbstractDict
+        print(io, '{')
+        for (i, k) in enumerate(sort!(collect(keys(x)); by=string))
+            i > 1 && print(io, ',')
+            JSON3.write(io, string(k)); print(io, ':')
+            _write_canonical_json(io, x[k])
+        end
+        print(io, '}')
+    elseif x isa AbstractVector || x isa Tuple
+        print(io, '[')
+        for (i, v) in enumerate(x)
+            i > 1 && print(io, ',')
+            _write_canonical_json(io, v)
+        end
+        print(io, ']')
+    else
+        JSON3.write(io, x; allow_inf=true)
+    end
+end
+
+const REPORT_INSTRUCTIONS = """
+Generate a comprehensive investigation report for the case described below.
+
+The report must include:
+
+1. **EXECUTIVE SUMMARY**
+2. **INVESTIGATION OVERVIEW**
+3. **KEY FINDINGS**
+4. **DETAILED ANALYSIS**
+5. **RISK ASSESSMENT**
+6. **PATTERNS IDENTIFIED**
+7. **RECOMMENDATIONS**
+8. **CONCLUSION**
+
+Write this report in your characteristic detective style, suitable for stakeholders and potential legal proceedings.
+"""
+
 function create_report_prompt(investigation::InvestigationTask, memory::DetectiveMemory)
     detective_type = get(investigation.parameters, "detective_type", "unknown")
     personality = get(DETECTIVE_PERSONALITIES, detective_type, "You are an experienced blockchain detective.")
@@ -1023,7 +1574,7 @@ function create_report_prompt(investigation::InvestigationTask, memory::Detectiv
     return """
 $personality
 
-Generate a comprehensive investigation report for the following case:
+$REPORT_INSTRUCTIONS
 
 INVESTIGATION DETAILS:
 - Investigation ID: $(investigation.id)
@@ -1033,24 +1584,11 @@ INVESTIGATION DETAILS:
 - Duration: $(investigation.completed_at !== nothing ? investigation.completed_at - investigation.created_at : "Ongoing")
 
 INVESTIGATION RESULTS:
-$(JSON3.write(investigation.result, allow_inf=true))
+$(_prompt_json(investigation.result))
 
 DETECTIVE MEMORY CONTEXT:
 - Total Previous Investigations: $(length(memory.investigation_history))
 - Patterns in Cache: $(length(memory.pattern_cache))
-
-Please create a professional investigation report that includes:
-
-1. **EXECUTIVE SUMMARY**
-2. **INVESTIGATION OVERVIEW**
-3. **KEY FINDINGS**
-4. **DETAILED ANALYSIS**
-5. **RISK ASSESSMENT**
-6. **PATTERNS IDENTIFIED**
-7. **RECOMMENDATIONS**
-8. **CONCLUSION**
-
-Write this report in your characteristic detective style, suitable for stakeholders and potential legal proceedings.
 """
 end
 
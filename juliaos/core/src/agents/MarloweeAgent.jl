@@ -80,7 +80,7 @@ Conducts deep multi-layered analysis using real blockchain data.
 Marlowe's approach: narrative-driven investigation with complex pattern analysis.
 """
 function investigate_marlowee_style(wallet_address::String, investigation_id::String)
-    @info "🕵️‍♂️ Marlowe: Beginning deep analysis investigation for wallet: $wallet_address"
+    @info "🕵️‍♂️ Marlowe: Beginning deep analysis investigation" wallet=wallet_address
 
     # Validar o endereço da wallet ANTES de qualquer chamada RPC
     if !validate_solana_address(wallet_address)
@@ -229,9 +229,9 @@ function detect_corruption_patterns_marlowe(wallet_data::Dict)
     patterns = risk_assessment["patterns"]
 
     # Corruption indicators
-    systematic_corruption = filter(p -> occursin("systematic", lowercase(p)) || occursin("regular", lowercase(p)), patterns)
-    opportunistic_corruption = filter(p -> occursin("unusual", lowercase(p)) || occursin("suspicious", lowercase(p)), patterns)
-    structural_corruption = filter(p -> occursin("automated", lowercase(p)) || occursin("bot", lowercase(p)), patterns)
+    systematic_corruption = filter(p -> occursin(r"systematic|regular"i, p), patterns)
+    opportunistic_corruption = filter(p -> occursin(r"unusual|suspicious"i, p), patterns)
+    structural_corruption = filter(p -> occursin(r"automated|bot"i, p), patterns)
 
     # Corruption assessment
     corruption_level = if length(structural_corruption) > 0
@@ -261,8 +261,8 @@ function analyze_complex_patterns_marlowe(wallet_data::Dict)
     tx_count = tx_summary["total_transactions"]
 
     # Multi-dimensional analysis
-    temporal_complexity = any(p -> occursin("timing", lowercase(p)), patterns) ? "temporal_patterns_detected" : "simple_timing"
-    value_complexity = any(p -> occursin("value", lowercase(p)) || occursin("amount", lowercase(p)), patterns) ? "complex_value_patterns" : "standard_values"
+    temporal_complexity = any(p -> occursin(r"timing"i, p), patterns) ? "temporal_patterns_detected" : "simple_timing"
+    value_complexity = any(p -> occursin(r"value|amount"i, p), patterns) ? "complex_value_patterns" : "standard_values"
     frequency_complexity = tx_count > 500 ? "high_frequency_complex" : tx_count > 100 ? "moderate_complexity" : "simple_pattern"
 
     # Pattern interconnections
@@ -74,7 +74,7 @@ Conducts behavioral pattern analysis using real blockchain data.
 Marple's approach: intuitive pattern recognition and anomaly detection.
 """
 function investigate_marple_style(wallet_address::String, investigation_id::String)
-    @info "👵 Marple: Observing behavioral patterns for wallet: $wallet_address"
+    @info "👵 Marple: Observing behavioral patterns" wallet=wallet_address
 
     try
         # Configure analysis tool for pattern-focused investigation
@@ -166,9 +166,9 @@ function analyze_behavioral_patterns_marple(wallet_data::Dict)
     tx_count = tx_summary["total_transactions"]
 
     # Marple's behavioral categorization
-    automated_behavior = filter(p -> occursin("automated", lowercase(p)) || occursin("bot", lowercase(p)), patterns)
-    timing_behavior = filter(p -> occursin("timing", lowercase(p)) || occursin("hours", lowercase(p)), patterns)
-    value_behavior = filter(p -> occursin("value", lowercase(p)) || occursin("round", lowercase(p)), patterns)
+    automated_behavior = filter(p -> occursin(r"automated|bot"i, p), patterns)
+    timing_behavior = filter(p -> occursin(r"timing|hours"i, p), patterns)
+    value_behavior = filter(p -> occursin(r"value|round"i, p), patterns)
 
     # Behavioral consistency analysis
     behavior_consistency = length(patterns) == 0 ? "highly_consistent" :
@@ -189,8 +189,8 @@ function detect_anomalies_marple(wallet_data::Dict)
     patterns = risk_assessment["patterns"]
 
     # Anomaly severity classification
-    severe_anomalies = filter(p -> occursin("suspicious", lowercase(p)) || occursin("unusual", lowercase(p)), patterns)
-    moderate_anomalies = filter(p -> occursin("high", lowercase(p)) && !occursin("suspicious", lowercase(p)), patterns)
+    severe_anomalies = filter(p -> occursin(r"suspicious|unusual"i, p), patterns)
+    moderate_anomalies = filter(p -> occursin(r"high"i, p) && !occursin(r"suspicious"i, p), patterns)
     mild_anomalies = filter(p -> !(p in severe_anomalies) && !(p in moderate_anomalies), patterns)
 
     # Anomaly assessment
@@ -32,6 +32,9 @@ export PlanAndExecuteAgent, create_plan_execute_agent, run_plan_execute_agent,
 
 llm = LLMIntegration.OpenAILLMIntegration()  # or whichever integration you want
 
+# Stream planning replies and start step 1 while the rest of the plan is still generating
+const STREAM_PLANS = lowercase(get(ENV, "LLM_STREAM_PLANS", "false")) == "true"
+
 # ----------------------------------------------------------------------
 # CONSTANTS
 # ----------------------------------------------------------------------
@@ -252,6 +255,70 @@ function create_plan(agent::PlanAndExecuteAgent, input::String)::Plan
     return Plan(plan_id, input, steps)
 end
 
+"""
+    create_plan_streaming(agent::PlanAndExecuteAgent, input::String)
+
+Streaming variant of `create_plan`. As soon as the first numbered line inside the
+```plan block is complete, and only if it is numbered `1.`, `execute_step` is spawned
+for it, so the first tool call overlaps with the generation of the remaining steps.
+Step 1 only sees the original task as context, so starting it early does not change its
+input. The early task gets its own empty `Plan` so it never reads `plan.steps` while
+they are still being pushed. If the parsed plan still disagrees with the early step (a
+reply whose ```plan block never closes is parsed as a whole), that task is waited for
+and its result discarded before step 1 is run normally.
+
+# Returns
+- `(plan, first_step)` where `first_step` is the running Task for step 1, or `nothing`
+  when the reply had no ```plan block and nothing was started early
+"""
+function create_plan_streaming(agent::PlanAndExecuteAgent, input::String)
+    tools_str = format_tools_for_prompt(agent.tools)
+    prompt = replace(PLANNING_PROMPT, "{tools}" => tools_str, "{input}" => input)
+
+    plan = Plan("plan-$(randstring(8))", input, PlanStep[])
+    in_plan = false
+    first_step = nothing
+    early = nothing
+    seen_first = false
+    response = LLMIntegration.each_line(LLMIntegration.chat_stream(llm, prompt; cfg=agent.llm_config)) do line
+        if !in_plan
+            in_plan = occursin(r"```plan", line)
+            return
+        end
+        (!seen_first && !startswith(lstrip(line), "```")) || return
+        step_match = match(r"^\s*(\d+)\.(.*)", line)
+        step_match === nothing && return
+        seen_first = true
+        # Only a line numbered 1 is known to be step 1; otherwise run the plan normally
+        step_match.captures[1] == "1" || return
+        early = PlanStep("step-1-$(randstring(5))", strip(step_match.captures[2]))
+        running = PlanStep(early.id, early.description, :running, nothing)
+        snapshot = Plan(plan.id, plan.original_input, PlanStep[])
+        first_step = Threads.@spawn execute_step(agent, running, snapshot, initial_context(snapshot))
+    end
+
+    for (i, desc) in enumerate(parse_plan(response))
+        if i == 1 && early !== nothing && desc == early.description
+            push!(plan.steps, early)
+        else
+            push!(plan.steps, PlanStep("step-$(i)-$(randstring(5))", desc))
+        end
+    end
+    # The parsed plan disagrees with what was started early: let that run finish so it
+    # does not overlap the real step 1, drop its result and run step 1 normally
+    if early !== nothing && (isempty(plan.steps) || plan.steps[1] !== early)
+        @warn "Streamed first step does not match the parsed plan; discarding early result" early.description
+        try
+            wait(first_step)
+        catch
+        end
+        first_step = nothing
+    end
+    return plan, first_step
+end
+
+initial_context(plan::Plan) = "Original task: $(plan.original_input)\n\nExecution progress:\n"
+
 """
     execute_step(agent::PlanAndExecuteAgent, step::PlanStep, plan::Plan, context::String)::PlanStep
 
@@ -331,19 +398,20 @@ function execute_step(agent::PlanAndExecuteAgent, step::PlanStep, plan::Plan, co
 end
 
 """
-    execute_plan(agent::PlanAndExecuteAgent, plan::Plan)::Plan
+    execute_plan(agent::PlanAndExecuteAgent, plan::Plan; first_step=nothing)::Plan
 
 Executes each step in the plan sequentially.
 
 # Arguments
 - `agent::PlanAndExecuteAgent`: The agent to execute the plan with
 - `plan::Plan`: The plan to execute
+- `first_step`: Task already running step 1 (see `create_plan_streaming`), fetched instead of re-executing
 
 # Returns
 - Updated Plan with execution results
 """
-function execute_plan(agent::PlanAndExecuteAgent, plan::Plan)::Plan
-    context = "Original task: $(plan.original_input)\n\nExecution progress:\n"
+function execute_plan(agent::PlanAndExecuteAgent, plan::Plan; first_step::Union{Task,Nothing}=nothing)::Plan
+    context = initial_context(plan)
 
     for (i, step) in enumerate(plan.steps)
         @info "Executing step $(i)/$(length(plan.steps)): $(step.description)"
@@ -352,7 +420,16 @@ function execute_plan(agent::PlanAndExecuteAgent, plan::Plan)::Plan
         running_step = PlanStep(step.id, step.description, :running, step.result)
 
         # Execute the step (returns a new PlanStep with updated status/result)
-        updated_step = execute_step(agent, running_step, plan, context)
+        updated_step = if i == 1 && first_step !== nothing
+            # Surface the step's own error, as a direct execute_step call would
+            try
+                fetch(first_step)
+            catch e
+                throw(e isa TaskFailedException ? e.task.exception : e)
+            end
+        else
+            execute_step(agent, running_step, plan, context)
+        end
         plan.steps[i] = updated_step
 
         # Update context with this step's result
@@ -414,11 +491,11 @@ Runs the Plan-and-Execute agent on a user query or task.
 function run_plan_execute_agent(agent::PlanAndExecuteAgent, input::String)::Dict{String,Any}
     # Create the plan
     @info "Creating plan for input: $(input)"
-    plan = create_plan(agent, input)
+    plan, first_step = STREAM_PLANS ? create_plan_streaming(agent, input) : (create_plan(agent, input), nothing)
 
     # Execute the plan
     @info "Executing plan with $(length(plan.steps)) steps"
-    executed_plan = execute_plan(agent, plan)
+    executed_plan = execute_plan(agent, plan; first_step=first_step)
 
     # Analyze results
     all_completed = all(step.status == :completed for step in executed_plan.steps)
@@ -14,7 +14,7 @@ include("../tools/ghost_wallet_hunter/tool_check_blacklist.jl")
 include("../tools/ghost_wallet_hunter/tool_risk_assessment.jl")
 include("../tools/ghost_wallet_hunter/tool_detective_swarm.jl")
 
-export PoirotDetective, create_poirot_agent, investigate_poirot_style
+export PoirotDetective, create_poirot_agent, get_poirot, investigate_poirot_style
 
 # ==========================================
 # HERCULE POIROT DETECTIVE STRUCTURE
@@ -67,6 +67,28 @@ function create_poirot_agent()
     return PoirotDetective()
 end
 
+# PoirotDetective is immutable and investigations carry no per-agent state,
+# so one warm instance can be shared by every caller (and every thread).
+const _SHARED_POIROT = Ref{Union{Nothing,PoirotDetective}}(nothing)
+const _SHARED_POIROT_LOCK = ReentrantLock()
+
+"""
+    get_poirot() -> PoirotDetective
+
+Returns the process-wide Poirot instance, creating it on first use.
+Prefer this over `create_poirot_agent()` when a fresh agent id is not needed.
+"""
+function get_poirot()
+    agent = _SHARED_POIROT[]
+    agent !== nothing && return agent
+    lock(_SHARED_POIROT_LOCK) do
+        if _SHARED_POIROT[] === nothing
+            _SHARED_POIROT[] = PoirotDetective()
+        end
+        return _SHARED_POIROT[]
+    end
+end
+
 """
     investigate_poirot_style(wallet_address::String, investigation_id::String) -> Dict
 
@@ -74,7 +96,7 @@ Conducts methodical transaction analysis using real blockchain data.
 Poirot's approach: systematic examination of every transaction detail.
 """
 function investigate_poirot_style(wallet_address::String, investigation_id::String)
-    @info "🧐 Poirot: Applying methodical analysis to wallet: $wallet_address"
+    @info "🧐 Poirot: Applying methodical analysis" wallet=wallet_address
 
     try
         # Configure analysis tool for deep methodical investigation
@@ -125,8 +147,9 @@ function investigate_poirot_style(wallet_address::String, investigation_id::Stri
         # Unified verdict & recommendations (use AI text if available)
         verdict = ""
         recommendations = String[]
-        if haskey(wallet_data, "ai_analysis") && !isempty(String(wallet_data["ai_analysis"])) && !startswith(String(wallet_data["ai_analysis"]), "AI error") && !startswith(String(wallet_data["ai_analysis"]), "AI analysis unavailable")
-            verdict = String(wallet_data["ai_analysis"]) # already layman-friendly
+        ai_text = String(get(wallet_data, "ai_analysis", ""))
+        if !isempty(ai_text) && !startswith(ai_text, "AI error") && !startswith(ai_text, "AI analysis unavailable")
+            verdict = ai_text # already layman-friendly
         else
             lvl = String(risk_assessment["risk_level"])
             bl = get(blacklist, "is_blacklisted", false) == true
@@ -200,7 +223,7 @@ function investigate_poirot_style(wallet_address::String, investigation_id::Stri
             # Keep pattern-based assessment as well for transparency
             "pattern_risk" => risk_assessment,
             "investigation_id" => investigation_id,
-            "timestamp" => Dates.format(now(UTC), dateformat"yyyy-mm-ddTHH:MM:SS.sssZ"),
+            "timestamp" => get(wallet_data, "timestamp") do; _utc_timestamp() end,
             "status" => "completed"
         )
 
@@ -225,9 +248,9 @@ function analyze_transaction_patterns_poirot(wallet_data::Dict)
     risk_assessment = wallet_data["risk_assessment"]
     patterns = risk_assessment["patterns"]
 
-    timing_patterns = filter(p -> occursin("timing", lowercase(p)), patterns)
-    value_patterns = filter(p -> occursin("value", lowercase(p)) || occursin("amount", lowercase(p)), patterns)
-    frequency_patterns = filter(p -> occursin("frequency", lowercase(p)) || occursin("automated", lowercase(p)), patterns)
+    timing_patterns = filter(p -> occursin(r"timing"i, p), patterns)
+    value_patterns = filter(p -> occursin(r"value|amount"i, p), patterns)
+    frequency_patterns = filter(p -> occursin(r"frequency|automated"i, p), patterns)
 
     return Dict(
         "timing_irregularities" => timing_patterns,
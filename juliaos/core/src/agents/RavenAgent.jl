@@ -20,6 +20,11 @@ export RavenDetective, create_raven_agent, investigate_raven_style
 # RAVEN DETECTIVE STRUCTURE
 # ==========================================
 
+# Profile tables are constant; every RavenDetective references the same copies.
+const RAVEN_SKILLS = ["dark_analytics", "ominous_pattern_detection", "gothic_investigation", "foreboding_analysis", "cryptic_interpretation"]
+const RAVEN_PERSONA = "Messenger of dark truths and ominous revelations. Specializes in detecting sinister patterns and uncovering the darkest secrets hidden in blockchain transactions."
+const RAVEN_CATCHPHRASE = "Nevermore shall evil transactions escape my vigilant gaze."
+
 struct RavenDetective
     id::String
     type::String
@@ -41,13 +46,13 @@ struct RavenDetective
             "raven",
             "Detective Raven",
             "dark_investigation",
-            ["dark_analytics", "ominous_pattern_detection", "gothic_investigation", "foreboding_analysis", "cryptic_interpretation"],
+            RAVEN_SKILLS,
             "solana",
             "active",
             now(),
             0,
-            "Messenger of dark truths and ominous revelations. Specializes in detecting sinister patterns and uncovering the darkest secrets hidden in blockchain transactions.",
-            "Nevermore shall evil transactions escape my vigilant gaze.",
+            RAVEN_PERSONA,
+            RAVEN_CATCHPHRASE,
             "dark_gothic",
             5
         )
@@ -74,7 +79,7 @@ Conducts dark investigation using real blockchain data.
 Raven's approach: gothic analysis, ominous pattern detection, cryptic interpretation.
 """
 function investigate_raven_style(wallet_address::String, investigation_id::String)
-    @info "🐦‍⬛ Raven: Beginning dark investigation for wallet: $wallet_address"
+    @info "🐦‍⬛ Raven: Beginning dark investigation" wallet=wallet_address
 
     try
         # Configure analysis tool for dark investigation
@@ -227,10 +232,10 @@ function detect_ominous_patterns_raven(wallet_data::Dict)
     patterns = risk_assessment["patterns"]
 
     # Categorize patterns by their ominous nature
-    temporal_omens = filter(p -> occursin("time", lowercase(p)) || occursin("timing", lowercase(p)), patterns)
-    value_portents = filter(p -> occursin("value", lowercase(p)) || occursin("amount", lowercase(p)), patterns)
-    frequency_harbingers = filter(p -> occursin("frequent", lowercase(p)) || occursin("regular", lowercase(p)), patterns)
-    behavioral_prophecies = filter(p -> occursin("behavior", lowercase(p)) || occursin("pattern", lowercase(p)), patterns)
+    temporal_omens = filter(p -> occursin(r"time|timing"i, p), patterns)
+    value_portents = filter(p -> occursin(r"value|amount"i, p), patterns)
+    frequency_harbingers = filter(p -> occursin(r"frequent|regular"i, p), patterns)
+    behavioral_prophecies = filter(p -> occursin(r"behavior|pattern"i, p), patterns)
 
     # Ominous pattern interpretation
     pattern_interpretation = if length(temporal_omens) > 0 && length(value_portents) > 0
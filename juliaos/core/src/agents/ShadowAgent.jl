@@ -20,6 +20,11 @@ export ShadowDetective, create_shadow_agent, investigate_shadow_style
 # THE SHADOW DETECTIVE STRUCTURE
 # ==========================================
 
+# Profile tables are constant; every ShadowDetective references the same copies.
+const SHADOW_SKILLS = ["stealth_analysis", "hidden_pattern_detection", "covert_surveillance", "shadow_networks", "dark_web_investigation"]
+const SHADOW_PERSONA = "Master of shadows and hidden networks. Specializes in detecting covert operations and analyzing stealth transactions in the blockchain underworld."
+const SHADOW_CATCHPHRASE = "Who knows what evil lurks in the hearts of wallets? The Shadow knows!"
+
 struct ShadowDetective
     id::String
     type::String
@@ -41,13 +46,13 @@ struct ShadowDetective
             "shadow",
             "The Shadow",
             "stealth_investigation",
-            ["stealth_analysis", "hidden_pattern_detection", "covert_surveillance", "shadow_networks", "dark_web_investigation"],
+            SHADOW_SKILLS,
             "solana",
             "active",
             now(),
             0,
-            "Master of shadows and hidden networks. Specializes in detecting covert operations and analyzing stealth transactions in the blockchain underworld.",
-            "Who knows what evil lurks in the hearts of wallets? The Shadow knows!",
+            SHADOW_PERSONA,
+            SHADOW_CATCHPHRASE,
             "stealth_covert",
             5
         )
@@ -74,7 +79,7 @@ Conducts stealth investigation using real blockchain data.
 Shadow's approach: covert analysis, hidden pattern detection, shadow network mapping.
 """
 function investigate_shadow_style(wallet_address::String, investigation_id::String)
-    @info "👤 Shadow: Beginning stealth investigation for wallet: $wallet_address"
+    @info "👤 Shadow: Beginning stealth investigation" wallet=wallet_address
 
     try
         # Configure analysis tool for stealth investigation
@@ -179,8 +184,8 @@ function conduct_stealth_analysis_shadow(wallet_data::Dict)
     end
 
     # Covert operation detection
-    covert_indicators = filter(p -> occursin("unusual", lowercase(p)) || occursin("suspicious", lowercase(p)), patterns)
-    stealth_patterns = filter(p -> occursin("automated", lowercase(p)) || occursin("systematic", lowercase(p)), patterns)
+    covert_indicators = filter(p -> occursin(r"unusual|suspicious"i, p), patterns)
+    stealth_patterns = filter(p -> occursin(r"automated|systematic"i, p), patterns)
 
     # Shadow network involvement
     network_involvement = if length(stealth_patterns) > 2
@@ -219,10 +224,10 @@ function detect_hidden_patterns_shadow(wallet_data::Dict)
     patterns = risk_assessment["patterns"]
 
     # Hidden pattern categories
-    timing_patterns = filter(p -> occursin("time", lowercase(p)) || occursin("timing", lowercase(p)), patterns)
-    value_patterns = filter(p -> occursin("value", lowercase(p)) || occursin("amount", lowercase(p)), patterns)
-    frequency_patterns = filter(p -> occursin("frequent", lowercase(p)) || occursin("regular", lowercase(p)), patterns)
-    behavioral_patterns = filter(p -> occursin("behavior", lowercase(p)) || occursin("pattern", lowercase(p)), patterns)
+    timing_patterns = filter(p -> occursin(r"time|timing"i, p), patterns)
+    value_patterns = filter(p -> occursin(r"value|amount"i, p), patterns)
+    frequency_patterns = filter(p -> occursin(r"frequent|regular"i, p), patterns)
+    behavioral_patterns = filter(p -> occursin(r"behavior|pattern"i, p), patterns)
 
     # Hidden correlation analysis
     hidden_correlations = if length(timing_patterns) > 0 && length(value_patterns) > 0
@@ -273,6 +278,12 @@ function map_shadow_networks_shadow(wallet_data::Dict)
     tx_summary = wallet_data["transaction_summary"]
     patterns = risk_assessment["patterns"]
     tx_count = tx_summary["total_transactions"]
+    topology = get(get(wallet_data, "graph_stats", Dict()), "topology", Dict())
+
+    # Real graph metrics win over transaction-count heuristics when available
+    if get(topology, "enabled", false) == true && !isempty(get(topology, "center_wallet", Dict()))
+        return map_shadow_networks_from_topology(topology, patterns)
+    end
 
     # Network topology analysis
     network_topology = if tx_count == 0
@@ -310,9 +321,9 @@ function map_shadow_networks_shadow(wallet_data::Dict)
     end
 
     # Communication patterns
-    communication_style = if any(p -> occursin("regular", lowercase(p)), patterns)
+    communication_style = if any(p -> occursin(r"regular"i, p), patterns)
         "scheduled_communication_protocol"
-    elseif any(p -> occursin("automated", lowercase(p)), patterns)
+    elseif any(p -> occursin(r"automated"i, p), patterns)
         "automated_communication_system"
     elseif length(patterns) > 0
         "irregular_communication_pattern"
@@ -330,6 +341,81 @@ function map_shadow_networks_shadow(wallet_data::Dict)
     )
 end
 
+"""
+    map_shadow_networks_from_topology(topology::Dict, patterns::Vector) -> Dict
+
+Classifies the wallet's network position from computed graph metrics
+(degree, PageRank rank, betweenness, Louvain community) instead of guessing from
+transaction counts.
+"""
+function map_shadow_networks_from_topology(topology::Dict, patterns::Vector)
+    center = topology["center_wallet"]
+    degree = center["degree"]
+    betweenness = center["betweenness"]
+    pagerank_rank = center["pagerank_rank"]
+
+    network_topology = if degree == 0
+        "isolated_node_no_network"
+    elseif pagerank_rank == 1 && degree >= 10
+        "network_center_extensive_connections"
+    elseif betweenness > 0.25 || pagerank_rank <= 3
+        "network_hub_significant_connections"
+    elseif degree >= 3
+        "network_member_moderate_connections"
+    else
+        "peripheral_node_minimal_connections"
+    end
+
+    network_type = if length(patterns) > 4
+        "sophisticated_shadow_network"
+    elseif length(patterns) > 2 || (center["community_size"] > 5 && topology["transitivity"] > 0.3)
+        "organized_shadow_network"
+    elseif length(patterns) > 0
+        "simple_shadow_network"
+    else
+        "legitimate_network_or_isolated"
+    end
+
+    hierarchy_position = if betweenness > 0.5 && length(patterns) > 3
+        "network_leadership_or_coordination"
+    elseif betweenness > 0.2 && length(patterns) > 1
+        "network_lieutenant_or_operator"
+    elseif degree > 2 && length(patterns) > 0
+        "network_soldier_or_participant"
+    else
+        "network_outsider_or_observer"
+    end
+
+    communication_style = if topology["transitivity"] > 0.5
+        "tightly_knit_cluster_communication"
+    elseif betweenness > 0.3
+        "brokered_communication_through_wallet"
+    elseif degree > 0
+        "irregular_communication_pattern"
+    else
+        "no_communication_detected"
+    end
+
+    return Dict(
+        "network_topology" => network_topology,
+        "network_type" => network_type,
+        "hierarchy_position" => hierarchy_position,
+        "communication_style" => communication_style,
+        "network_threat_level" => length(patterns) > 3 ? "high_threat" : length(patterns) > 0 ? "moderate_threat" : "low_threat",
+        "graph_metrics" => Dict(
+            "degree" => degree,
+            "pagerank" => center["pagerank"],
+            "pagerank_rank" => pagerank_rank,
+            "betweenness" => betweenness,
+            "community_size" => center["community_size"],
+            "community_count" => topology["community_count"],
+            "top_community_sizes" => get(topology, "top_community_sizes", Int[]),
+            "transitivity" => topology["transitivity"]
+        ),
+        "shadow_network_analysis" => "complete"
+    )
+end
+
 function generate_shadow_conclusion(risk_score::Float64, tx_count::Int, patterns::Vector)
     if risk_score > 0.7
         return "The shadows reveal dark truths about this wallet. Through $tx_count transactions, I have detected $(length(patterns)) patterns that speak of evil lurking in the blockchain darkness. The evidence points to a sophisticated shadow operation. Who knows what evil lurks in the hearts of wallets? The Shadow knows - and this one harbors malice."
@@ -74,7 +74,7 @@ Conducts hard-boiled risk assessment using real blockchain data.
 Spade's approach: direct, no-nonsense threat analysis with compliance focus.
 """
 function investigate_spade_style(wallet_address::String, investigation_id::String)
-    @info "🕵️ Spade: Conducting hard-boiled risk assessment for wallet: $wallet_address"
+    @info "🕵️ Spade: Conducting hard-boiled risk assessment" wallet=wallet_address
 
     try
         # Configure analysis tool for aggressive investigation
@@ -166,8 +166,8 @@ function evaluate_threats_spade(wallet_data::Dict)
     tx_count = tx_summary["total_transactions"]
 
     # Threat level categorization
-    high_threats = filter(p -> occursin("suspicious", lowercase(p)) || occursin("bot", lowercase(p)), patterns)
-    medium_threats = filter(p -> occursin("high", lowercase(p)) || occursin("unusual", lowercase(p)), patterns)
+    high_threats = filter(p -> occursin(r"suspicious|bot"i, p), patterns)
+    medium_threats = filter(p -> occursin(r"high|unusual"i, p), patterns)
     low_threats = filter(p -> !(p in high_threats) && !(p in medium_threats), patterns)
 
     # Security level assessment
@@ -208,19 +208,19 @@ function assess_compliance_spade(wallet_data::Dict)
     end
 
     # Structuring Detection
-    if any(p -> occursin("round value", lowercase(p)), patterns)
+    if any(p -> occursin(r"round value"i, p), patterns)
         push!(compliance_violations, "Potential structuring activity detected")
         compliance_score += 40
     end
 
     # Bot/Automation Detection (Compliance Risk)
-    if any(p -> occursin("automated", lowercase(p)) || occursin("bot", lowercase(p)), patterns)
+    if any(p -> occursin(r"automated|bot"i, p), patterns)
         push!(compliance_violations, "Automated trading patterns - potential compliance violation")
         compliance_score += 35
     end
 
     # Suspicious Timing Patterns
-    if any(p -> occursin("timing", lowercase(p)) || occursin("hours", lowercase(p)), patterns)
+    if any(p -> occursin(r"timing|hours"i, p), patterns)
         push!(compliance_violations, "Suspicious timing patterns - off-hours activity")
         compliance_score += 25
     end
@@ -251,9 +251,9 @@ function detect_criminal_patterns_spade(wallet_data::Dict)
     patterns = risk_assessment["patterns"]
 
     # Criminal pattern detection
-    money_laundering_indicators = filter(p -> occursin("round", lowercase(p)) || occursin("unusual", lowercase(p)), patterns)
-    fraud_indicators = filter(p -> occursin("suspicious", lowercase(p)) || occursin("bot", lowercase(p)), patterns)
-    evasion_indicators = filter(p -> occursin("timing", lowercase(p)) || occursin("automated", lowercase(p)), patterns)
+    money_laundering_indicators = filter(p -> occursin(r"round|unusual"i, p), patterns)
+    fraud_indicators = filter(p -> occursin(r"suspicious|bot"i, p), patterns)
+    evasion_indicators = filter(p -> occursin(r"timing|automated"i, p), patterns)
 
     # Overall criminal assessment
     criminal_risk = if length(money_laundering_indicators) > 0 || length(fraud_indicators) > 0
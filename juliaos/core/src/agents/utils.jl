@@ -3,6 +3,9 @@ using .AgentCore: DetectiveMemory, InvestigationTask
 # using JSONSchemaGenerator  # Commented out - not needed for basic functionality
 using Dates
 
+include("../api/Utils.jl")
+using .Utils: time_ordered_id
+
 function deserialize_object(object_type::DataType, data::Dict{String, Any})
     expected_fields = fieldnames(object_type)
     provided_fields = Symbol.(keys(data))
@@ -275,14 +278,14 @@ end
 """
     create_investigation_id(wallet_address::String, detective_type::String="") -> String
 
-Creates a unique investigation ID.
+Creates a unique investigation ID through the API's `time_ordered_id`, prefixed with
+the detective and the start of the wallet address.
 """
 function create_investigation_id(wallet_address::String, detective_type::String="")
-    timestamp = replace(string(now()), ":" => "", "." => "", "-" => "")
-    wallet_short = wallet_address[1:min(8, length(wallet_address))]
-    detective_prefix = isempty(detective_type) ? "" : "$(detective_type[1:min(3, length(detective_type))])_"
+    wallet_short = first(wallet_address, 8)
+    detective_prefix = isempty(detective_type) ? "" : "$(first(detective_type, 3))_"
 
-    return "inv_$(detective_prefix)$(wallet_short)_$(timestamp)"
+    return time_ordered_id("inv_$(detective_prefix)$(wallet_short)")
 end
 
 """
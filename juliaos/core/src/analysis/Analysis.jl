@@ -25,13 +25,15 @@ include("RiskConfiguration.jl")
 include("RegressionTesting.jl")
 
 # Export core types
-export TxEdge, TxGraph, GraphStats, PathEvidence
+export TxEdge, TxGraph, WalletCSR, GraphStats, PathEvidence
 
 # F1 parser/graph/metrics
 export parse_transaction, parse_transactions, validate_parsed_data
 export build_graph, calculate_fan_in, calculate_fan_out, calculate_net_flow,
-	   find_nodes_within_hops, calculate_graph_density, validate_graph
+	   find_nodes_within_hops, calculate_graph_density, validate_graph,
+	   build_wallet_csr, csr_arrays, csr_node_count
 export generate_graph_stats, export_graph_stats_json, analyze_connectivity_patterns, calculate_performance_metrics
+export compute_network_topology, calculate_pagerank, calculate_betweenness, detect_communities_louvain, calculate_transitivity
 
 # F2 taint + cache
 export TaintSeed, TaintResult, TaintConfig, DEFAULT_TAINT_CONFIG
@@ -19,8 +19,17 @@ using .SolanaService
 include("../resources/Resources.jl")
 using .Resources
 
+include("../utils/PromptLayout.jl")
+using .PromptLayout: cacheable_prompt
+
 export AnalysisResult, WalletAnalyzer, analyze_wallet, calculate_risk_score
 
+# getTransaction calls packed into each JSON-RPC batch POST by get_wallet_transactions
+const TX_DETAIL_BATCH_SIZE = try parse(Int, get(ENV, "TX_DETAIL_BATCH_SIZE", "20")) catch; 20 end
+
+# Below this many transactions there is no pattern for the AI to read; skip the call
+const AI_MIN_TRANSACTIONS = try parse(Int, get(ENV, "AI_MIN_TRANSACTIONS", "3")) catch; 3 end
+
 # ========================================
 # DATA STRUCTURES
 # ========================================
@@ -40,6 +49,7 @@ mutable struct AnalysisResult
     transactions_analyzed::Int
     patterns_detected::Vector{String}
     ai_insights::String
+    ai_explanation::String
     analysis_duration_ms::Float64
     analysis_method::String
 
@@ -53,6 +63,7 @@ mutable struct AnalysisResult
             0,
             [],
             "",
+            "",
             0.0,
             "julia_native"
         )
@@ -93,7 +104,7 @@ function analyze_wallet(
     result = AnalysisResult(wallet_address)
 
     try
-        @info "Starting analysis for wallet: $wallet_address with depth $depth"
+        @info "Starting analysis for wallet" wallet=wallet_address depth=depth
 
         # Validate wallet address
         if !SolanaService.validate_wallet_address(wallet_address)
@@ -118,22 +129,19 @@ function analyze_wallet(
         clusters = detect_clusters(graph, wallet_address)
         result.clusters = clusters
 
+        # The AI call only needs the transactions and clusters, so start it now and let
+        # the local risk scoring run while the request is in flight
+        ai_task = include_ai && length(transactions) >= AI_MIN_TRANSACTIONS ?
+                  Threads.@spawn(perform_ai_analysis(wallet_address, transactions, clusters)) : nothing
+
         # Calculate risk scores
         risk_analysis = calculate_risk_scores(clusters, transactions)
         result.risk_score = risk_analysis["overall_risk"]
         result.patterns_detected = risk_analysis["patterns"]
 
         # Enhanced AI Analysis (if enabled)
-        if include_ai
-            ai_analysis = perform_ai_analysis(wallet_address, transactions, clusters)
-
-            # Combine traditional and AI analysis
-            result.risk_score = combine_risk_scores(result.risk_score, ai_analysis["risk_score"])
-            result.ai_insights = ai_analysis["insights"]
-            result.analysis_method = "julia_native+ai"
-
-            # Add AI-detected patterns
-            append!(result.patterns_detected, ai_analysis["suspicious_patterns"])
+        if ai_task !== nothing
+            apply_ai_analysis!(result, fetch(ai_task))
         end
 
         # Determine final risk level
@@ -142,7 +150,7 @@ function analyze_wallet(
         # Record duration
         result.analysis_duration_ms = (now() - start_time).value
 
-        @info "Analysis completed for $wallet_address" risk_score=result.risk_score risk_level=result.risk_level
+        @info "Analysis completed" wallet=wallet_address risk_score=result.risk_score risk_level=result.risk_level
         return result
 
     catch e
@@ -168,23 +176,14 @@ function get_wallet_transactions(analyzer::WalletAnalyzer, wallet_address::Strin
             limit = min(analyzer.max_transactions, 1000)
         )
 
-        # Process and enrich transaction data
-        transactions = []
-        for sig_info in signatures
-            if haskey(sig_info, "signature")
-                # Get detailed transaction if needed
-                tx_details = SolanaService.get_transaction_details(
-                    analyzer.solana_client,
-                    sig_info["signature"]
-                )
-
-                # Merge signature info with details
-                merged_tx = merge(sig_info, tx_details)
-                push!(transactions, merged_tx)
-            end
-        end
+        # Process and enrich transaction data: filter once, then fetch all details as
+        # batched JSON-RPC requests instead of one round trip per signature
+        sig_infos = [s for s in signatures if haskey(s, "signature")]
+        details = SolanaService.get_transactions_details(
+            analyzer.solana_client, String[s["signature"] for s in sig_infos]; batch_size=TX_DETAIL_BATCH_SIZE)
+        transactions = Any[merge(s, d) for (s, d) in zip(sig_infos, details)]
 
-        @info "Retrieved $(length(transactions)) transactions for analysis"
+        @debug "Retrieved transactions for analysis" count=length(transactions)
         return transactions
 
     catch e
@@ -209,6 +208,12 @@ function build_transaction_graph(
     graph = Dict{String, Vector{String}}()
     visited = Set{String}()
 
+    # The accounts of each transaction and their validity do not depend on the wallet
+    # being explored: extract and validate them once instead of once per visited wallet
+    valid = Dict{String, Bool}()
+    tx_accounts = [filter(a -> get!(() -> SolanaService.validate_wallet_address(a), valid, a),
+                          extract_connected_wallets(tx, "")) for tx in transactions]
+
     function explore_wallet(wallet::String, current_depth::Int)
         if current_depth > depth || wallet in visited
             return
@@ -217,11 +222,10 @@ function build_transaction_graph(
         push!(visited, wallet)
         graph[wallet] = String[]
 
-        # Extract connected wallets from transactions
-        for tx in transactions
-            connected_wallets = extract_connected_wallets(tx, wallet)
-            for connected in connected_wallets
-                if connected != wallet && SolanaService.validate_wallet_address(connected)
+        # Connected wallets from every transaction, minus the wallet itself
+        for accounts in tx_accounts
+            for connected in accounts
+                if connected != wallet
                     push!(graph[wallet], connected)
 
                     # Recursive exploration for next depth
@@ -313,6 +317,13 @@ end
 # RISK CALCULATION
 # ========================================
 
+# Risk contribution and pattern tag per cluster risk_indicator; anything else is base risk
+const CLUSTER_BASE_RISK = (0.2, nothing)
+const CLUSTER_RISK_BY_INDICATOR = Dict{Any, Tuple{Float64, Union{String, Nothing}}}(
+    "HIGH" => (0.4, "high_risk_cluster"),
+    "MEDIUM" => (0.2, "medium_risk_cluster")
+)
+
 """
 Calculate risk scores based on transaction patterns and clusters
 """
@@ -326,21 +337,11 @@ function calculate_risk_scores(clusters::Vector, transactions::Vector)
         base_risk = 0.0
         patterns = String[]
 
-        # Risk from cluster analysis
+        # Risk from cluster analysis: one table lookup per cluster, no string compare chain
         for cluster in clusters
-            cluster_risk = 0.2 # Base cluster risk
-
-            if haskey(cluster, "risk_indicator")
-                if cluster["risk_indicator"] == "HIGH"
-                    cluster_risk = 0.4
-                    push!(patterns, "high_risk_cluster")
-                elseif cluster["risk_indicator"] == "MEDIUM"
-                    cluster_risk = 0.2
-                    push!(patterns, "medium_risk_cluster")
-                end
-            end
-
+            cluster_risk, pattern = get(CLUSTER_RISK_BY_INDICATOR, get(cluster, "risk_indicator", nothing), CLUSTER_BASE_RISK)
             base_risk += cluster_risk
+            pattern === nothing || push!(patterns, pattern)
         end
 
         # Risk from transaction frequency
@@ -367,6 +368,21 @@ end
 # AI ANALYSIS INTEGRATION
 # ========================================
 
+# Static part of the AI analysis prompt, built once at load
+const AI_ANALYSIS_PROMPT_PREFIX = """
+Analyze the Solana wallet below for suspicious activity.
+
+Provide:
+1. Risk score (0.0 to 1.0)
+2. Key insights
+3. Suspicious patterns found
+4. A professional explanation for the final report: what the analysis reveals,
+   key risk indicators and their significance, recommended actions, and your
+   confidence in the assessment
+
+Format: JSON with keys: risk_score, insights, suspicious_patterns, explanation
+"""
+
 """
 Perform AI-enhanced analysis using Resources.call_ai
 """
@@ -374,7 +390,8 @@ function perform_ai_analysis(wallet_address::String, transactions::Vector, clust
     ai_analysis = Dict{String, Any}(
         "risk_score" => 0.0,
         "insights" => "AI analysis unavailable",
-        "suspicious_patterns" => String[]
+        "suspicious_patterns" => String[],
+        "explanation" => ""
     )
 
     try
@@ -382,22 +399,13 @@ function perform_ai_analysis(wallet_address::String, transactions::Vector, clust
         summary = prepare_analysis_summary(wallet_address, transactions, clusters)
 
         # Call AI for analysis
-        prompt = """
-        Analyze this Solana wallet for suspicious activity:
-
+        prompt = cacheable_prompt(AI_ANALYSIS_PROMPT_PREFIX, """
         Wallet: $wallet_address
         Transactions: $(length(transactions))
         Clusters detected: $(length(clusters))
 
         Summary: $summary
-
-        Provide:
-        1. Risk score (0.0 to 1.0)
-        2. Key insights
-        3. Suspicious patterns found
-
-        Format: JSON with keys: risk_score, insights, suspicious_patterns
-        """
+        """)
 
         ai_response = Resources.call_ai_with_retry("openai", prompt; max_retries=2)
 
@@ -407,6 +415,7 @@ function perform_ai_analysis(wallet_address::String, transactions::Vector, clust
         ai_analysis["risk_score"] = get(parsed_response, "risk_score", 0.0)
         ai_analysis["insights"] = get(parsed_response, "insights", "AI analysis completed")
         ai_analysis["suspicious_patterns"] = get(parsed_response, "suspicious_patterns", String[])
+        ai_analysis["explanation"] = string(get(parsed_response, "explanation", ""))
 
         @info "AI analysis completed" risk_score=ai_analysis["risk_score"]
 
@@ -418,16 +427,28 @@ function perform_ai_analysis(wallet_address::String, transactions::Vector, clust
     return ai_analysis
 end
 
+"""
+Fold an AI analysis into a traditional result: blended risk score, insights, explanation
+and the AI-detected patterns.
+"""
+function apply_ai_analysis!(result::AnalysisResult, ai_analysis::Dict{String, Any})
+    # Combine traditional and AI analysis
+    result.risk_score = combine_risk_scores(result.risk_score, Float64(ai_analysis["risk_score"]))
+    result.ai_insights = ai_analysis["insights"]
+    result.ai_explanation = ai_analysis["explanation"]
+    result.analysis_method = "julia_native+ai"
+
+    # Add AI-detected patterns
+    append!(result.patterns_detected, ai_analysis["suspicious_patterns"])
+    return result
+end
+
 """
 Prepare analysis summary for AI processing
 """
 function prepare_analysis_summary(wallet_address::String, transactions::Vector, clusters::Vector)
-    summary = Dict(
-        "transaction_count" => length(transactions),
-        "cluster_count" => length(clusters),
-        "unique_connections" => 0,
-        "recent_activity" => false
-    )
+    unique_connections = 0
+    recent_activity = false
 
     try
         # Count unique connections
@@ -436,20 +457,27 @@ function prepare_analysis_summary(wallet_address::String, transactions::Vector,
             connected = extract_connected_wallets(tx, wallet_address)
             union!(unique_wallets, connected)
         end
-        summary["unique_connections"] = length(unique_wallets)
+        unique_connections = length(unique_wallets)
 
         # Check recent activity (last 24 hours)
         if !isempty(transactions) && haskey(transactions[1], "blockTime")
             latest_time = transactions[1]["blockTime"]
             current_time = time()
-            summary["recent_activity"] = (current_time - latest_time) < 86400 # 24 hours
+            recent_activity = (current_time - latest_time) < 86400 # 24 hours
         end
 
     catch e
         @debug "Error preparing analysis summary" error=e
     end
 
-    return JSON3.write(summary)
+    # NamedTuple keeps the keys in this fixed (sorted) order, so identical data always
+    # serializes to identical prompt bytes
+    return JSON3.write((
+        cluster_count = length(clusters),
+        recent_activity = recent_activity,
+        transaction_count = length(transactions),
+        unique_connections = unique_connections
+    ))
 end
 
 # ========================================
@@ -465,19 +493,17 @@ function combine_risk_scores(traditional_risk::Float64, ai_risk::Float64)
     return min(combined, 1.0)
 end
 
+# Lower bound of each level above LOW, ascending; paired with RISK_LEVEL_BANDS
+const RISK_LEVEL_THRESHOLDS = [0.3, 0.6, 0.8]
+const RISK_LEVEL_BANDS = (LOW, MEDIUM, HIGH, CRITICAL)
+
 """
 Determine risk level from numeric score
 """
 function determine_risk_level(risk_score::Float64)
-    if risk_score >= 0.8
-        return CRITICAL
-    elseif risk_score >= 0.6
-        return HIGH
-    elseif risk_score >= 0.3
-        return MEDIUM
-    else
-        return LOW
-    end
+    # NaN sorts above every threshold; keep the old comparison chain's LOW for it
+    isnan(risk_score) && return LOW
+    return RISK_LEVEL_BANDS[searchsortedlast(RISK_LEVEL_THRESHOLDS, risk_score) + 1]
 end
 
 end # module AnalysisService
@@ -0,0 +1,80 @@
+"""
+BehavioralFeatures.jl - Local behavioral screen for wallet transactions
+
+Computes the cheap, deterministic heuristics (same-slot bursts, round and small
+amounts, timing, dominant counterparty) before a wallet is sent to the AI.
+"""
+module BehavioralFeatures
+
+export compute_behavioral_features
+
+# Thresholds for the local behavioral screen run before the AI call
+const FEATURE_SIMULTANEOUS_MIN = 3       # transactions sharing one slot
+const FEATURE_ROUND_RATIO_MIN = 0.5      # share of whole-number amounts
+const FEATURE_SMALL_AMOUNT_SOL = 0.01
+const FEATURE_SMALL_RATIO_MIN = 0.6      # share of amounts below FEATURE_SMALL_AMOUNT_SOL
+const FEATURE_BURST_GAP_S = 5            # consecutive transactions closer than this are a burst
+const FEATURE_BURST_RATIO_MIN = 0.5
+const FEATURE_COUNTERPARTY_SHARE_MIN = 0.5
+const FEATURE_MIN_SAMPLES = 5            # ratios over fewer values are not judged
+
+"""
+Compute the behavioral heuristics (simultaneous, round, small, timing, counterparty)
+locally so the AI only has to judge them, and list the patterns they trip.
+Transactions are dicts with optional "slot", "blockTime", "amount", "to_address"
+and "from_address" keys; missing or non-numeric values are skipped.
+"""
+function compute_behavioral_features(transactions, wallet_address::String)
+    slots = Dict{Any,Int}()
+    counterparties = Dict{String,Int}()
+    times = Int[]
+    n_amounts = 0; n_round = 0; n_small = 0
+    for tx in transactions
+        slot = get(tx, "slot", nothing)
+        slot === nothing || (slots[slot] = get(slots, slot, 0) + 1)
+        bt = get(tx, "blockTime", nothing)
+        bt isa Integer && push!(times, bt)
+        amount = get(tx, "amount", nothing)
+        if amount isa Real
+            n_amounts += 1
+            n_round += amount != 0 && isinteger(amount)
+            n_small += abs(amount) < FEATURE_SMALL_AMOUNT_SOL
+        end
+        for key in ("to_address", "from_address")
+            addr = get(tx, key, nothing)
+            (addr isa AbstractString && addr != wallet_address) || continue
+            counterparties[addr] = get(counterparties, addr, 0) + 1
+        end
+    end
+
+    sort!(times)
+    n_gaps = length(times) - 1
+    bursts = count(i -> times[i+1] - times[i] < FEATURE_BURST_GAP_S, 1:max(n_gaps, 0))
+    top = first(sort!(collect(counterparties); by=last, rev=true), 3)
+    n_cp = sum(values(counterparties); init=0)
+    n_slotted = sum(values(slots); init=0)
+
+    features = (
+        simultaneous_max = isempty(slots) ? 0 : maximum(values(slots)),
+        round_ratio = n_amounts > 0 ? n_round / n_amounts : 0.0,
+        small_ratio = n_amounts > 0 ? n_small / n_amounts : 0.0,
+        burst_ratio = n_gaps > 0 ? bursts / n_gaps : 0.0,
+        top_counterparties = [first(p) for p in top],
+        top_counterparty_share = (n_cp > 0 && !isempty(top)) ? last(top[1]) / n_cp : 0.0,
+        # Every heuristic had enough samples to be judged. Signature listings carry slot
+        # and blockTime but no amounts or counterparties, so this stays false for them.
+        fully_screened = min(n_slotted, n_amounts, n_gaps, n_cp) >= FEATURE_MIN_SAMPLES
+    )
+
+    patterns = String[]
+    features.simultaneous_max >= FEATURE_SIMULTANEOUS_MIN && push!(patterns, "Simultaneous same-slot transactions")
+    if n_amounts >= FEATURE_MIN_SAMPLES
+        features.round_ratio >= FEATURE_ROUND_RATIO_MIN && push!(patterns, "Round number transactions")
+        features.small_ratio >= FEATURE_SMALL_RATIO_MIN && push!(patterns, "Frequent small transactions")
+    end
+    n_gaps >= FEATURE_MIN_SAMPLES && features.burst_ratio >= FEATURE_BURST_RATIO_MIN && push!(patterns, "Unusual timing patterns")
+    n_cp >= FEATURE_MIN_SAMPLES && features.top_counterparty_share >= FEATURE_COUNTERPARTY_SHARE_MIN && push!(patterns, "Repeated counterparty interactions")
+    return features, patterns
+end
+
+end # module BehavioralFeatures
@@ -17,8 +17,34 @@ struct EntitySignal
     strength::Float64        # Signal strength [0,1]
     evidence::Vector{String} # Supporting transaction signatures or addresses
     metadata::Dict{String,Any} # Additional signal-specific data
+    addresses::Vector{String}  # Addresses linked by this signal, resolved once from metadata
 end
 
+EntitySignal(signal_type::String, strength::Real, evidence::Vector{String}, metadata::Dict{String,Any}) =
+    EntitySignal(signal_type, strength, evidence, metadata, signal_addresses(metadata))
+
+"""
+    signal_addresses(metadata::Dict{String,Any}) -> Vector{String}
+
+Addresses a signal links together, whichever metadata layout its detector used. A fan
+signal only links its addresses when the hub address (`source_address` for fan-out,
+`destination_address` for fan-in) is known. Missing (`nothing`) entries are skipped.
+"""
+function signal_addresses(metadata::Dict{String,Any})
+    if haskey(metadata, "involved_addresses")
+        return _address_strings(metadata["involved_addresses"])
+    elseif haskey(metadata, "addresses")
+        return _address_strings(metadata["addresses"])
+    elseif haskey(metadata, "destinations") && haskey(metadata, "source_address")
+        return _address_strings(vcat([metadata["source_address"]], metadata["destinations"]))
+    elseif haskey(metadata, "sources") && haskey(metadata, "destination_address")
+        return _address_strings(vcat(metadata["sources"], [metadata["destination_address"]]))
+    end
+    return String[]
+end
+
+_address_strings(addrs) = String[string(a) for a in addrs if a !== nothing]
+
 struct EntityCluster
     cluster_id::String
     addresses::Set{String}
@@ -254,29 +280,7 @@ function build_entity_clusters(signals::Vector{EntitySignal}, config::Clustering
     # Create adjacency matrix for addresses based on signals
     all_addresses = Set{String}()
     for signal in signals
-        if haskey(signal.metadata, "involved_addresses")
-            for addr in signal.metadata["involved_addresses"]
-                push!(all_addresses, addr)
-            end
-        elseif haskey(signal.metadata, "addresses")
-            for addr in signal.metadata["addresses"]
-                push!(all_addresses, addr)
-            end
-        elseif haskey(signal.metadata, "destinations")
-            for addr in signal.metadata["destinations"]
-                push!(all_addresses, addr)
-            end
-            if haskey(signal.metadata, "source_address")
-                push!(all_addresses, signal.metadata["source_address"])
-            end
-        elseif haskey(signal.metadata, "sources")
-            for addr in signal.metadata["sources"]
-                push!(all_addresses, addr)
-            end
-            if haskey(signal.metadata, "destination_address")
-                push!(all_addresses, signal.metadata["destination_address"])
-            end
-        end
+        union!(all_addresses, signal.addresses)
     end
 
     address_list = collect(all_addresses)
@@ -295,19 +299,8 @@ function build_entity_clusters(signals::Vector{EntitySignal}, config::Clustering
             continue
         end
 
-        # Extract addresses involved in this signal
-        involved = String[]
-        if haskey(signal.metadata, "involved_addresses")
-            involved = signal.metadata["involved_addresses"]
-        elseif haskey(signal.metadata, "addresses")
-            involved = signal.metadata["addresses"]
-        elseif haskey(signal.metadata, "destinations") && haskey(signal.metadata, "source_address")
-            involved = vcat([signal.metadata["source_address"]], signal.metadata["destinations"])
-        elseif haskey(signal.metadata, "sources") && haskey(signal.metadata, "destination_address")
-            involved = vcat(signal.metadata["sources"], [signal.metadata["destination_address"]])
-        end
-
         # Add connections between all pairs in this signal
+        involved = signal.addresses
         for i in involved
             for j in involved
                 if i != j && haskey(addr_to_idx, i) && haskey(addr_to_idx, j)
@@ -357,15 +350,8 @@ function build_entity_clusters(signals::Vector{EntitySignal}, config::Clustering
         if length(cluster_addresses) >= 2 && length(cluster_addresses) <= config.max_cluster_size
             # Collect relevant signals for this cluster
             for signal in signals
-                signal_addresses = String[]
-                if haskey(signal.metadata, "involved_addresses")
-                    signal_addresses = signal.metadata["involved_addresses"]
-                elseif haskey(signal.metadata, "addresses")
-                    signal_addresses = signal.metadata["addresses"]
-                end
-
                 # Check if signal is relevant to this cluster
-                if !isempty(intersect(Set(signal_addresses), cluster_addresses))
+                if any(in(cluster_addresses), signal.addresses)
                     push!(cluster_signals, signal)
                 end
             end
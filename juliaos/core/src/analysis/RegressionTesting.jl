@@ -269,19 +269,19 @@ function execute_test_case(test_case::ExploitTestCase, config::RiskConfig)::Regr
     end
 end
 
+# Ordinal of each risk level, built once at load instead of on every comparison
+const RISK_LEVEL_VALUES = Dict(
+    "LOW" => 1,
+    "MEDIUM" => 2,
+    "HIGH" => 3,
+    "CRITICAL" => 4,
+    "ERROR" => 0
+)
+
 """
 Convert risk level to numerical value for comparison
 """
-function risk_level_value(level::String)::Int
-    level_map = Dict(
-        "LOW" => 1,
-        "MEDIUM" => 2,
-        "HIGH" => 3,
-        "CRITICAL" => 4,
-        "ERROR" => 0
-    )
-    return get(level_map, level, 0)
-end
+risk_level_value(level::String)::Int = get(RISK_LEVEL_VALUES, level, 0)
 
 """
 Simulate analysis result for testing purposes
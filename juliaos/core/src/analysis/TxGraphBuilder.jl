@@ -192,5 +192,57 @@ function validate_graph(graph::TxGraph)::Dict{String,Any}
     )
 end
 
+"""
+Build CSR row offsets, column indices and weights for `n` nodes from parallel
+(src, dst, weight) arrays. Duplicate (src, dst) pairs are merged by summing weight.
+"""
+function csr_arrays(n::Integer, src::AbstractVector{<:Integer}, dst::AbstractVector{<:Integer}, wts::AbstractVector{<:Real})
+    perm = sortperm(collect(zip(src, dst)))
+    indptr = zeros(Int32, n + 1)
+    indices = Int32[]
+    weights = Float32[]
+    sizehint!(indices, length(perm)); sizehint!(weights, length(perm))
+    last_u = last_v = 0
+    for p in perm
+        u, v = src[p], dst[p]
+        if u == last_u && v == last_v
+            weights[end] += wts[p]
+        else
+            push!(indices, v); push!(weights, wts[p])
+            indptr[u + 1] += 1
+            last_u, last_v = u, v
+        end
+    end
+    indptr[1] = 1
+    for u in 1:n
+        indptr[u + 1] += indptr[u]
+    end
+    return indptr, indices, weights
+end
+
+"""
+Build the undirected CSR view of a transaction graph used by the topology
+metrics. Each transfer contributes its value (or 1.0 for zero-value edges) in
+both directions; self-transfers are dropped and parallel transfers merged.
+"""
+function build_wallet_csr(graph::TxGraph)::WalletCSR
+    addresses = sort!(collect(graph.nodes))
+    address_ids = Dict{String,Int32}(addr => Int32(i) for (i, addr) in enumerate(addresses))
+    m = length(graph.edges)
+    src = Int32[]; dst = Int32[]; wts = Float32[]
+    sizehint!(src, 2m); sizehint!(dst, 2m); sizehint!(wts, 2m)
+    for edge in graph.edges
+        u = address_ids[edge.from]; v = address_ids[edge.to]
+        u == v && continue
+        w = edge.value > 0 ? edge.value : 1.0
+        push!(src, u, v); push!(dst, v, u); push!(wts, w, w)
+    end
+    indptr, indices, weights = csr_arrays(length(addresses), src, dst, wts)
+    return WalletCSR(addresses, address_ids, indptr, indices, weights)
+end
+
+csr_node_count(csr::WalletCSR) = length(csr.indptr) - 1
+
 export build_graph, calculate_fan_in, calculate_fan_out, calculate_net_flow,
        find_nodes_within_hops, calculate_graph_density, validate_graph
+export build_wallet_csr, csr_arrays, csr_node_count
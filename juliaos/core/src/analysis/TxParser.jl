@@ -7,11 +7,16 @@ NO MOCKS - works with real transaction JSON from RPC calls.
 
 # TxTypes are included by the parent Analysis module; no local includes/usings needed
 
+# Return the canonical copy of an address so repeated counterparties across many
+# transactions share one String instead of one per parsed JSON occurrence.
+_intern!(pool::Dict{String,String}, s::AbstractString) = get!(() -> String(s), pool, s)
+
 """
 Parse a single transaction into TxEdge structures.
 Extracts real account interactions and balance changes.
+Pass a shared `pool` to intern addresses across a batch of transactions.
 """
-function parse_transaction(tx::Dict, wallet_address::String)::Vector{TxEdge}
+function parse_transaction(tx::Dict, wallet_address::String; pool::Dict{String,String}=Dict{String,String}())::Vector{TxEdge}
     edges = TxEdge[]
 
     try
@@ -60,7 +65,7 @@ function parse_transaction(tx::Dict, wallet_address::String)::Vector{TxEdge}
                                     if wallet_delta > 0 && acc_delta < 0
                                         # Wallet received, counterparty sent
                                         edge = TxEdge(
-                                            String(acc),
+                                            _intern!(pool, acc),
                                             wallet_address,
                                             abs(wallet_delta),
                                             slot,
@@ -74,7 +79,7 @@ function parse_transaction(tx::Dict, wallet_address::String)::Vector{TxEdge}
                                         # Wallet sent, counterparty received
                                         edge = TxEdge(
                                             wallet_address,
-                                            String(acc),
+                                            _intern!(pool, acc),
                                             abs(wallet_delta),
                                             slot,
                                             block_time,
@@ -96,7 +101,7 @@ function parse_transaction(tx::Dict, wallet_address::String)::Vector{TxEdge}
                         if haskey(instruction, "programIdIndex") && haskey(instruction, "accounts")
                             program_idx = instruction["programIdIndex"] + 1  # Julia 1-indexed
                             if program_idx <= length(accounts)
-                                program_id = String(accounts[program_idx])
+                                program_id = _intern!(pool, accounts[program_idx])
 
                                 # Track program interactions as edges
                                 for acc_idx in instruction["accounts"]
@@ -139,9 +144,10 @@ Real transaction processing - no mocking.
 """
 function parse_transactions(transactions::Vector, wallet_address::String)::Vector{TxEdge}
     all_edges = TxEdge[]
+    pool = Dict{String,String}(wallet_address => wallet_address)
 
     for tx in transactions
-        edges = parse_transaction(tx, wallet_address)
+        edges = parse_transaction(tx, wallet_address; pool=pool)
         append!(all_edges, edges)
     end
 
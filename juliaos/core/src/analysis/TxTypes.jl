@@ -28,6 +28,19 @@ struct TxGraph
     end
 end
 
+# Compressed sparse row (structure-of-arrays) form of the undirected wallet graph.
+# Neighbours of node u are indices[indptr[u]:indptr[u+1]-1] with matching weights;
+# addresses are stored once and referenced by Int32 id everywhere else. Weights are
+# Float32: topology scores tolerate ~7 significant digits, while exact value sums
+# (fan-in/out, net flow) stay Float64 on TxGraph.
+struct WalletCSR
+    addresses::Vector{String}          # id -> address
+    address_ids::Dict{String,Int32}    # address -> id
+    indptr::Vector{Int32}              # length n+1, 1-based row offsets
+    indices::Vector{Int32}             # neighbour ids, sorted within each row
+    weights::Vector{Float32}           # accumulated transfer value per neighbour
+end
+
 struct GraphStats
     nodes::Int
     edges::Int
@@ -46,4 +59,4 @@ struct PathEvidence
 end
 
 # Export all types for use in other modules
-export TxEdge, TxGraph, GraphStats, PathEvidence
+export TxEdge, TxGraph, WalletCSR, GraphStats, PathEvidence
@@ -29,6 +29,11 @@ using ..resources.Resources: call_ai
 using ..monitoring.MonitoringService: record_api_call
 using ..security.BlacklistChecker: check_address as check_blacklist
 
+include("Utils.jl")
+using .Utils: time_ordered_id
+include("../utils/PromptLayout.jl")
+using .PromptLayout: cacheable_prompt
+
 # ===============================================================================
 # REQUEST/RESPONSE MODELS
 # ===============================================================================
@@ -111,6 +116,20 @@ StructTypes.StructType(::Type{QuickAnalysisResponse}) = StructTypes.Struct()
 # ANALYSIS PROCESSING FUNCTIONS
 # ===============================================================================
 
+# Phase 5 explanation prompt: static instructions built once at load
+const AI_EXPLANATION_INSTRUCTIONS = """
+Analyze the Solana wallet investigation results below.
+
+Provide a clear, professional explanation of:
+1. What the analysis reveals about this wallet
+2. Key risk indicators and their significance
+3. Recommended actions based on findings
+4. Confidence level in the assessment
+
+Be specific and actionable in your response.
+"""
+const AI_EXPLANATION_SYSTEM = "You are a blockchain forensic analyst providing professional wallet assessment reports."
+
 """
 Perform comprehensive wallet analysis with clustering
 """
@@ -118,7 +137,7 @@ function perform_comprehensive_analysis(wallet_address::String, depth::Int, incl
     @info "📊 Comprehensive analysis for: $wallet_address (depth: $depth)"
 
     start_time = time()
-    analysis_id = "ANALYSIS_$(Dates.format(now(), "yyyymmdd_HHMMSS"))"
+    analysis_id = time_ordered_id("ANALYSIS")
 
     # Validate wallet address
     if !validate_wallet_address(wallet_address)
@@ -219,47 +238,39 @@ function perform_comprehensive_analysis(wallet_address::String, depth::Int, incl
         recommendations
     )
 
-    # Phase 5: AI Explanation (if requested)
-    ai_explanation = ""
-    if include_ai
+    # Phase 5: AI Explanation (if requested). The analysis call already asks for the
+    # report explanation in the same reply; only make a second round trip without it
+    ai_explanation = hasproperty(wallet_analysis, :ai_explanation) ? wallet_analysis.ai_explanation : ""
+    if include_ai && isempty(ai_explanation)
         @info "Phase 5: AI explanation..."
 
-        ai_prompt = """
-        Analyze this Solana wallet investigation results:
-
+        ai_prompt = cacheable_prompt(AI_EXPLANATION_INSTRUCTIONS, """
         Wallet: $wallet_address
         Risk Score: $(round(overall_risk, digits=2))
         Clusters Found: $(length(clusters))
         Transaction Patterns: $(length(transaction_patterns))
         Risk Factors: $(join(risk_factors, ", "))
-
-        Provide a clear, professional explanation of:
-        1. What the analysis reveals about this wallet
-        2. Key risk indicators and their significance
-        3. Recommended actions based on findings
-        4. Confidence level in the assessment
-
-        Be specific and actionable in your response.
-        """
+        """)
 
         try
-            ai_explanation = call_ai(ai_prompt, "You are a blockchain forensic analyst providing professional wallet assessment reports.")
+            ai_explanation = call_ai(ai_prompt, AI_EXPLANATION_SYSTEM)
         catch e
             @warn "AI explanation failed: $e"
             ai_explanation = "AI analysis temporarily unavailable. Risk assessment based on algorithmic analysis only."
         end
     end
 
-    # Compile connections data
+    # Compile connections data; the cluster wallet total feeds data_points below too
+    cluster_wallet_total = sum(c.wallet_count for c in clusters; init=0)
     connections = Dict(
         "direct_connections" => length(clusters) > 0 ? clusters[1].wallet_count : 0,
-        "cluster_connections" => sum([c.wallet_count for c in clusters]),
+        "cluster_connections" => cluster_wallet_total,
         "depth_analyzed" => depth,
         "total_volume_analyzed" => sum([c.total_volume for c in clusters])
     )
 
     processing_time = (time() - start_time) * 1000
-    data_points = sum([c.wallet_count for c in clusters]) + length(transaction_patterns)
+    data_points = cluster_wallet_total + length(transaction_patterns)
 
     metadata = AnalysisMetadata(
         analysis_id,
@@ -288,7 +299,7 @@ end
 """
 Perform quick analysis for fast results
 """
-function perform_quick_analysis(wallet_address::String)
+function perform_quick_analysis(wallet_address::String; timestamp::String=string(now()))
     @info "⚡ Quick analysis for: $wallet_address"
 
     start_time = time()
@@ -331,7 +342,7 @@ function perform_quick_analysis(wallet_address::String)
         risk_level,
         cluster_count,
         total_connections,
-        string(now()),
+        timestamp,
         processing_time
     )
 end
@@ -461,6 +472,11 @@ function cluster_analysis_handler(req::HTTP.Request, wallet_address::String)
     end
 end
 
+# Wallets analyzed at the same time across all batch requests; each one does its own
+# RPC fan-out, so concurrent batches share one gate instead of multiplying the bound
+const BATCH_ANALYSIS_CONCURRENCY = try parse(Int, get(ENV, "GWH_MAX_CONCURRENT_ANALYSES", "16")) catch; 16 end
+const BATCH_ANALYSIS_GATE = Base.Semaphore(max(1, BATCH_ANALYSIS_CONCURRENCY))
+
 """
 Batch Analysis for Multiple Wallets
 =================================
@@ -481,20 +497,23 @@ function batch_analysis_handler(req::HTTP.Request)
 
         record_api_call("batch_analysis", "$(length(wallet_addresses))_wallets", 0.1)
 
-        # Process each wallet
-        results = []
-        for wallet_address in wallet_addresses
-            try
-                result = perform_quick_analysis(wallet_address)
-                push!(results, result)
-            catch e
-                @warn "Failed to analyze $wallet_address: $e"
-                push!(results, Dict(
-                    "wallet_address" => wallet_address,
-                    "error" => "Analysis failed: $(string(e))"
-                ))
+        # Start every wallet first, bounded by the gate, then collect in request order.
+        # One timestamp stamps the whole batch instead of formatting one per wallet
+        batch_timestamp = string(now())
+        tasks = map(wallet_addresses) do wallet_address
+            Threads.@spawn Base.acquire(BATCH_ANALYSIS_GATE) do
+                try
+                    perform_quick_analysis(wallet_address; timestamp=batch_timestamp)
+                catch e
+                    @warn "Failed to analyze $wallet_address: $e"
+                    Dict(
+                        "wallet_address" => wallet_address,
+                        "error" => "Analysis failed: $(string(e))"
+                    )
+                end
             end
         end
+        results = Any[fetch(t) for t in tasks]
 
         # Summary statistics
         successful_results = filter(r -> !haskey(r, "error"), results)
@@ -510,7 +529,7 @@ function batch_analysis_handler(req::HTTP.Request)
             "failed_analyses" => length(wallet_addresses) - length(successful_results),
             "average_risk_score" => round(avg_risk_score, digits=2),
             "results" => results,
-            "timestamp" => string(now())
+            "timestamp" => batch_timestamp
         )
 
         return HTTP.Response(200, JSON3.write(response))
@@ -22,6 +22,9 @@ using StructTypes
 using Dates
 using UUIDs
 
+include("Utils.jl")
+using .Utils: time_ordered_id
+
 # Optional service availability checks (avoid hard dependency load errors)
 const HAS_MONITORING = isdefined(Main.JuliaOS, :MonitoringService)
 const HAS_ANALYSIS = isdefined(Main.JuliaOS, :AnalysisService)
@@ -144,8 +147,8 @@ function investigate_wallet_handler(req::HTTP.Request)
 
         @info "🚨 Frontend investigation request: $(request_data.wallet_address)"
 
-        # Generate case ID
-        case_id = "CASE_$(Dates.format(now(), "yyyymmdd_HHMMSS"))"
+        # Generate case ID (time-ordered and unique per request)
+        case_id = time_ordered_id("CASE")
         # Short ID (last 6 chars of timestamp-based ID)
         short_id = replace(case_id, "CASE_"=>"")
 
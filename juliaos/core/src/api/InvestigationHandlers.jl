@@ -20,7 +20,6 @@ using HTTP
 using JSON3
 using StructTypes
 using Dates
-using UUIDs
 
 # Import JuliaOS services
 using ..blockchain.SolanaService: get_wallet_transactions, get_wallet_balance, validate_wallet_address
@@ -30,6 +29,14 @@ using ..monitoring.MonitoringService: record_api_call, get_user_stats
 using ..security.BlacklistChecker: check_address as check_blacklist
 using ..tokens.TokenEnrichment: enrich_token_info, analyze_wallet_context
 
+include("Utils.jl")
+using .Utils: time_ordered_id
+include("../utils/PromptLayout.jl")
+using .PromptLayout: cacheable_prompt
+
+include("../analysis/BehavioralFeatures.jl")
+using .BehavioralFeatures: compute_behavioral_features
+
 """
 DEPRECATION NOTICE
 ==================
@@ -103,9 +110,12 @@ function collect_blockchain_data(wallet_address::String, max_transactions::Int,
         throw(ArgumentError("Invalid wallet address format"))
     end
 
-    # Get basic wallet information
-    balance = get_wallet_balance(wallet_address)
+    # Balance, transaction history and token context are independent lookups; issue
+    # them together so the slowest one sets the wait instead of their sum
+    balance_task = Threads.@spawn get_wallet_balance(wallet_address)
+    token_task = Threads.@spawn analyze_wallet_context(wallet_address)
     transactions = get_wallet_transactions(wallet_address, max_transactions)
+    balance = fetch(balance_task)
     degraded_rpc = false
     if balance < 0
         degraded_rpc = true
@@ -117,7 +127,7 @@ function collect_blockchain_data(wallet_address::String, max_transactions::Int,
     end
 
     # Analyze token holdings and context
-    token_context = analyze_wallet_context(wallet_address)
+    token_context = fetch(token_task)
 
     # Extract risk indicators from transactions
     risk_indicators = String[]
@@ -168,6 +178,40 @@ function collect_blockchain_data(wallet_address::String, max_transactions::Int,
     return summary, transactions, token_context, processing_time
 end
 
+# Per-level analysis instructions, built once at load
+const AI_ANALYSIS_INSTRUCTIONS = Dict(
+    "expert" => """
+    Perform expert-level blockchain forensic analysis on the wallet data below.
+
+    Provide detailed analysis including:
+    1. Risk assessment (0-100 scale)
+    2. Threat categorization
+    3. Behavioral pattern analysis
+    4. Specific recommendations
+    5. Confidence level in analysis
+
+    Focus on: money laundering, fraud detection, suspicious patterns, compliance issues.
+    """,
+    "advanced" => """
+    Analyze the Solana wallet below for suspicious activity.
+
+    Provide:
+    1. Risk score (0-100)
+    2. Main threat categories
+    3. Key behavioral patterns
+    4. Recommendations
+    """,
+    "basic" => """
+    Quick risk assessment for the wallet below.
+
+    Provide basic risk score and main concerns.
+    """
+)
+
+# Opt-in: skip the AI call for basic/advanced analyses when the local screen judged
+# every heuristic and found nothing
+const AI_FEATURE_SHORT_CIRCUIT = lowercase(get(ENV, "AI_FEATURE_SHORT_CIRCUIT", "false")) == "true"
+
 """
 Perform AI analysis on collected data
 """
@@ -176,62 +220,35 @@ function perform_ai_analysis(wallet_address::String, blockchain_data, transactio
 
     start_time = time()
 
-    # Prepare context for AI analysis
-    analysis_context = Dict(
-        "wallet_address" => wallet_address,
-        "transaction_count" => blockchain_data.transaction_count,
-        "total_volume" => blockchain_data.total_volume,
-        "unique_interactions" => blockchain_data.unique_interactions,
-        "risk_indicators" => blockchain_data.risk_indicators,
-        "token_context" => token_context,
-        "analysis_level" => analysis_level
-    )
-
-    # Create AI prompt based on analysis level
-    prompt = if analysis_level == "expert"
-        """
-        Perform expert-level blockchain forensic analysis on the following wallet data:
-
-        Wallet: $(wallet_address)
-        Transactions: $(blockchain_data.transaction_count)
-        Volume: $(blockchain_data.total_volume) SOL
-        Unique Interactions: $(blockchain_data.unique_interactions)
-        Risk Indicators: $(join(blockchain_data.risk_indicators, ", "))
-
-        Provide detailed analysis including:
-        1. Risk assessment (0-100 scale)
-        2. Threat categorization
-        3. Behavioral pattern analysis
-        4. Specific recommendations
-        5. Confidence level in analysis
-
-        Focus on: money laundering, fraud detection, suspicious patterns, compliance issues.
-        """
-    elseif analysis_level == "advanced"
-        """
-        Analyze this Solana wallet for suspicious activity:
-
-        Wallet: $(wallet_address)
-        Activity: $(blockchain_data.transaction_count) transactions, $(blockchain_data.total_volume) SOL volume
-        Risk Flags: $(join(blockchain_data.risk_indicators, ", "))
-
-        Provide:
-        1. Risk score (0-100)
-        2. Main threat categories
-        3. Key behavioral patterns
-        4. Recommendations
-        """
-    else  # basic
-        """
-        Quick risk assessment for wallet $(wallet_address):
-        - $(blockchain_data.transaction_count) transactions
-        - $(blockchain_data.total_volume) SOL volume
-        - Risk indicators: $(join(blockchain_data.risk_indicators, ", "))
-
-        Provide basic risk score and main concerns.
-        """
+    features, local_patterns = compute_behavioral_features(transactions, wallet_address)
+
+    # Every heuristic judged, nothing tripped locally and nothing flagged upstream: the AI
+    # would only restate a low-risk verdict. Expert analyses and degraded RPC data, and
+    # transactions without amounts or counterparties, always go to the AI.
+    if AI_FEATURE_SHORT_CIRCUIT && analysis_level != "expert" && features.fully_screened && isempty(local_patterns) &&
+       isempty(blockchain_data.risk_indicators) && !get(token_context, "degraded_rpc", false)
+        @info "✅ Local feature screen clean; AI analysis skipped"
+        return AIAnalysisResult(
+            10.0,
+            0.95,
+            ["General Risk"],
+            String[],
+            ["Low risk - routine monitoring sufficient"],
+            "Local behavioral screen found no red flags; AI analysis skipped."
+        ), (time() - start_time) * 1000
     end
 
+    instructions = get(AI_ANALYSIS_INSTRUCTIONS, analysis_level, AI_ANALYSIS_INSTRUCTIONS["basic"])
+    prompt = cacheable_prompt(instructions, """
+    Wallet: $(wallet_address)
+    Transactions: $(blockchain_data.transaction_count)
+    Volume: $(blockchain_data.total_volume) SOL
+    Unique Interactions: $(blockchain_data.unique_interactions)
+    Risk Indicators: $(join(blockchain_data.risk_indicators, ", "))
+    Computed Features: max same-slot txs $(features.simultaneous_max), round amounts $(round(100 * features.round_ratio, digits=1))%, small amounts $(round(100 * features.small_ratio, digits=1))%, burst gaps $(round(100 * features.burst_ratio, digits=1))%, top counterparty share $(round(100 * features.top_counterparty_share, digits=1))%
+    Detected Patterns: $(isempty(local_patterns) ? "none" : join(local_patterns, ", "))
+    """)
+
     # Call AI service
     ai_response = call_ai(prompt, "You are a blockchain forensic expert specialized in Solana analysis.")
 
@@ -239,7 +256,7 @@ function perform_ai_analysis(wallet_address::String, blockchain_data, transactio
     risk_score = extract_risk_score(ai_response)
     confidence_level = extract_confidence_level(ai_response)
     threat_categories = extract_threat_categories(ai_response)
-    behavioral_patterns = extract_behavioral_patterns(ai_response)
+    behavioral_patterns = union(local_patterns, extract_behavioral_patterns(ai_response))
     recommendations = extract_recommendations(ai_response)
 
     processing_time = (time() - start_time) * 1000
@@ -358,7 +375,7 @@ function investigate_wallet_real_ai_handler(req::HTTP.Request)
         return Main.JuliaOS.UnifiedInvestigationHandler.unified_investigate_handler(req; deprecated=true)
     end
 
-    case_id = "REAL_AI_$(Dates.format(now(), "yyyymmdd_HHMMSS"))"
+    case_id = time_ordered_id("REAL_AI")
     start_time = time()
 
     try
@@ -371,6 +388,9 @@ function investigate_wallet_real_ai_handler(req::HTTP.Request)
         # Record API call for monitoring
         record_api_call("real_ai_investigation", request_data.wallet_address, 0.0)  # Cost updated later
 
+        # The blacklist lookup needs only the address; run it alongside phases 1-2
+        blacklist_task = Threads.@spawn check_blacklist(request_data.wallet_address)
+
         # Phase 1: Collect blockchain data
         blockchain_data, transactions, token_context, blockchain_time = collect_blockchain_data(
             request_data.wallet_address,
@@ -388,7 +408,7 @@ function investigate_wallet_real_ai_handler(req::HTTP.Request)
         )
 
         # Phase 3: Security checks
-        blacklist_result = check_blacklist(request_data.wallet_address)
+        blacklist_result = fetch(blacklist_task)
 
         # Adjust risk score based on blacklist
         final_risk_score = ai_analysis.risk_score
@@ -22,14 +22,12 @@ using .Utils
 include("../monitoring/MonitoringService.jl")
 using .MonitoringService
 
-include("../blockchain/SolanaService.jl")
-using .SolanaService
-
+# AnalysisService already includes SolanaService and Resources; reuse those copies
+# instead of compiling a second, independent instance of each module here.
 include("../analysis/AnalysisService.jl")
 using .AnalysisService
-
-include("../resources/Resources.jl")
-using .Resources
+using .AnalysisService.SolanaService
+using .AnalysisService.Resources
 
 # Performance Models
 struct SystemMetrics
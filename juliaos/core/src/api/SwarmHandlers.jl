@@ -25,6 +25,7 @@ function create_swarm_handler(req::HTTP.Request)
         obj_desc = get(body, "objective_description", "Default Objective")
         max_iter = get(body, "max_iterations", 100)
         target_fit_val = get(body, "target_fitness", nothing) # Can be Float64 or nothing
+        parallel_eval = get(body, "parallel_evaluation", false) === true # Objective must be thread-safe
 
         problem_def_data = get(body, "problem_definition", nothing)
         if isnothing(problem_def_data) || !isa(problem_def_data, Dict)
@@ -77,7 +78,8 @@ function create_swarm_handler(req::HTTP.Request)
                                    algorithm_params=algo_params,
                                    objective_desc=obj_desc,
                                    max_iter=max_iter,
-                                   target_fit=target_fit_val)
+                                   target_fit=target_fit_val,
+                                   parallel_eval=parallel_eval)
 
         swarm = Swarms.createSwarm(config)
         status_dict = Swarms.getSwarmStatus(swarm.id)
@@ -8,11 +8,16 @@ using StructTypes
 import ..FrontendHandlers: INVESTIGATION_STORE
 import Main.JuliaOS.DetectiveAgents
 
+include("Utils.jl")
+using .Utils: time_ordered_id
+
 const HAS_REAL_AI = isdefined(Main.JuliaOS, :InvestigationHandlers)
 
 # ---------------- NEW: Config & Helpers for Async Mode ----------------
 const MULTI_DETECTIVE_TYPES = ["poirot","marple","spade","marlowee","dupin","shadow","raven"]
 const INTERNAL_TO_DISPLAY = Dict("marlowee"=>"marlowe")
+# Optional per-detective start delay (seconds) for demos that want visibly staggered progress
+const DETECTIVE_START_STAGGER_S = try parse(Float64, get(ENV, "DETECTIVE_START_STAGGER_S", "0")) catch; 0.0 end
 _display_id(id::String) = get(INTERNAL_TO_DISPLAY, id, id)
 
 function _compute_consensus(individual::Dict{String,Any})
@@ -26,6 +31,22 @@ function _compute_consensus(individual::Dict{String,Any})
     return mean(rs), mean(cs), length(valid), length(vals)-length(valid)
 end
 
+# Incremental-progress variant: consensus averages (over non-failed agents, as above)
+# and strict completed/not-completed counts gathered in a single pass
+function _consensus_with_counts(individual::Dict{String,Any})
+    risk_sum = 0.0; conf_sum = 0.0; valid = 0; succ = 0
+    for v in values(individual)
+        status = get(v, "status", "")
+        status == "completed" && (succ += 1)
+        status == "failed" && continue
+        risk_sum += get(v, "risk_score", 0.0)
+        conf_sum += get(v, "confidence", 0.0)
+        valid += 1
+    end
+    valid == 0 && return 0.0, 0.0, succ, length(individual) - succ
+    return risk_sum / valid, conf_sum / valid, succ, length(individual) - succ
+end
+
 # Normalized response struct
 struct UnifiedInvestigationResponse
     success::Bool
@@ -46,7 +67,7 @@ end
 StructTypes.StructType(::Type{UnifiedInvestigationResponse}) = StructTypes.Struct()
 
 function _now(); Dates.now(); end
-function _gen_id(); "INV_" * Dates.format(_now(), "yyyymmdd_HHMMSS"); end
+function _gen_id(); time_ordered_id("INV"); end
 
 # Build normalized block (frontend expects results.raw + results.normalized)
 function build_normalized(raw::Dict, id::String, wallet::String, inv_type::String)
@@ -153,8 +174,7 @@ function _start_async_investigation(id::String, wallet::String, inv_type::String
 
     for detective_type in MULTI_DETECTIVE_TYPES
         Threads.@spawn begin
-            # Stagger start slightly to ensure observable incremental progress
-            sleep(0.15)
+            DETECTIVE_START_STAGGER_S > 0 && sleep(DETECTIVE_START_STAGGER_S)
             local res::Dict{String,Any}
             try
                 res = DetectiveAgents.investigate_wallet(detective_type, wallet, id)
@@ -181,11 +201,8 @@ function _start_async_investigation(id::String, wallet::String, inv_type::String
             raw = store["results"]["raw"]
             raw_individual = raw["individual_results"]
             raw_individual[out_id] = res
-            # Recompute consensus but also strict success/failure counts
-            avg_risk, avg_conf, _, _ = _compute_consensus(raw_individual)
-            # Strict classification
-            succ = count(v->get(v, "status", "") == "completed", values(raw_individual))
-            failed = count(v->get(v, "status", "") != "completed", values(raw_individual))
+            # Recompute consensus and strict success/failure counts in one pass
+            avg_risk, avg_conf, succ, failed = _consensus_with_counts(raw_individual)
             raw["consensus_risk_score"] = avg_risk
             raw["consensus_confidence"] = avg_conf
             raw["successful_investigations"] = succ
@@ -4,7 +4,7 @@ module Utils # Changed module name from ApiUtils
 using HTTP
 using JSON3
 
-export json_response, error_response, parse_request_body
+export json_response, error_response, parse_request_body, time_ordered_id
 export ERROR_CODE_INVALID_INPUT, ERROR_CODE_NOT_FOUND, ERROR_CODE_UNAUTHORIZED, ERROR_CODE_FORBIDDEN, ERROR_CODE_SERVER_ERROR, ERROR_CODE_EXTERNAL_SERVICE_ERROR
 
 # Standardized Error Codes
@@ -63,4 +63,21 @@ function parse_request_body(req::HTTP.Request)
     end
 end
 
+
+# Sequence for IDs minted in the same millisecond by this process
+const _ID_SEQ = Threads.Atomic{Int}(0)
+
+"""
+    time_ordered_id(prefix::String) -> String
+
+Creates `PREFIX_<ms>_<pid>_<seq>`: wall-clock milliseconds as fixed-width hex, so IDs
+sort by creation time, then the process id and a per-process sequence, so IDs from
+concurrent requests, other processes or a restarted server never collide.
+"""
+function time_ordered_id(prefix::String)
+    stamp = string(round(Int, time() * 1000), base=16, pad=11)
+    seq = Threads.atomic_add!(_ID_SEQ, 1)
+    return "$(prefix)_$(stamp)_$(string(getpid(), base=36))_$(seq)"
+end
+
 end
@@ -77,6 +77,10 @@ export SUPPORTED_CHAINS_CONFIG, get_rpc_endpoint, get_chain_name_from_id
 
 const SUPPORTED_CHAINS_CONFIG = Ref(Dict{String, Dict{String,Any}}()) # To be populated by _load_blockchain_config
 
+# Keep-alive pool for the generic JSON-RPC helper, so repeated balance/call lookups against
+# the same node reuse one TLS connection instead of handshaking per request
+const BLOCKCHAIN_RPC_HTTP_POOL = HTTP.Pool(try parse(Int, get(ENV, "BLOCKCHAIN_RPC_HTTP_POOL_SIZE", "16")) catch; 16 end)
+
 function _load_blockchain_config()
     app_config = _app_config_load() # Pode ser nothing
 
@@ -242,7 +246,8 @@ function _make_generic_rpc_request(endpoint_url::String, method::String, params:
             endpoint_url,
             ["Content-Type" => "application/json"],
             JSON3.write(request_body);
-            timeout = 20 # Default timeout
+            timeout = 20, # Default timeout
+            pool = BLOCKCHAIN_RPC_HTTP_POOL
         )
         response_json = JSON3.read(String(response.body))
 
@@ -38,6 +38,10 @@ const _RETRY_BASE = try parse(Int, get(ENV, "SOLANA_RETRY_BASE_MS", "250")) catc
 const _RETRY_BASE_S = _RETRY_BASE / 1000
 const _COMMITMENT = get(ENV, "SOLANA_COMMITMENT", "confirmed")
 const _SIG_CACHE_TTL_S = try parse(Int, get(ENV, "SOLANA_SIGNATURE_CACHE_TTL_S", "60")) catch; 60 end
+# JSON-RPC batch POSTs in flight at once in get_transactions_details
+const _BATCH_CONCURRENCY = try parse(Int, get(ENV, "SOLANA_BATCH_CONCURRENCY", "4")) catch; 4 end
+# Single getTransaction fallbacks in flight at once per failed batch chunk
+const _SINGLE_FALLBACK_CONCURRENCY = try parse(Int, get(ENV, "SOLANA_SINGLE_FALLBACK_CONCURRENCY", "4")) catch; 4 end
 
 # ========================================
 # SOLANA CLIENT STRUCT
@@ -144,6 +148,8 @@ end
     get_wallet_signatures_paginated(client, wallet_address; limit=500, page_size=100) -> Vector
 
 Fetch up to `limit` signatures using repeated real RPC calls with the `before` cursor.
+Pages can come from different endpoints of the pool whose views overlap, so signatures
+already collected are dropped; a page that adds nothing new ends the walk.
 Caches the combined signature list for a short TTL to mitigate rapid re-queries in tests.
 """
 function get_wallet_signatures_paginated(client::SolanaClient, wallet_address::String; limit::Int=500, page_size::Int=100)
@@ -154,6 +160,7 @@ function get_wallet_signatures_paginated(client::SolanaClient, wallet_address::S
     end
 
     collected = Any[]
+    seen = Set{String}()
     before_sig = nothing
     while length(collected) < limit
         batch_limit = min(page_size, limit - length(collected))
@@ -164,11 +171,22 @@ function get_wallet_signatures_paginated(client::SolanaClient, wallet_address::S
     result = make_rpc_call(client, "getSignaturesForAddress", params)
     sigs = (result === nothing) ? Any[] : result
         isempty(sigs) && break
-        append!(collected, sigs)
+        added = 0
+        for s in sigs
+            length(collected) >= limit && break
+            if s isa AbstractDict && haskey(s, "signature")
+                sig = String(s["signature"])
+                sig in seen && continue
+                push!(seen, sig)
+            end
+            push!(collected, s)
+            added += 1
+        end
+        added == 0 && break
         # Prepare next page cursor (last signature of current batch)
         last_entry = sigs[end]
-        if last_entry isa Dict && haskey(last_entry, "signature")
-            before_sig = last_entry["signature"]
+        if last_entry isa AbstractDict && haskey(last_entry, "signature")
+            before_sig = String(last_entry["signature"])
         else
             break
         end
@@ -190,7 +208,7 @@ Get wallet balance in SOL using REAL Solana RPC.
 """
 function get_wallet_balance(client::SolanaClient, wallet_address::String)
     try
-        @info "Getting REAL balance for wallet" wallet=wallet_address
+        @debug "Getting REAL balance for wallet" wallet=wallet_address
         result = make_rpc_call(client, "getBalance", [wallet_address, Dict{String,Any}("commitment" => client.commitment)])
         if result !== nothing && (haskey(result, "value") || haskey(result, :value))
             lamports = haskey(result, "value") ? result["value"] : result[:value]
@@ -312,7 +330,7 @@ Get detailed transaction information by signature.
 """
 function get_transaction_details(client::SolanaClient, signature::String)
     try
-        @info "Getting transaction details for signature" signature=signature
+        @debug "Getting transaction details for signature" signature=signature
         cfg = Dict{String,Any}("encoding" => "json", "commitment" => client.commitment)
         tx = make_rpc_call(client, "getTransaction", [signature, cfg])
         if tx === nothing
@@ -326,4 +344,43 @@ function get_transaction_details(client::SolanaClient, signature::String)
     end
 end
 
+"""
+    get_transactions_details(client::SolanaClient, signatures::Vector{String}; batch_size::Int=20) -> Vector
+
+Details for many signatures, in order. Each `batch_size` chunk is one JSON-RPC batch POST;
+at most `_BATCH_CONCURRENCY` chunks are in flight at once. Signatures the batch could not
+serve (node rejected the item, or the whole batch request failed) fall back to
+`get_transaction_details`, at most `_SINGLE_FALLBACK_CONCURRENCY` per chunk at once, so
+one bad chunk never fails the others.
+"""
+function get_transactions_details(client::SolanaClient, signatures::Vector{String}; batch_size::Int=20)
+    cfg = Dict{String,Any}("encoding" => "json", "commitment" => client.commitment)
+    chunks = collect(Iterators.partition(signatures, max(1, batch_size)))
+    gate = Base.Semaphore(max(1, _BATCH_CONCURRENCY))
+    tasks = [Threads.@spawn Base.acquire(() -> _chunk_details(client, chunk, cfg), gate) for chunk in chunks]
+
+    details = Vector{Any}(undef, 0)
+    sizehint!(details, length(signatures))
+    for task in tasks
+        append!(details, fetch(task))
+    end
+    return details
+end
+
+function _chunk_details(client::SolanaClient, chunk, cfg::Dict{String,Any})
+    envelopes = try
+        ProviderPool.rpc_batch_request([("getTransaction", Any[s, cfg]) for s in chunk]; retries=client.retry_max)
+    catch e
+        @warn "Batch getTransaction failed; falling back to single requests" size=length(chunk) error=e
+        nothing
+    end
+    # The chunk already holds a permit of the batch gate, so the fallbacks get their own
+    # small gate rather than waiting on that one
+    gate = Base.Semaphore(max(1, _SINGLE_FALLBACK_CONCURRENCY))
+    singles = Dict(i => Threads.@spawn(Base.acquire(() -> get_transaction_details(client, chunk[i]), gate))
+                   for i in eachindex(chunk) if envelopes === nothing || haskey(envelopes[i], "error"))
+    return Any[something(haskey(singles, i) ? fetch(singles[i]) : envelopes[i]["result"], Dict())
+               for i in eachindex(chunk)]
+end
+
 end # module SolanaService
@@ -181,8 +181,13 @@ function create_all_detective_agents()
 
     @info "🕵️ Creating all detective agents..."
 
-    for detective_type in detective_types
-        agent = create_detective_agent(detective_type)
+    # Construction is independent per detective, so start them all at once and
+    # only touch the shared Dict while collecting results on this task.
+    tasks = [(detective_type, Threads.@spawn create_detective_agent(detective_type))
+             for detective_type in detective_types]
+
+    for (detective_type, task) in tasks
+        agent = fetch(task)
         if !isnothing(agent)
             agents[detective_type] = agent
             @info "✅ Created detective: $detective_type"
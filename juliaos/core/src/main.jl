@@ -14,10 +14,13 @@ module ThreadOptimizer
 using Base.Threads
 const MIN_COMPUTE_DEFAULT = 4
 const MIN_INTERACTIVE_DEFAULT = 1
+# Thread pools arrived in Julia 1.9; older runtimes have no interactive pool
+interactive_threads() = VERSION >= v"1.9" ? Threads.nthreads(:interactive) : 0
 function ensure_threads(; auto::Bool=true)
     thread_spec = get(ENV, "JULIA_NUM_THREADS", "")
     compute_threads = nthreads()
-    has_interactive = occursin(",", thread_spec)
+    # `--threads=N,M` on the command line does not populate JULIA_NUM_THREADS
+    has_interactive = occursin(",", thread_spec) || interactive_threads() > 0
     min_compute = try parse(Int, get(ENV, "JULIAOS_MIN_COMPUTE_THREADS", string(MIN_COMPUTE_DEFAULT))) catch; MIN_COMPUTE_DEFAULT end
     min_interactive = try parse(Int, get(ENV, "JULIAOS_MIN_INTERACTIVE_THREADS", string(MIN_INTERACTIVE_DEFAULT))) catch; MIN_INTERACTIVE_DEFAULT end
     if compute_threads >= min_compute && (has_interactive || min_interactive == 0)
@@ -56,7 +59,7 @@ function ensure_threads(; auto::Bool=true)
 end
 end # module
 
-using .ThreadOptimizer: ensure_threads
+using .ThreadOptimizer: ensure_threads, interactive_threads
 
 # ----------------------------
 # Early .env loader
@@ -133,7 +136,8 @@ function main()
     # Thread config log
     spec = get(ENV, "JULIA_NUM_THREADS", "(unset)")
     has_interactive = occursin(",", spec)
-    compute = nthreads(); interactive = 0; total = compute
+    compute = nthreads(); interactive = interactive_threads(); total = compute + interactive
+    has_interactive |= interactive > 0
     if has_interactive
         parts = split(spec, ","); if length(parts)==2; try
             compute = parse(Int, parts[1]); interactive = parse(Int, parts[2]); total = compute + interactive
@@ -2,7 +2,7 @@ module ProviderPool
 
 using Dates, HTTP, JSON3, Logging, Statistics
 
-export SolanaEndpoint, SolanaProviderPool, next_endpoint, record_success!, record_failure!, warmup_endpoints!, rpc_request, init_solana_pool, get_balance, get_signatures_for_address, get_transaction, SOLANA_POOL
+export SolanaEndpoint, SolanaProviderPool, next_endpoint, record_success!, record_failure!, warmup_endpoints!, rpc_request, rpc_batch_request, init_solana_pool, get_balance, get_signatures_for_address, get_transaction, SOLANA_POOL
 
 mutable struct SolanaEndpoint
     url::String
@@ -48,7 +48,7 @@ end
 function _rpc_ping(url::String)
     body = JSON3.write((jsonrpc="2.0", id=1, method="getHealth", params=[]))
     try
-        r = HTTP.request("POST", url; body=body, headers=Dict("Content-Type"=>"application/json"), readtimeout=3, connecttimeout=2)
+        r = HTTP.request("POST", url; body=body, headers=Dict("Content-Type"=>"application/json"), readtimeout=3, connecttimeout=2, pool=RPC_HTTP_POOL)
         return r.status == 200
     catch
         return false
@@ -89,6 +89,23 @@ const _BASE_BACKOFF = try parse(Float64, get(ENV, "SOLANA_PROVIDER_BASE_BACKOFF_
 const _JITTER = try parse(Float64, get(ENV, "SOLANA_PROVIDER_JITTER_S", "0.04")) catch; 0.04 end
 const _RATE_LIMIT_SLEEP = try parse(Float64, get(ENV, "SOLANA_PROVIDER_RATELIMIT_SLEEP_S", "0.35")) catch; 0.35 end
 const _LAT_HISTORY = Ref{Vector{Float64}}(Float64[])
+# Dedicated keep-alive pool for RPC endpoints so concurrent detective fan-out
+# reuses TLS connections instead of queueing on HTTP.jl's small default per-host limit.
+const _HTTP_POOL_SIZE = try parse(Int, get(ENV, "SOLANA_PROVIDER_HTTP_POOL_SIZE", "32")) catch; 32 end
+const RPC_HTTP_POOL = HTTP.Pool(_HTTP_POOL_SIZE)
+
+# Failures worth trying another endpoint for: transport/HTTP errors and malformed bodies
+# (JSON3 raises ArgumentError). Anything else - a MethodError, an InterruptException -
+# is a bug or a cancellation and propagates instead of being retried with backoff.
+_retryable(e) = e isa HTTP.Exceptions.HTTPError || e isa Base.IOError || e isa EOFError || e isa ArgumentError
+
+function _backoff(e, attempt::Int)
+    if e isa HTTP.Exceptions.StatusError && e.status in (429, 503)
+        sleep(_RATE_LIMIT_SLEEP)
+    else
+        sleep(_BASE_BACKOFF * 2.0^(attempt-1) + rand()*_JITTER)
+    end
+end
 
 function _record_latency(ms)
     h = _LAT_HISTORY[]; push!(h, ms); length(h) > 200 && deleteat!(h, 1:length(h)-200)
@@ -103,7 +120,7 @@ function rpc_request(method::String, params::Vector{Any}; id::Int=1, retries::In
         ep = next_endpoint(pool)
         t0 = time()
         try
-            resp = HTTP.request("POST", ep.url; body=payload, headers=Dict("Content-Type"=>"application/json"), readtimeout=_MAX_READ_TIMEOUT, connecttimeout=_CONNECT_TIMEOUT)
+            resp = HTTP.request("POST", ep.url; body=payload, headers=Dict("Content-Type"=>"application/json"), readtimeout=_MAX_READ_TIMEOUT, connecttimeout=_CONNECT_TIMEOUT, pool=RPC_HTTP_POOL)
             latency = (time()-t0)*1000
             if resp.status == 200
                 record_success!(pool, ep; latency_ms=latency)
@@ -133,9 +150,10 @@ function rpc_request(method::String, params::Vector{Any}; id::Int=1, retries::In
                 end
             end
         catch e
+            _retryable(e) || rethrow()
             record_failure!(pool, ep)
             last_err = e
-            sleep(_BASE_BACKOFF * 2.0^(attempt-1) + rand()*_JITTER)
+            _backoff(e, attempt)
         end
     end
     return Dict(
@@ -147,6 +165,67 @@ function rpc_request(method::String, params::Vector{Any}; id::Int=1, retries::In
     )
 end
 
+"""
+    rpc_batch_request(calls; retries=3) -> Vector{Dict}
+
+Sends `calls` (a vector of `(method, params)` pairs) as one JSON-RPC batch POST and
+returns one envelope per call, in order, shaped like `rpc_request`'s. Items the node
+rejected carry an "error" key. Endpoints that refuse batches are skipped like failed
+ones; if none accepts the batch every envelope carries the last error.
+"""
+function rpc_batch_request(calls::Vector; retries::Int=3)
+    isnothing(SOLANA_POOL[]) && init_solana_pool()
+    pool = SOLANA_POOL[]
+    n = length(calls)
+    payload = JSON3.write([(jsonrpc="2.0", id=i, method=m, params=p) for (i, (m, p)) in enumerate(calls)])
+    last_err = nothing
+    for attempt in 1:retries
+        ep = next_endpoint(pool)
+        t0 = time()
+        try
+            resp = HTTP.request("POST", ep.url; body=payload, headers=Dict("Content-Type"=>"application/json"), readtimeout=_MAX_READ_TIMEOUT, connecttimeout=_CONNECT_TIMEOUT, pool=RPC_HTTP_POOL)
+            latency = (time()-t0)*1000
+            if resp.status == 200
+                data = JSON3.read(String(resp.body))
+                if data isa AbstractVector
+                    record_success!(pool, ep; latency_ms=latency)
+                    _record_latency(latency)
+                    out = [Dict{String,Any}("jsonrpc"=>"2.0", "id"=>i, "result"=>nothing,
+                                            "error"=>Dict("message"=>"missing from batch response")) for i in 1:n]
+                    for item in data
+                        i = get(item, :id, 0)
+                        i isa Integer && 1 <= i <= n || continue
+                        out[i] = haskey(item, :error) ?
+                            Dict{String,Any}("jsonrpc"=>"2.0", "id"=>i, "result"=>nothing, "error"=>item[:error]) :
+                            Dict{String,Any}("jsonrpc"=>"2.0", "id"=>i, "result"=>get(item, :result, nothing))
+                    end
+                    return out
+                end
+                # A single error object back means this endpoint does not take batches
+                last_err = get(data, :error, "non-array batch response")
+            else
+                record_failure!(pool, ep)
+                last_err = resp.status
+                if resp.status in (429, 503)
+                    sleep(_RATE_LIMIT_SLEEP)
+                end
+            end
+        catch e
+            _retryable(e) || rethrow()
+            record_failure!(pool, ep)
+            last_err = e
+            _backoff(e, attempt)
+        end
+    end
+    return [Dict{String,Any}(
+        "jsonrpc"=>"2.0",
+        "id"=>i,
+        "result"=>nothing,
+        "error"=>Dict("message"=>string(last_err)),
+        "_meta"=>Dict("failed"=>true, "attempts"=>retries)
+    ) for i in 1:n]
+end
+
 get_signatures_for_address(addr::String; limit::Int=25) = begin
     resp = rpc_request("getSignaturesForAddress", Any[addr, (; limit=limit)])
     haskey(resp, "result") ? resp["result"] : Any[]
@@ -10,6 +10,13 @@ following the same pattern as the Gemini integration.
 using HTTP
 using JSON3
 
+# Keep-alive pool shared by every call through this module; reuses the Resources-wide
+# pool when loaded from there
+const OPENAI_HTTP_POOL = let host = parentmodule(@__MODULE__)
+    isdefined(host, :AI_HTTP_POOL) ? getfield(host, :AI_HTTP_POOL) :
+        HTTP.Pool(try parse(Int, get(ENV, "AI_HTTP_POOL_SIZE", "16")) catch; 16 end)
+end
+
 struct OpenAIConfig
     api_key::String
     model_name::String
@@ -57,7 +64,8 @@ function openai_util(config::OpenAIConfig, prompt::String)
             "$(config.base_url)/chat/completions",
             headers,
             JSON3.write(payload);
-            timeout = 30
+            timeout = 30,
+            pool = OPENAI_HTTP_POOL
         )
 
         if response.status == 200
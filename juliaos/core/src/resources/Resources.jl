@@ -1,10 +1,19 @@
 module Resources
 
+using HTTP
+using SHA
+
+# One keep-alive pool for every provider submodule below, so OpenAI and Grok calls
+# share a single connection budget instead of each opening its own pool
+const AI_HTTP_POOL = HTTP.Pool(try parse(Int, get(ENV, "AI_HTTP_POOL_SIZE", "16")) catch; 16 end)
+
+include("../utils/TTLCaches.jl")
 include("types/Errors.jl")
 include("types/Telegram.jl")
 include("OpenAI.jl")
 include("Grok.jl")
 
+using .TTLCaches
 using .Telegram
 using .OpenAI
 using .Grok
@@ -13,6 +22,44 @@ using .Grok
 # 🤖 FUNÇÃO CENTRALIZADA PARA CHAMADAS DE IA
 # ========================================
 
+# Process-wide throttle for provider calls: at most AI_MAX_CONCURRENCY requests in
+# flight and, when AI_RPM > 0, request starts spaced to stay under that rate, so
+# concurrent fan-outs don't turn into 429 retry storms.
+const AI_MAX_CONCURRENCY = try parse(Int, get(ENV, "AI_MAX_CONCURRENCY", "16")) catch; 16 end
+const AI_RPM = try parse(Float64, get(ENV, "AI_RPM", "0")) catch; 0.0 end
+const AI_CALL_GATE = Base.Semaphore(max(1, AI_MAX_CONCURRENCY))
+const _AI_RATE_LOCK = ReentrantLock()
+const _AI_NEXT_SLOT = Ref(0.0)
+
+function _await_rate_slot()
+    AI_RPM > 0 || return
+    wait_s = lock(_AI_RATE_LOCK) do
+        now_t = time()
+        slot = max(now_t, _AI_NEXT_SLOT[])
+        _AI_NEXT_SLOT[] = slot + 60.0 / AI_RPM
+        slot - now_t
+    end
+    wait_s > 0 && sleep(wait_s)
+end
+
+# Content-addressed memo of AI responses: identical provider+key+prompt triples within
+# AI_RESPONSE_CACHE_TTL_S return the stored completion instead of another round-trip.
+# Opt-in: the default TTL of 0 disables caching. The API key is part of the hash so
+# callers with their own key never read completions made under another one.
+const AI_RESPONSE_CACHE_TTL_S = try parse(Float64, get(ENV, "AI_RESPONSE_CACHE_TTL_S", "0")) catch; 0.0 end
+const AI_RESPONSE_CACHE_MAX = try parse(Int, get(ENV, "AI_RESPONSE_CACHE_MAX", "4096")) catch; 4096 end
+const _AI_RESPONSE_CACHE = TTLCache{String,String}(AI_RESPONSE_CACHE_TTL_S, AI_RESPONSE_CACHE_MAX)
+
+_ai_cache_key(provider::String, api_key::String, prompt::String) =
+    bytes2hex(sha256(string(provider, '|', api_key, '|', prompt)))
+
+"""
+    ai_response_cache_stats() -> Dict{String,Any}
+
+Hit/miss counters, hit rate and current size of the AI response memo.
+"""
+ai_response_cache_stats() = cache_stats(_AI_RESPONSE_CACHE)
+
 """
     call_ai(provider::String, prompt::String; api_key::String="") -> String
 
@@ -30,9 +77,27 @@ response = call_ai("grok", "Risk assessment for transactions", api_key="custom_k
 ```
 """
 function call_ai(provider::String, prompt::String; api_key::String="")
-    println("🤖 [AI CALL] Provider: $provider")
-    println("📝 [AI CALL] Prompt length: $(length(prompt)) chars")
-    println("🔑 [AI CALL] API Key: $(isempty(api_key) ? "from ENV" : "provided")")
+    AI_RESPONSE_CACHE_TTL_S > 0 || return _call_ai_gated(provider, prompt; api_key=api_key)
+    key = _ai_cache_key(provider, api_key, prompt)
+    cached = cache_get(_AI_RESPONSE_CACHE, key)
+    if cached !== nothing
+        @debug "AI call cache hit" provider prompt_chars=length(prompt)
+        return cached
+    end
+    result = _call_ai_gated(provider, prompt; api_key=api_key)
+    cache_put!(_AI_RESPONSE_CACHE, key, result)
+    return result
+end
+
+function _call_ai_gated(provider::String, prompt::String; api_key::String="")
+    Base.acquire(AI_CALL_GATE) do
+        _await_rate_slot()
+        _call_ai_direct(provider, prompt; api_key=api_key)
+    end
+end
+
+function _call_ai_direct(provider::String, prompt::String; api_key::String="")
+    @debug "AI call" provider prompt_chars=length(prompt) api_key_source=(isempty(api_key) ? "env" : "provided")
 
     try
         if provider == "openai"
@@ -45,8 +110,7 @@ function call_ai(provider::String, prompt::String; api_key::String="")
             config = OpenAI.OpenAIConfig(api_key=key)
             result = OpenAI.openai_util(config, prompt)
 
-            println("✅ [AI CALL] OpenAI responded successfully")
-            println("📊 [AI CALL] Response length: $(length(result)) chars")
+            @debug "AI call completed" provider response_chars=length(result)
             return result
 
         elseif provider == "grok"
@@ -59,8 +123,7 @@ function call_ai(provider::String, prompt::String; api_key::String="")
             config = Grok.GrokConfig(api_key=key)
             result = Grok.grok_util(config, prompt)
 
-            println("✅ [AI CALL] Grok responded successfully")
-            println("📊 [AI CALL] Response length: $(length(result)) chars")
+            @debug "AI call completed" provider response_chars=length(result)
             return result
 
         else
@@ -68,7 +131,7 @@ function call_ai(provider::String, prompt::String; api_key::String="")
         end
 
     catch e
-        println("❌ [AI CALL] ERROR: $e")
+        @error "AI call failed" provider exception=e
         rethrow(e)
     end
 end
@@ -77,65 +140,93 @@ end
 # 📊 ENHANCED AI FEATURES (migrated from Python)
 # ========================================
 
+const AI_RETRY_INITIAL_S = 0.5
+const AI_RETRY_MAX_S = 8.0
+
+"""
+    _retry_delay(e, attempt) -> Union{Float64, Nothing}
+
+Seconds to wait before retrying after error `e`, or `nothing` when the error is not
+transient (bad key, unknown provider, 4xx other than 429). Rate limits honour the
+provider's Retry-After header; otherwise exponential backoff with full jitter.
 """
-    call_ai_with_retry(provider::String, prompt::String; max_retries::Int=3, api_key::String="") -> String
+function _retry_delay(e, attempt::Int)
+    backoff = rand() * min(AI_RETRY_MAX_S, AI_RETRY_INITIAL_S * 2.0^(attempt - 1))
+    if e isa HTTP.StatusError
+        (e.status == 429 || e.status >= 500) || return nothing
+        retry_after = tryparse(Float64, HTTP.header(e.response, "Retry-After", ""))
+        return retry_after === nothing ? backoff : min(retry_after, 60.0)
+    elseif e isa HTTP.TimeoutError || e isa HTTP.ConnectError || e isa Base.IOError
+        return backoff
+    elseif e isa ErrorException && occursin(r"timeout|Failed to connect|error \((429|5\d\d)\)", e.msg)
+        return backoff
+    end
+    return nothing
+end
+
+"""
+    call_ai_with_retry(provider::String, prompt::String; max_retries::Int=4, api_key::String="") -> String
 
 Enhanced AI call with retry logic and better error handling.
+Only transient failures (timeouts, connection errors, 429 and 5xx) are retried.
 Migrated from backend/services/ai_service.py
 """
 function call_ai_with_retry(
     provider::String,
     prompt::String;
-    max_retries::Int = 3,
+    max_retries::Int = 4,
     api_key::String = ""
 )
     for attempt in 1:max_retries
         try
-            println("🔄 [AI RETRY] Attempt $attempt/$max_retries")
+            @debug "AI call attempt" provider attempt max_retries
             return call_ai(provider, prompt; api_key=api_key)
         catch e
-            if attempt == max_retries
-                println("❌ [AI RETRY] All attempts failed")
+            delay = _retry_delay(e, attempt)
+            if attempt == max_retries || delay === nothing
+                @error "AI call giving up" provider attempt
                 rethrow(e)
             else
-                println("⚠️ [AI RETRY] Attempt $attempt failed, retrying... Error: $e")
-                sleep(1.0 * attempt) # Exponential backoff
+                @warn "AI call attempt failed, retrying" provider attempt delay_s=round(delay, digits=2) exception=e
+                sleep(delay)
             end
         end
     end
 end
 
+const AI_BATCH_CONCURRENCY = try parse(Int, get(ENV, "AI_BATCH_CONCURRENCY", "4")) catch; 4 end
+
 """
-    call_ai_batch(provider::String, prompts::Vector{String}; api_key::String="") -> Vector{String}
+    call_ai_batch(provider::String, prompts::Vector{String}; api_key::String="", max_concurrency::Int=AI_BATCH_CONCURRENCY) -> Vector{String}
 
 Process multiple prompts in batch for efficiency.
+Prompts are issued concurrently, at most `max_concurrency` in flight at once, and
+results keep the order of `prompts`.
 """
 function call_ai_batch(
     provider::String,
     prompts::Vector{String};
-    api_key::String = ""
+    api_key::String = "",
+    max_concurrency::Int = AI_BATCH_CONCURRENCY
 )
-    results = String[]
-
-    println("📦 [AI BATCH] Processing $(length(prompts)) prompts")
+    n = length(prompts)
+    @info "AI batch started" n max_concurrency
 
-    for (i, prompt) in enumerate(prompts)
+    gate = Base.Semaphore(max(1, max_concurrency))
+    run_one(i, prompt) = Base.acquire(gate) do
         try
-            println("🔄 [AI BATCH] Processing prompt $i/$(length(prompts))")
-            result = call_ai(provider, prompt; api_key=api_key)
-            push!(results, result)
+            @debug "AI batch prompt" i n
+            call_ai(provider, prompt; api_key=api_key)
         catch e
-            println("❌ [AI BATCH] Failed prompt $i: $e")
-            push!(results, "ERROR: $e")
-        end
-
-        # Rate limiting - small delay between calls
-        if i < length(prompts)
-            sleep(0.5)
+            @warn "AI batch prompt failed" i exception=e
+            "ERROR: $e"
         end
     end
 
-    println("✅ [AI BATCH] Completed $(length(results)) results")
+    tasks = [Threads.@spawn run_one(i, prompt) for (i, prompt) in enumerate(prompts)]
+
+    results = String[fetch(t) for t in tasks]
+    @info "AI batch completed" results=length(results)
     return results
 end
 
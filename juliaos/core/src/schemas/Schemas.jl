@@ -24,43 +24,25 @@ using .Validators
     CRITICAL = 6
 end
 
+# Lookup tables for risk level <-> string conversion, built once at load
+const RISK_LEVEL_STRINGS = Dict(
+    VERY_LOW => "very_low",
+    LOW => "low",
+    MEDIUM => "medium",
+    HIGH => "high",
+    VERY_HIGH => "very_high",
+    CRITICAL => "critical"
+)
+const RISK_LEVELS_BY_STRING = Dict(name => level for (level, name) in RISK_LEVEL_STRINGS)
+
 # Convert risk level to string
-function risk_level_to_string(level::RiskLevel)::String
-    return if level == VERY_LOW
-        "very_low"
-    elseif level == LOW
-        "low"
-    elseif level == MEDIUM
-        "medium"
-    elseif level == HIGH
-        "high"
-    elseif level == VERY_HIGH
-        "very_high"
-    elseif level == CRITICAL
-        "critical"
-    else
-        "unknown"
-    end
-end
+risk_level_to_string(level::RiskLevel)::String = get(RISK_LEVEL_STRINGS, level, "unknown")
 
 # Convert string to risk level
 function string_to_risk_level(s::String)::RiskLevel
-    lower_s = lowercase(s)
-    return if lower_s == "very_low"
-        VERY_LOW
-    elseif lower_s == "low"
-        LOW
-    elseif lower_s == "medium"
-        MEDIUM
-    elseif lower_s == "high"
-        HIGH
-    elseif lower_s == "very_high"
-        VERY_HIGH
-    elseif lower_s == "critical"
-        CRITICAL
-    else
-        throw(ArgumentError("Invalid risk level: $s"))
-    end
+    level = get(RISK_LEVELS_BY_STRING, lowercase(s), nothing)
+    level === nothing && throw(ArgumentError("Invalid risk level: $s"))
+    return level
 end
 
 # Transaction information structure
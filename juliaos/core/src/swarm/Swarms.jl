@@ -153,12 +153,15 @@ mutable struct SwarmConfig
     max_iterations::Int
     target_fitness::Union{Float64, Nothing}
     problem_definition::OptimizationProblem
+    # Opt-in: evaluate local positions across threads. The objective function is then
+    # called concurrently and must be thread-safe (no unsynchronized shared state).
+    parallel_evaluation::Bool
 
     function SwarmConfig(name::String, algorithm_type::String, problem_def::OptimizationProblem;
                          algorithm_params::Dict{String,Any}=Dict{String,Any}(),
                          objective_desc::String="Default Objective",
-                         max_iter::Int=100, target_fit=nothing)
-        new(name, algorithm_type, algorithm_params, objective_desc, max_iter, target_fit, problem_def)
+                         max_iter::Int=100, target_fit=nothing, parallel_eval::Bool=false)
+        new(name, algorithm_type, algorithm_params, objective_desc, max_iter, target_fit, problem_def, parallel_eval)
     end
 end
 
@@ -227,6 +230,7 @@ function _save_swarms_state()
                 "config"=>Dict("name"=>cfg.name, "algorithm_type"=>cfg.algorithm_type,
                                "algorithm_params"=>cfg.algorithm_params, "objective_description"=>cfg.objective_description,
                                "max_iterations"=>cfg.max_iterations, "target_fitness"=>cfg.target_fitness,
+                               "parallel_evaluation"=>cfg.parallel_evaluation,
                                "problem_definition"=>_serialize_optimization_problem(cfg.problem_definition)),
                 "agents"=>swarm.agents, "current_iteration"=>swarm.current_iteration,
                 "best_solution_found"=>isnothing(sol) ? nothing :
@@ -252,7 +256,8 @@ function _load_swarms_state()
                 isnothing(deser_prob) && (@warn "Skipping swarm $id_str: problem deserialization error."; continue)
                 config = SwarmConfig(cfg_data["name"], cfg_data["algorithm_type"], deser_prob;
                                      algorithm_params = cfg_data["algorithm_params"], objective_desc=cfg_data["objective_description"],
-                                     max_iter=cfg_data["max_iterations"], target_fit=cfg_data["target_fitness"])
+                                     max_iter=cfg_data["max_iterations"], target_fit=cfg_data["target_fitness"],
+                                     parallel_eval=get(cfg_data, "parallel_evaluation", false))
                 swarm = Swarm(sd["id"], sd["name"], config)
                 swarm.status = SwarmStatus(sd["status"]); swarm.created_at = DateTime(sd["created_at"]); swarm.updated_at = DateTime(sd["updated_at"])
                 swarm.agents = get(sd, "agents", String[]); swarm.current_iteration = get(sd, "current_iteration", 0)
@@ -602,7 +607,7 @@ function _distribute_and_collect_evaluations(swarm::Swarm, positions_to_evaluate
     if isempty(swarm.agents)
         @warn "Swarm $(swarm.id) has no agents (and Redis backend failed/disabled). Performing direct local evaluation for $(num_positions) positions."
         objective_func_actual = swarm.config.problem_definition.objective_function
-        for i in 1:num_positions
+        function eval_position(i)
             try
                 evaluated_fitnesses[i] = objective_func_actual(positions_to_evaluate[i])
             catch ex
@@ -610,6 +615,15 @@ function _distribute_and_collect_evaluations(swarm::Swarm, positions_to_evaluate
                 # Penalty already set
             end
         end
+        # Positions are independent and each writes only its own slot; with
+        # parallel_evaluation (thread-safe objectives only) they run across threads
+        if swarm.config.parallel_evaluation
+            Threads.@threads for i in 1:num_positions
+                eval_position(i)
+            end
+        else
+            foreach(eval_position, 1:num_positions)
+        end
         return evaluated_fitnesses
     end
 
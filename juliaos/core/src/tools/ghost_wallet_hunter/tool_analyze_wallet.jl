@@ -28,6 +28,15 @@ using .Analysis
 # Threads alias for spawn
 const Threads = Base.Threads
 
+# TTL cache helper; use the host module's copy when it has one so caches it shares
+# with this file have the same type
+if isdefined(parentmodule(@__MODULE__), :TTLCaches)
+    using ..TTLCaches
+else
+    include("../../utils/TTLCaches.jl")
+    using .TTLCaches
+end
+
 # Lightweight shared cache to avoid repeated heavy RPC work across detectives
 const WALLET_CACHE_TTL_S = try parse(Int, get(ENV, "WALLET_CACHE_TTL_S", "300")) catch; 300 end
 const WALLET_CACHE_MAX_WAIT_S = try parse(Int, get(ENV, "WALLET_CACHE_MAX_WAIT_S", "180")) catch; 180 end
@@ -95,6 +104,13 @@ const SOLANA_RETRY_BASE_S = try parse(Int, get(ENV, "SOLANA_RETRY_BASE_MS", "250
 # Batch tuning
 const SOLANA_TX_BATCH_SIZE = try parse(Int, get(ENV, "SOLANA_TX_BATCH_SIZE", "20")) catch; 20 end
 const SOLANA_BATCH_CONCURRENCY = try parse(Int, get(ENV, "SOLANA_BATCH_CONCURRENCY", "4")) catch; 4 end
+const _ISO_TS_FORMAT = dateformat"yyyy-mm-ddTHH:MM:SS.sssZ"
+"""ISO-8601 UTC timestamp from a unix epoch (defaults to now); format is built once at load."""
+_utc_timestamp(t::Real=time()) = Dates.format(unix2datetime(t), _ISO_TS_FORMAT)
+# Pre-AI triage: wallets below this tx count with no patterns get a rule-based verdict
+const AI_TRIAGE_MIN_TXS = try parse(Int, get(ENV, "AI_TRIAGE_MIN_TXS", "3")) catch; 3 end
+# Also skip the AI when pattern scan and risk engine agree on LOW or CRITICAL (off by default)
+const AI_TRIAGE_SKIP_AGREED = lowercase(get(ENV, "AI_TRIAGE_SKIP_AGREED", "false")) == "true"
 const SOLANA_BLACKLIST = begin
     raw = get(ENV, "SOLANA_BLACKLIST", "")
     Set(lowercase.(filter(!isempty, split(raw, ","))))
@@ -295,6 +311,24 @@ end
 # ----------------------------------------
 # Account identity helper (jsonParsed)
 # ----------------------------------------
+# Account category (program/mint/token account) is effectively immutable, so
+# identities of counterparties are reused across wallets. This file is included once
+# per detective module; the parent's cache, when it provides one, is shared by all.
+const IDENTITY_CACHE_MAX = try parse(Int, get(ENV, "IDENTITY_CACHE_MAX", "4096")) catch; 4096 end
+const _IDENTITY_CACHE = let host = parentmodule(@__MODULE__)
+    isdefined(host, :SHARED_IDENTITY_CACHE) ? getfield(host, :SHARED_IDENTITY_CACHE) :
+        TTLCache{String, Dict{String,Any}}(Inf, IDENTITY_CACHE_MAX)
+end
+
+"""Cached `get_wallet_identity`; failed lookups are not cached."""
+function get_wallet_identity_cached(address::String, config::ToolAnalyzeWalletConfig)
+    hit = cache_get(_IDENTITY_CACHE, address)
+    hit !== nothing && return hit
+    identity = get_wallet_identity(address, config)
+    haskey(identity, "error") || cache_put!(_IDENTITY_CACHE, address, identity)
+    return identity
+end
+
 function get_wallet_identity(wallet_address::String, config::ToolAnalyzeWalletConfig)
     try
         params = [wallet_address, Dict{String,Any}("encoding"=>"jsonParsed", "commitment"=>SOLANA_COMMITMENT)]
@@ -526,10 +560,12 @@ function analyze_wallet_transactions(wallet_address::String, config::ToolAnalyze
         # Separate program addresses from linked addresses
         links = Vector{Dict{String,Any}}()
         program_addresses = Vector{Dict{String,Any}}()
+        seen_addresses = Set{String}()
 
         for (addr, data) in link_events
+            push!(seen_addresses, addr)
             # Check if this address is a program/system account
-            addr_identity = get_wallet_identity(addr, config)
+            addr_identity = get_wallet_identity_cached(addr, config)
             category = get(addr_identity, "category", "unknown")
 
             link_info = Dict(
@@ -558,12 +594,12 @@ function analyze_wallet_transactions(wallet_address::String, config::ToolAnalyze
             left = 10 - length(links)
             co_sorted = sort(collect(counterparties), by=x->last(x), rev=true)
             for (addr, cnt) in co_sorted
-                if any(l->l["address"]==addr, links); continue; end
-                # Skip if already in program_addresses
-                if any(p->p["address"]==addr, program_addresses); continue; end
+                # Skip addresses already classified as links or program addresses
+                addr in seen_addresses && continue
+                push!(seen_addresses, addr)
 
                 # Quick category check to avoid adding programs to wallet links
-                addr_identity = get_wallet_identity(addr, config)
+                addr_identity = get_wallet_identity_cached(addr, config)
                 category = get(addr_identity, "category", "unknown")
                 if category in ["program", "token_mint"]; continue; end
 
@@ -618,11 +654,13 @@ function analyze_wallet_transactions(wallet_address::String, config::ToolAnalyze
                     exported_stats = export_graph_stats_json(stats, wallet_address)
                     connectivity = analyze_connectivity_patterns(graph, wallet_address)
                     performance = calculate_performance_metrics(graph)
+                    topology = compute_network_topology(graph, wallet_address)
 
                     graph_stats = Dict(
                         "enabled" => true,
                         "statistics" => exported_stats,
                         "connectivity_patterns" => connectivity,
+                        "topology" => topology,
                         "performance_metrics" => performance,
                         "validation" => graph_validation,
                         "parsing_quality" => validation
@@ -722,148 +760,167 @@ function analyze_wallet_transactions(wallet_address::String, config::ToolAnalyze
             taint_analysis = Dict("enabled" => false, "reason" => "taint_analysis_error", "error" => string(e))
         end
 
+        # F3-F5 only read the graph/taint results above and never each other, so they
+        # run as concurrent tasks; wall time is the slowest stage instead of the sum.
         # F3 Entity Clustering & Integration Analysis
-        entity_analysis = Dict{String,Any}()
-        integration_analysis = Dict{String,Any}()
-        try
-            if get(graph_stats, "enabled", false) == true
-                # Get the graph from previous analysis
-                edges = parse_transactions(txs, wallet_address)
-                if !isempty(edges)
-                    graph = build_graph(edges)
-
-                    # Entity clustering analysis
-                    entity_analysis = analyze_entity_clustering(graph, wallet_address)
-
-                    # Integration catalog analysis
-                    integration_analysis = analyze_integration_patterns(graph, wallet_address)
-
-                    # Integration events detection (requires taint results)
-                    if get(taint_analysis, "enabled", false) == true &&
-                       haskey(taint_analysis, "cache_hit") &&
-                       get(taint_analysis, "cache_hit", false) == true
-
-                        # Get taint results for event detection
-                        taint_results = Dict{String,TaintResult}()  # Simplified for now
-                        events_analysis = analyze_integration_events(graph, wallet_address, taint_results)
-                        integration_analysis["events"] = events_analysis
+        entity_task = Threads.@spawn begin
+            local entity_analysis = Dict{String,Any}()
+            local integration_analysis = Dict{String,Any}()
+            try
+                if get(graph_stats, "enabled", false) == true
+                    # Get the graph from previous analysis
+                    edges = parse_transactions(txs, wallet_address)
+                    if !isempty(edges)
+                        graph = build_graph(edges)
+
+                        # Entity clustering analysis
+                        entity_analysis = analyze_entity_clustering(graph, wallet_address)
+
+                        # Integration catalog analysis
+                        integration_analysis = analyze_integration_patterns(graph, wallet_address)
+
+                        # Integration events detection (requires taint results)
+                        if get(taint_analysis, "enabled", false) == true &&
+                           haskey(taint_analysis, "cache_hit") &&
+                           get(taint_analysis, "cache_hit", false) == true
+
+                            # Get taint results for event detection
+                            taint_results = Dict{String,TaintResult}()  # Simplified for now
+                            events_analysis = analyze_integration_events(graph, wallet_address, taint_results)
+                            integration_analysis["events"] = events_analysis
+                        else
+                            integration_analysis["events"] = Dict("enabled" => false, "reason" => "no_taint_data")
+                        end
                     else
-                        integration_analysis["events"] = Dict("enabled" => false, "reason" => "no_taint_data")
+                        entity_analysis = Dict("enabled" => false, "reason" => "no_edges_for_clustering")
+                        integration_analysis = Dict("enabled" => false, "reason" => "no_edges_for_integration")
                     end
                 else
-                    entity_analysis = Dict("enabled" => false, "reason" => "no_edges_for_clustering")
-                    integration_analysis = Dict("enabled" => false, "reason" => "no_edges_for_integration")
+                    entity_analysis = Dict("enabled" => false, "reason" => "graph_analysis_disabled")
+                    integration_analysis = Dict("enabled" => false, "reason" => "graph_analysis_disabled")
                 end
-            else
-                entity_analysis = Dict("enabled" => false, "reason" => "graph_analysis_disabled")
-                integration_analysis = Dict("enabled" => false, "reason" => "graph_analysis_disabled")
+            catch e
+                entity_analysis = Dict("enabled" => false, "reason" => "entity_analysis_error", "error" => string(e))
+                integration_analysis = Dict("enabled" => false, "reason" => "integration_analysis_error", "error" => string(e))
             end
-        catch e
-            entity_analysis = Dict("enabled" => false, "reason" => "entity_analysis_error", "error" => string(e))
-            integration_analysis = Dict("enabled" => false, "reason" => "integration_analysis_error", "error" => string(e))
+            (entity_analysis, integration_analysis)
         end
 
         # F4 Explainability: Evidence paths and k-shortest paths analysis
-        evidence_analysis = Dict{String,Any}()
-        try
-            if get(graph_stats, "enabled", false) == true && get(taint_analysis, "enabled", false) == true
-                # Get the graph and taint results from previous analysis
-                edges = parse_transactions(txs, wallet_address)
-                if !isempty(edges)
-                    graph = build_graph(edges)
-
-                    # Extract taint results if available
-                    taint_results = Dict{String,TaintResult}()
-
-                    # For now, create minimal taint data for high-value transactions
-                    # In full implementation, this would use actual taint_results from F2
-                    for edge in edges
-                        if edge.value > 50.0  # High value threshold
-                            # Create mock taint result for demo (this is the ONLY exception to no-mocks rule for integration purposes)
-                            taint_results[edge.from] = TaintResult(
-                                edge.from,
-                                min(1.0, edge.value / 1000.0),
-                                1,
-                                "high_value_detection",
-                                [edge.from],
-                                edge.value
-                            )
+        evidence_task = Threads.@spawn begin
+            local evidence_analysis = Dict{String,Any}()
+            try
+                if get(graph_stats, "enabled", false) == true && get(taint_analysis, "enabled", false) == true
+                    # Get the graph and taint results from previous analysis
+                    edges = parse_transactions(txs, wallet_address)
+                    if !isempty(edges)
+                        graph = build_graph(edges)
+
+                        # Extract taint results if available
+                        taint_results = Dict{String,TaintResult}()
+
+                        # For now, create minimal taint data for high-value transactions
+                        # In full implementation, this would use actual taint_results from F2
+                        for edge in edges
+                            if edge.value > 50.0  # High value threshold
+                                # Create mock taint result for demo (this is the ONLY exception to no-mocks rule for integration purposes)
+                                taint_results[edge.from] = TaintResult(
+                                    edge.from,
+                                    min(1.0, edge.value / 1000.0),
+                                    1,
+                                    "high_value_detection",
+                                    [edge.from],
+                                    edge.value
+                                )
+                            end
                         end
-                    end
 
-                    # Analyze evidence paths
-                    evidence_analysis = analyze_evidence_paths(graph, wallet_address, taint_results)
+                        # Analyze evidence paths
+                        evidence_analysis = analyze_evidence_paths(graph, wallet_address, taint_results)
 
-                    # Validate results
-                    if haskey(evidence_analysis, "evidence_paths")
-                        evidence_paths = EvidencePath[]
-                        # Convert from analysis result to validate
-                        validation = Dict("is_valid" => true, "issues" => String[], "stats" => Dict())
-                        evidence_analysis["validation"] = validation
+                        # Validate results
+                        if haskey(evidence_analysis, "evidence_paths")
+                            evidence_paths = EvidencePath[]
+                            # Convert from analysis result to validate
+                            validation = Dict("is_valid" => true, "issues" => String[], "stats" => Dict())
+                            evidence_analysis["validation"] = validation
+                        end
+                    else
+                        evidence_analysis = Dict("enabled" => false, "reason" => "no_edges_for_evidence_analysis")
                     end
                 else
-                    evidence_analysis = Dict("enabled" => false, "reason" => "no_edges_for_evidence_analysis")
+                    evidence_analysis = Dict("enabled" => false, "reason" => "missing_graph_or_taint_analysis")
                 end
-            else
-                evidence_analysis = Dict("enabled" => false, "reason" => "missing_graph_or_taint_analysis")
+            catch e
+                evidence_analysis = Dict("enabled" => false, "reason" => "evidence_analysis_error", "error" => string(e))
             end
-        catch e
-            evidence_analysis = Dict("enabled" => false, "reason" => "evidence_analysis_error", "error" => string(e))
+            evidence_analysis
         end
 
         # F5: Flow Attribution Analysis (min-cost flow decomposition)
-        flow_attribution = Dict{String,Any}()
-        try
-            if !isnothing(graph) && haskey(taint_analysis, "address_scores") && !isempty(taint_analysis["address_scores"])
-                if length(graph.edges) > 0
-                    flow_attribution = analyze_flow_attribution(graph, taint_analysis, wallet_address)
-
-                    # Validate flow attribution results
-                    if haskey(flow_attribution, "attribution_quality")
-                        validation = Dict(
-                            "quality_score" => flow_attribution["attribution_quality"],
-                            "flows_analyzed" => get(flow_attribution, "active_flows", 0),
-                            "computation_time_s" => get(flow_attribution, "computation_time_s", 0.0)
-                        )
-                        flow_attribution["validation"] = validation
+        flow_task = Threads.@spawn begin
+            local flow_attribution = Dict{String,Any}()
+            try
+                if !isnothing(graph) && haskey(taint_analysis, "address_scores") && !isempty(taint_analysis["address_scores"])
+                    if length(graph.edges) > 0
+                        flow_attribution = analyze_flow_attribution(graph, taint_analysis, wallet_address)
+
+                        # Validate flow attribution results
+                        if haskey(flow_attribution, "attribution_quality")
+                            validation = Dict(
+                                "quality_score" => flow_attribution["attribution_quality"],
+                                "flows_analyzed" => get(flow_attribution, "active_flows", 0),
+                                "computation_time_s" => get(flow_attribution, "computation_time_s", 0.0)
+                            )
+                            flow_attribution["validation"] = validation
+                        end
+                    else
+                        flow_attribution = Dict("enabled" => false, "reason" => "no_edges_for_flow_attribution")
                     end
                 else
-                    flow_attribution = Dict("enabled" => false, "reason" => "no_edges_for_flow_attribution")
+                    flow_attribution = Dict("enabled" => false, "reason" => "missing_graph_or_taint_analysis")
                 end
-            else
-                flow_attribution = Dict("enabled" => false, "reason" => "missing_graph_or_taint_analysis")
+            catch e
+                flow_attribution = Dict("enabled" => false, "reason" => "flow_attribution_error", "error" => string(e))
             end
-        catch e
-            flow_attribution = Dict("enabled" => false, "reason" => "flow_attribution_error", "error" => string(e))
+            flow_attribution
         end
 
         # F5: Influence Analysis (counterfactual impact assessment)
-        influence_analysis = Dict{String,Any}()
-        try
-            if !isnothing(graph) && haskey(taint_analysis, "address_scores") && !isempty(taint_analysis["address_scores"])
-                if length(graph.edges) > 0
-                    influence_analysis = analyze_network_influence(graph, taint_analysis, wallet_address)
-
-                    # Validate influence analysis results
-                    if haskey(influence_analysis, "analysis_quality")
-                        validation = Dict(
-                            "quality_score" => influence_analysis["analysis_quality"],
-                            "addresses_analyzed" => get(influence_analysis, "addresses_analyzed", 0),
-                            "computation_time_s" => get(influence_analysis, "computation_time_s", 0.0),
-                            "network_fragility" => get(influence_analysis, "network_fragility", 0.0)
-                        )
-                        influence_analysis["validation"] = validation
+        influence_task = Threads.@spawn begin
+            local influence_analysis = Dict{String,Any}()
+            try
+                if !isnothing(graph) && haskey(taint_analysis, "address_scores") && !isempty(taint_analysis["address_scores"])
+                    if length(graph.edges) > 0
+                        influence_analysis = analyze_network_influence(graph, taint_analysis, wallet_address)
+
+                        # Validate influence analysis results
+                        if haskey(influence_analysis, "analysis_quality")
+                            validation = Dict(
+                                "quality_score" => influence_analysis["analysis_quality"],
+                                "addresses_analyzed" => get(influence_analysis, "addresses_analyzed", 0),
+                                "computation_time_s" => get(influence_analysis, "computation_time_s", 0.0),
+                                "network_fragility" => get(influence_analysis, "network_fragility", 0.0)
+                            )
+                            influence_analysis["validation"] = validation
+                        end
+                    else
+                        influence_analysis = Dict("enabled" => false, "reason" => "no_edges_for_influence_analysis")
                     end
                 else
-                    influence_analysis = Dict("enabled" => false, "reason" => "no_edges_for_influence_analysis")
+                    influence_analysis = Dict("enabled" => false, "reason" => "missing_graph_or_taint_analysis")
                 end
-            else
-                influence_analysis = Dict("enabled" => false, "reason" => "missing_graph_or_taint_analysis")
+            catch e
+                influence_analysis = Dict("enabled" => false, "reason" => "influence_analysis_error", "error" => string(e))
             end
-        catch e
-            influence_analysis = Dict("enabled" => false, "reason" => "influence_analysis_error", "error" => string(e))
+            influence_analysis
         end
 
+        entity_analysis, integration_analysis = fetch(entity_task)
+        evidence_analysis = fetch(evidence_task)
+        flow_attribution = fetch(flow_task)
+        influence_analysis = fetch(influence_task)
+
         # Calculate net flow metrics from samples (safe sum with fallback)
         inflow_values = [s["net_flow"] for s in samples if s["net_flow"] > 0]
         outflow_values = [abs(s["net_flow"]) for s in samples if s["net_flow"] < 0]
@@ -921,47 +978,141 @@ function analyze_wallet_transactions(wallet_address::String, config::ToolAnalyze
 end
 
 # ----------------------------------------
-# Unified pattern detection and risk scoring
+# Feature extraction kernel
 # ----------------------------------------
-function detect_ghost_patterns(transactions::Vector, wallet_address::String; is_blacklisted::Bool=false)
-    if isempty(transactions)
-        return Dict("patterns"=>String[], "risk_score"=>0, "risk_level"=>"LOW", "analysis"=>"No transactions", "drivers"=>String[])
-    end
+"""
+    _collect_tx_features(transactions, wallet_address)
 
-    total = length(transactions)
-    fees = Float64[]
-    times = Int[]
+Walks the raw RPC transaction dicts once and returns concretely typed vectors
+(`fees`, `times`, `sol_amounts`) plus the counterparty set, so the numeric
+kernel below is compiled against plain `Vector{Float64}`/`Vector{Int}`.
+"""
+function _collect_tx_features(transactions::Vector, wallet_address::String)
+    n = length(transactions)
+    fees = sizehint!(Float64[], n)
+    times = sizehint!(Int[], n)
+    sol_amounts = sizehint!(Float64[], n)  # For large outlier detection
     counterparties = Set{String}()
-    sol_amounts = Float64[]  # For large outlier detection
 
     for tx in transactions
         try
-            if haskey(tx, "meta") && haskey(tx["meta"], "fee")
-                push!(fees, Float64(tx["meta"]["fee"]) / 1e9)
+            meta = get(tx, "meta", nothing)
+            if meta !== nothing && haskey(meta, "fee")
+                push!(fees, Float64(meta["fee"]) / 1e9)
             end
-            if haskey(tx, "blockTime") && tx["blockTime"] !== nothing
-                push!(times, Int(tx["blockTime"]))
+            bt = get(tx, "blockTime", nothing)
+            if bt !== nothing
+                push!(times, Int(bt))
             end
             if haskey(tx, "transaction") && haskey(tx["transaction"], "message") && haskey(tx["transaction"]["message"], "accountKeys")
-                for acc in tx["transaction"]["message"]["accountKeys"]
-                    if acc != wallet_address
-                        push!(counterparties, lowercase(String(acc)))
+                accs = tx["transaction"]["message"]["accountKeys"]
+                widx = nothing
+                for (i, acc) in enumerate(accs)
+                    a = String(acc)
+                    if a == wallet_address
+                        widx === nothing && (widx = i)
+                    else
+                        push!(counterparties, lowercase(a))
                     end
                 end
-            end
-            # Extract SOL amounts for outlier detection
-            if haskey(tx, "transaction") && haskey(tx["transaction"],"message") && haskey(tx["transaction"]["message"],"accountKeys") && haskey(tx, "meta") && haskey(tx["meta"],"preBalances") && haskey(tx["meta"],"postBalances")
-                accs = tx["transaction"]["message"]["accountKeys"]; pre = tx["meta"]["preBalances"]; post = tx["meta"]["postBalances"]; widx = findfirst(x->String(x)==wallet_address, accs)
-                if widx !== nothing && length(pre)==length(accs)
-                    delta = abs((Float64(post[widx]) - Float64(pre[widx]))/1e9)
-                    if delta > 0.001  # Only consider meaningful amounts (> 0.001 SOL)
-                        push!(sol_amounts, delta)
+                # Extract SOL amounts for outlier detection
+                if widx !== nothing && meta !== nothing && haskey(meta, "preBalances") && haskey(meta, "postBalances")
+                    pre = meta["preBalances"]; post = meta["postBalances"]
+                    if length(pre) == length(accs)
+                        delta = abs((Float64(post[widx]) - Float64(pre[widx])) / 1e9)
+                        if delta > 0.001  # Only consider meaningful amounts (> 0.001 SOL)
+                            push!(sol_amounts, delta)
+                        end
                     end
                 end
             end
         catch; end
     end
 
+    return fees, times, counterparties, sol_amounts
+end
+
+"""
+    _extract_tx_features(times, fees, sol_amounts)
+
+Type-stable numeric pass over the typed feature vectors. Computes activity
+span, fee mean/coefficient of variation and IQR outlier statistics in tight
+loops (no intermediate filtered arrays) and returns a `NamedTuple`.
+"""
+function _extract_tx_features(times::Vector{Int}, fees::Vector{Float64}, sol_amounts::Vector{Float64})
+    span = 0
+    if length(times) > 1
+        tmin = typemax(Int); tmax = typemin(Int)
+        @inbounds for t in times
+            t < tmin && (tmin = t)
+            t > tmax && (tmax = t)
+        end
+        span = tmax - tmin
+    end
+
+    fee_mean = 0.0; fee_cv = Inf
+    nf = length(fees)
+    if nf > 1
+        s = 0.0
+        @inbounds @simd for f in fees
+            s += f
+        end
+        fee_mean = s / nf
+        ss = 0.0
+        @inbounds @simd for f in fees
+            ss += (f - fee_mean)^2
+        end
+        fee_cv = sqrt(ss / (nf - 1)) / max(fee_mean, 1e-9)
+    end
+
+    outlier_count = 0; max_outlier = 0.0
+    na = length(sol_amounts)
+    if na > 10
+        sorted_amounts = sort(sol_amounts)
+        q75 = sorted_amounts[Int(ceil(0.75 * na))]
+        q25 = sorted_amounts[Int(ceil(0.25 * na))]
+        outlier_threshold = q75 + 1.5 * (q75 - q25)
+        @inbounds for x in sol_amounts
+            if x > outlier_threshold
+                outlier_count += 1
+                x > max_outlier && (max_outlier = x)
+            end
+        end
+    end
+
+    return (span=span, fee_mean=fee_mean, fee_cv=fee_cv,
+            outlier_count=outlier_count, max_outlier=max_outlier,
+            outlier_ratio=na > 0 ? outlier_count / na : 0.0)
+end
+
+# ----------------------------------------
+# Unified pattern detection and risk scoring
+# ----------------------------------------
+# Level boundaries on the 0-100 scale; a score at a boundary takes the upper level.
+const RISK_LEVEL_THRESHOLDS = Float64[30, 60, 80]
+const RISK_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+"""
+    risk_level_for(score::Real) -> String
+
+Buckets a 0-100 risk score into LOW/MEDIUM/HIGH/CRITICAL via a sorted-threshold lookup.
+A NaN score is LOW, as with the comparison chain this replaced.
+"""
+risk_level_for(score::Real) = isnan(score) ? first(RISK_LEVELS) :
+    @inbounds RISK_LEVELS[searchsortedlast(RISK_LEVEL_THRESHOLDS, score) + 1]
+
+"""Vectorized `risk_level_for` for batch scoring."""
+risk_levels_for(scores::AbstractVector{<:Real}) = [risk_level_for(s) for s in scores]
+
+function detect_ghost_patterns(transactions::Vector, wallet_address::String; is_blacklisted::Bool=false)
+    if isempty(transactions)
+        return Dict("patterns"=>String[], "risk_score"=>0, "risk_level"=>"LOW", "analysis"=>"No transactions", "drivers"=>String[])
+    end
+
+    total = length(transactions)
+    fees, times, counterparties, sol_amounts = _collect_tx_features(transactions, wallet_address)
+    feat = _extract_tx_features(times, fees, sol_amounts)
+
     drivers = String[]
     risk = 0.0
 
@@ -986,46 +1137,27 @@ function detect_ghost_patterns(transactions::Vector, wallet_address::String; is_
 
     # Activity span: up to 20 (dense activity if high volume in short time)
     if length(times) > 1
-        span = maximum(times) - minimum(times)
-        if span < 15*24*3600 && total >= 200
+        if feat.span < 15*24*3600 && total >= 200
             push!(drivers, "dense_activity_window"); risk += 18
-        elseif span < 30*24*3600 && total >= 100
+        elseif feat.span < 30*24*3600 && total >= 100
             push!(drivers, "elevated_activity_window"); risk += 10
         end
     end
 
     # Fee consistency: up to 10 (safe operations)
-    if length(fees) > 5
-        try
-            m = mean(fees); sd = std(fees)
-            if m > 0 && sd / max(m, 1e-9) < 0.1
-                push!(drivers, "consistent_fees"); risk += 8
-            end
-        catch e
-            @debug "Fee analysis failed" error=e
-        end
+    consistent_fees = length(fees) > 5 && feat.fee_mean > 0 && feat.fee_cv < 0.1
+    if consistent_fees
+        push!(drivers, "consistent_fees"); risk += 8
     end
 
     # Large outlier detection: up to 15 (F0_large_outlier implementation)
-    if length(sol_amounts) > 10
-        sorted_amounts = sort(sol_amounts)
-        q75 = sorted_amounts[Int(ceil(0.75 * length(sorted_amounts)))]
-        q25 = sorted_amounts[Int(ceil(0.25 * length(sorted_amounts)))]
-        iqr = q75 - q25
-        outlier_threshold = q75 + 1.5 * iqr
-
-        outliers = filter(x -> x > outlier_threshold, sol_amounts)
-        if length(outliers) > 0
-            max_outlier = maximum(outliers)
-            outlier_ratio = length(outliers) / length(sol_amounts)
-
-            if max_outlier > 1000.0  # > 1000 SOL
-                push!(drivers, "extreme_large_outlier"); risk += 15
-            elseif max_outlier > 100.0  # > 100 SOL
-                push!(drivers, "large_outlier"); risk += 10
-            elseif outlier_ratio > 0.1  # > 10% of transactions are outliers
-                push!(drivers, "frequent_outliers"); risk += 6
-            end
+    if feat.outlier_count > 0
+        if feat.max_outlier > 1000.0  # > 1000 SOL
+            push!(drivers, "extreme_large_outlier"); risk += 15
+        elseif feat.max_outlier > 100.0  # > 100 SOL
+            push!(drivers, "large_outlier"); risk += 10
+        elseif feat.outlier_ratio > 0.1  # > 10% of transactions are outliers
+            push!(drivers, "frequent_outliers"); risk += 6
         end
     end
 
@@ -1035,20 +1167,13 @@ function detect_ghost_patterns(transactions::Vector, wallet_address::String; is_
     end
 
     risk = min(100.0, risk)
-    level = risk >= 80 ? "CRITICAL" : risk >= 60 ? "HIGH" : risk >= 30 ? "MEDIUM" : "LOW"
+    level = risk_level_for(risk)
 
     patterns = String[]
     if total >= 100; push!(patterns, "High transaction volume") end
     if cp >= 40; push!(patterns, "Broader-than-typical counterparty set") end
-    if length(times)>1 && (maximum(times)-minimum(times)) < 30*24*3600 && total >= 100; push!(patterns, "Intense activity in short window") end
-    if length(fees)>5
-        try
-            m = mean(fees); sd = std(fees)
-            if m > 0 && sd / max(m,1e-9) < 0.1; push!(patterns, "Very consistent fees (possible automation)") end
-        catch e
-            @debug "Pattern fee analysis failed" error=e
-        end
-    end
+    if length(times)>1 && feat.span < 30*24*3600 && total >= 100; push!(patterns, "Intense activity in short window") end
+    if consistent_fees; push!(patterns, "Very consistent fees (possible automation)") end
     # Large outlier patterns (F0_large_outlier)
     if "extreme_large_outlier" in drivers; push!(patterns, "Extreme large transactions (>1000 SOL)") end
     if "large_outlier" in drivers; push!(patterns, "Large outlier transactions (>100 SOL)") end
@@ -1067,37 +1192,66 @@ end
 # ----------------------------------------
 # AI verdict and recommendations via OpenAI
 # ----------------------------------------
+# Static prompt scaffolding, built once at load; only the investigation JSON varies per call.
+const AI_VERDICT_MODEL = get(ENV, "AI_MODEL_DEFAULT", "gpt-4o-mini")
+const AI_VERDICT_SYSTEM_MESSAGE = Dict("role"=>"system","content"=>"You are a blockchain investigation assistant. Provide a clear, layman-friendly verdict and 3-6 actionable recommendations. Be concise and avoid speculation.")
+const AI_VERDICT_INSTRUCTION_MESSAGE = Dict("role"=>"user","content"=>"Analyze and produce final verdict and recommendations for this investigation JSON:")
+# Shared keep-alive pool for LLM calls from every detective in this process. This file is
+# included once per detective module, so reuse the parent's pool when it provides one.
+const AI_HTTP_POOL = let host = parentmodule(@__MODULE__)
+    isdefined(host, :SHARED_AI_HTTP_POOL) ? getfield(host, :SHARED_AI_HTTP_POOL) :
+        HTTP.Pool(try parse(Int, get(ENV, "AI_HTTP_POOL_SIZE", "16")) catch; 16 end)
+end
+
+# Verdicts for identical investigation JSON (e.g. every detective re-reading the same
+# cached base snapshot) are reused for a short TTL instead of re-asking the model.
+# Shared through the parent module like the identity cache above.
+const AI_VERDICT_CACHE_TTL_S = try parse(Float64, get(ENV, "AI_VERDICT_CACHE_TTL_S", "600")) catch; 600.0 end
+const AI_VERDICT_CACHE_MAX = try parse(Int, get(ENV, "AI_VERDICT_CACHE_MAX", "512")) catch; 512 end
+const _AI_VERDICT_CACHE = let host = parentmodule(@__MODULE__)
+    isdefined(host, :SHARED_AI_VERDICT_CACHE) ? getfield(host, :SHARED_AI_VERDICT_CACHE) :
+        TTLCache{UInt64,String}(AI_VERDICT_CACHE_TTL_S, AI_VERDICT_CACHE_MAX)
+end
+
+"""Hit/miss counters, hit rate and size of the AI verdict cache."""
+ai_verdict_cache_stats() = cache_stats(_AI_VERDICT_CACHE)
+
 function generate_ai_analysis(wallet_address::String, analysis::Dict, config::ToolAnalyzeWalletConfig)
     if isempty(config.openai_api_key)
         return "AI analysis unavailable"
     end
     try
-        model = get(ENV, "AI_MODEL_DEFAULT", "gpt-4o-mini")
-        sys = "You are a blockchain investigation assistant. Provide a clear, layman-friendly verdict and 3-6 actionable recommendations. Be concise and avoid speculation."
-        user = JSON3.write(Dict(
-            "wallet_address"=>wallet_address,
-            "risk"=>get(analysis, "risk_assessment", Dict()),
-            "activity_summary"=>get(analysis, "transaction_summary", Dict()),
-            "blacklist"=>get(analysis, "blacklist", Dict()),
-            "linked_addresses"=>get(analysis, "linked_addresses", []),
-            "wallet_identity"=>get(analysis, "wallet_identity", Dict()),
+        # Fixed field order: the same verdict input always yields the same bytes, which
+        # is what the cache key below and the provider prompt cache both hash
+        user = JSON3.write((
+            activity_summary=get(analysis, "transaction_summary", Dict()),
+            blacklist=get(analysis, "blacklist", Dict()),
+            linked_addresses=get(analysis, "linked_addresses", []),
+            risk=get(analysis, "risk_assessment", Dict()),
+            wallet_address=wallet_address,
+            wallet_identity=get(analysis, "wallet_identity", Dict()),
         ))
+        cache_key = hash(user)
+        cached = cache_get(_AI_VERDICT_CACHE, cache_key)
+        cached !== nothing && return cached
         payload = Dict(
-            "model"=>model,
+            "model"=>AI_VERDICT_MODEL,
             "messages"=>[
-                Dict("role"=>"system","content"=>sys),
-                Dict("role"=>"user","content"=>"Analyze and produce final verdict and recommendations for this investigation JSON:"),
+                AI_VERDICT_SYSTEM_MESSAGE,
+                AI_VERDICT_INSTRUCTION_MESSAGE,
                 Dict("role"=>"user","content"=>user),
             ],
             "temperature"=>0.2,
             "max_tokens"=>600,
         )
         headers = Dict("Content-Type"=>"application/json","Authorization"=>"Bearer "*config.openai_api_key)
-        resp = HTTP.post("https://api.openai.com/v1/chat/completions"; headers=headers, body=JSON3.write(payload), timeout=Int(ceil(SOLANA_TIMEOUT_S)))
+        resp = HTTP.post("https://api.openai.com/v1/chat/completions"; headers=headers, body=JSON3.write(payload), timeout=Int(ceil(SOLANA_TIMEOUT_S)), pool=AI_HTTP_POOL)
         if resp.status == 200
             data = JSON3.read(String(resp.body))
             if haskey(data, "choices") && length(data["choices"])>0
-                return String(data["choices"][1]["message"]["content"])
+                text = String(data["choices"][1]["message"]["content"])
+                cache_put!(_AI_VERDICT_CACHE, cache_key, text)
+                return text
             end
         end
         return "AI response unavailable"
@@ -1106,6 +1260,83 @@ function generate_ai_analysis(wallet_address::String, analysis::Dict, config::To
     end
 end
 
+"""
+    _dig(d, keys...; default=nothing)
+
+Walks nested dicts once, returning `default` on the first missing key or
+non-dict level. Avoids the empty `Dict()` that each `get(get(d, k, Dict()), ...)`
+level allocates eagerly.
+"""
+function _dig(d, keys...; default=nothing)
+    cur = d
+    for k in keys
+        (cur isa AbstractDict && haskey(cur, k)) || return default
+        cur = cur[k]
+    end
+    return cur
+end
+
+"""
+    _triage_ai(base; skip_agreed=AI_TRIAGE_SKIP_AGREED) -> Union{Nothing,String}
+
+Cheap pre-AI triage on a base analysis snapshot. Returns a reason string when
+the heuristic result is already definitive (public blacklist hit, or a near
+empty wallet with no detected patterns) so the LLM verdict can be skipped and the
+caller's templated verdict used instead; returns `nothing` when the case is worth
+an AI call. With `skip_agreed`, LOW / CRITICAL from both the pattern scan and the
+risk engine is also treated as definitive.
+"""
+function _triage_ai(base::Dict; skip_agreed::Bool=AI_TRIAGE_SKIP_AGREED)
+    if _dig(base, "blacklist", "is_blacklisted"; default=false) == true
+        return "public_blacklist_hit"
+    end
+    ra = get(base, "risk_assessment", Dict())
+    total = _dig(base, "transaction_summary", "total_transactions"; default=0)
+    if total isa Integer && total < AI_TRIAGE_MIN_TXS && get(ra, "risk_level", "LOW") == "LOW" && isempty(get(ra, "patterns", String[]))
+        return "insufficient_activity"
+    end
+    skip_agreed || return nothing
+    # Narrative is only worth paying for at MEDIUM or above; a failed risk
+    # engine (fallback_used) does not count as a LOW confirmation.
+    engine = get(base, "risk_engine", Dict())
+    if get(ra, "risk_level", "") == "LOW" && get(engine, "risk_level", "") == "LOW" && !get(engine, "fallback_used", false)
+        return "low_risk"
+    end
+    # The other end of the cascade: when both agree the wallet is CRITICAL the
+    # narrative cannot change the verdict, only restate it
+    if get(ra, "risk_level", "") == "CRITICAL" && get(engine, "risk_level", "") == "CRITICAL" && !get(engine, "fallback_used", false)
+        return "critical_risk"
+    end
+    return nothing
+end
+
+# How often the triage settled a verdict without the LLM, for cost reporting
+const _AI_TRIAGE_STATS = Dict{String,Int}("llm_invocations" => 0, "heuristic_only" => 0)
+const _AI_TRIAGE_STATS_LOCK = ReentrantLock()
+
+_count_triage!(key::String) = lock(() -> _AI_TRIAGE_STATS[key] += 1, _AI_TRIAGE_STATS_LOCK)
+
+"""LLM verdict calls vs. verdicts settled by the triage alone, and the share skipped."""
+function ai_triage_stats()
+    lock(_AI_TRIAGE_STATS_LOCK) do
+        llm = _AI_TRIAGE_STATS["llm_invocations"]; heuristic = _AI_TRIAGE_STATS["heuristic_only"]
+        Dict("llm_invocations"=>llm, "heuristic_only"=>heuristic, "skip_rate"=>heuristic / max(1, llm + heuristic))
+    end
+end
+
+"""AI verdict gated by `include_ai_analysis` and `_triage_ai`; empty string when skipped."""
+function _ai_analysis_for(wallet_address::String, base::Dict, cfg::ToolAnalyzeWalletConfig)
+    cfg.include_ai_analysis || return ""
+    reason = _triage_ai(base)
+    if reason !== nothing
+        @debug "Skipping AI verdict (triage)" wallet=wallet_address reason=reason
+        _count_triage!("heuristic_only")
+        return ""
+    end
+    _count_triage!("llm_invocations")
+    return generate_ai_analysis(wallet_address, base, cfg)
+end
+
 # ----------------------------------------
 # Public tool entry
 # ----------------------------------------
@@ -1126,7 +1357,7 @@ function tool_analyze_wallet(cfg::ToolAnalyzeWalletConfig, task::Dict)
     st, cached = _cache_get_status(wallet_address, desired_depth)
     if st == :ok && cached !== nothing
         base = cached
-        ai_text = cfg.include_ai_analysis ? generate_ai_analysis(wallet_address, base, cfg) : ""
+        ai_text = _ai_analysis_for(wallet_address, base, cfg)
         return Dict(
             "success" => true,
             "wallet_address" => wallet_address,
@@ -1143,7 +1374,7 @@ function tool_analyze_wallet(cfg::ToolAnalyzeWalletConfig, task::Dict)
             "entity_analysis" => get(base, "entity_analysis", Dict()),
             "integration_analysis" => get(base, "integration_analysis", Dict()),
             "ai_analysis" => ai_text,
-            "timestamp" => Dates.format(now(UTC), dateformat"yyyy-mm-ddTHH:MM:SS.sssZ"),
+            "timestamp" => _utc_timestamp(),
         )
     elseif st == :computing
         t0 = time()
@@ -1152,7 +1383,7 @@ function tool_analyze_wallet(cfg::ToolAnalyzeWalletConfig, task::Dict)
             st2, cached2 = _cache_get_status(wallet_address, desired_depth)
             if st2 == :ok && cached2 !== nothing
                 base = cached2
-                ai_text = cfg.include_ai_analysis ? generate_ai_analysis(wallet_address, base, cfg) : ""
+                ai_text = _ai_analysis_for(wallet_address, base, cfg)
                 return Dict(
                     "success" => true,
                     "wallet_address" => wallet_address,
@@ -1174,7 +1405,7 @@ function tool_analyze_wallet(cfg::ToolAnalyzeWalletConfig, task::Dict)
                     "influence_analysis" => get(base, "influence_analysis", Dict()),
                     "rpc_metrics" => get(base, "rpc_metrics", Dict()),
                     "ai_analysis" => ai_text,
-                    "timestamp" => Dates.format(now(UTC), dateformat"yyyy-mm-ddTHH:MM:SS.sssZ"),
+                    "timestamp" => _utc_timestamp(),
                 )
             elseif st2 == :miss
                 break
@@ -1222,7 +1453,7 @@ function tool_analyze_wallet(cfg::ToolAnalyzeWalletConfig, task::Dict)
                 isempty(samples) ? 0.0 : maximum([abs(get(tx, "net_flow", 0.0)) for tx in samples])
             end,
             "has_incident_data" => haskey(get(tx_analysis, "taint_analysis", Dict()), "incident_sources"),
-            "has_cex_interactions" => !isempty(get(get(tx_analysis, "integration_analysis", Dict()), "integration_events", [])),
+            "has_cex_interactions" => !isempty(_dig(tx_analysis, "integration_analysis", "integration_events"; default=())),
             "investigation_type" => "general"  # Could be parameterized in future
         )
 
@@ -1307,7 +1538,7 @@ function tool_analyze_wallet(cfg::ToolAnalyzeWalletConfig, task::Dict)
     _cache_store(wallet_address, base_snapshot; depth=desired_depth)
 
     # AI verdict (optional)
-    ai_text = cfg.include_ai_analysis ? generate_ai_analysis(wallet_address, base_snapshot, cfg) : ""
+    ai_text = _ai_analysis_for(wallet_address, base_snapshot, cfg)
 
     return Dict(
         "success" => true,
@@ -1330,7 +1561,7 @@ function tool_analyze_wallet(cfg::ToolAnalyzeWalletConfig, task::Dict)
         "influence_analysis" => get(base_snapshot, "influence_analysis", Dict()),
         "rpc_metrics" => base_snapshot["rpc_metrics"],
         "ai_analysis" => ai_text,
-        "timestamp" => Dates.format(now(UTC), dateformat"yyyy-mm-ddTHH:MM:SS.sssZ"),
+        "timestamp" => _utc_timestamp(),
     )
 end
 
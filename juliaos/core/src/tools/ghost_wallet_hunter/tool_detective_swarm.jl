@@ -10,7 +10,7 @@ Each detective has a unique specialty and works together via swarm intelligence.
     specialty::String
     analysis_focus::String
     prompt_style::String
-    model_config::Dict = Dict(
+    model_config::Dict{String,Any} = Dict{String,Any}(
         "model" => "gpt-3.5-turbo",
         "temperature" => 0.7,
         "max_tokens" => 800
@@ -27,7 +27,7 @@ Configuration for Detective Agent creation and management.
 @kwdef struct DetectiveAgentConfig
     detective_type::String
     wallet_address::String
-    investigation_data::Dict = Dict()
+    investigation_data::Dict{String,Any} = Dict{String,Any}()
     enable_swarm_coordination::Bool = true
     llm_model::String = "gpt-3.5-turbo"
     analysis_depth::String = "standard"
@@ -51,7 +51,7 @@ function calculate_composite_risk_score(tx_metrics::Dict, behavior::Dict, networ
     n = get(network, "risk_score", 0.0)
     bl = get(blacklist, "is_blacklisted", false) ? 90.0 : 0.0
     score = min(100.0, 0.4*t + 0.3*b + 0.2*n + bl)
-    level = score >= 80 ? "CRITICAL" : score >= 60 ? "HIGH" : score >= 30 ? "MEDIUM" : "LOW"
+    level = risk_level_for(score)
     return Dict(
         "score" => round(score, digits=2),
         "level" => level,
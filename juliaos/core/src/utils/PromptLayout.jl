@@ -0,0 +1,21 @@
+"""
+Ghost Wallet Hunter - Prompt Layout (Julia)
+
+Shared ordering for prompts that pair fixed instructions with per-request data.
+"""
+
+module PromptLayout
+
+export cacheable_prompt
+
+"""
+    cacheable_prompt(instructions::AbstractString, data::AbstractString) -> String
+
+Joins a prompt with the static `instructions` first and the per-request `data` after
+them. Providers cache prompts by prefix, so keeping every byte that does not change
+between calls at the front lets repeated calls reuse the cached part; only the data
+block is processed anew.
+"""
+cacheable_prompt(instructions::AbstractString, data::AbstractString) = string(instructions, '\n', data)
+
+end # module PromptLayout
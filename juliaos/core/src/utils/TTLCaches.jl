@@ -0,0 +1,85 @@
+"""
+Ghost Wallet Hunter - TTL Cache (Julia)
+
+Small thread-safe key/value cache with a per-entry time-to-live, a size bound and
+hit/miss counters. Backs the in-process memo tables (AI responses, detective
+analyses, AI verdicts, counterparty identities, provider status probes).
+"""
+
+module TTLCaches
+
+export TTLCache, cache_get, cache_put!, cache_stats
+
+"""
+    TTLCache{K,V}(ttl_s::Real=Inf, max_entries::Int=typemax(Int))
+
+Entries older than `ttl_s` seconds are misses and are dropped when read. When an
+insert finds the cache full, expired entries are swept first and, if it is still
+full, the oldest entry is evicted. `lock` is exposed so callers can combine a cache
+update with their own bookkeeping in one critical section.
+"""
+struct TTLCache{K,V}
+    entries::Dict{K,Tuple{Float64,V}}
+    lock::ReentrantLock
+    ttl_s::Float64
+    max_entries::Int
+    stats::Dict{String,Int}
+end
+
+TTLCache{K,V}(ttl_s::Real=Inf, max_entries::Int=typemax(Int)) where {K,V} =
+    TTLCache{K,V}(Dict{K,Tuple{Float64,V}}(), ReentrantLock(), Float64(ttl_s), max(1, max_entries),
+                  Dict{String,Int}("hits" => 0, "misses" => 0))
+
+"""
+    cache_get(cache::TTLCache, key) -> value or nothing
+
+Fresh value stored under `key`, or `nothing` on a miss. Counts the lookup.
+"""
+function cache_get(cache::TTLCache, key)
+    lock(cache.lock) do
+        entry = get(cache.entries, key, nothing)
+        if entry !== nothing && time() - entry[1] <= cache.ttl_s
+            cache.stats["hits"] += 1
+            return entry[2]
+        end
+        entry === nothing || delete!(cache.entries, key)
+        cache.stats["misses"] += 1
+        return nothing
+    end
+end
+
+"""
+    cache_put!(cache::TTLCache, key, value) -> value
+
+Stores `value` under `key`, evicting as described on `TTLCache` when full.
+"""
+function cache_put!(cache::TTLCache, key, value)
+    lock(cache.lock) do
+        if length(cache.entries) >= cache.max_entries && !haskey(cache.entries, key)
+            now_s = time()
+            filter!(kv -> now_s - kv[2][1] <= cache.ttl_s, cache.entries)
+            if length(cache.entries) >= cache.max_entries
+                oldest = argmin(kv -> kv[2][1], cache.entries)
+                delete!(cache.entries, oldest[1])
+            end
+        end
+        cache.entries[key] = (time(), value)
+    end
+    return value
+end
+
+"""
+    cache_stats(cache::TTLCache) -> Dict{String,Any}
+
+Hit/miss counters, hit rate and current size.
+"""
+function cache_stats(cache::TTLCache)
+    lock(cache.lock) do
+        hits = cache.stats["hits"]; misses = cache.stats["misses"]
+        Dict{String,Any}("hits" => hits, "misses" => misses,
+                         "hit_rate" => hits / max(1, hits + misses),
+                         "size" => length(cache.entries))
+    end
+end
+
+end # module TTLCaches
@@ -0,0 +1,120 @@
+# =============================================================================
+# 🤖 TESTE LLM INTEGRATION - STREAM E PROMPT HELPERS
+# =============================================================================
+# Módulo: LLMIntegration - funções puras usadas no streaming e na montagem do prompt
+# Funcionalidades: each_json_object, each_line, agrupamento de transações,
+#                  estatísticas de valores, normalização do nível de risco
+# NO MOCKS: nenhuma chamada a provedor; as funções recebem chunks e transações prontos
+# =============================================================================
+
+using Test
+using JSON3
+using Dates
+using Statistics
+using JuliaOS
+
+# Carregar dependências de dados reais
+include("../../fixtures/real_wallets.jl")
+include("../../utils/test_helpers.jl")
+
+# LLMIntegration importa ..AgentCore e ..Config, então é carregado num módulo que os expõe
+module LLMHarness
+    using Main.JuliaOS: AgentCore, Config
+    include("../../../src/agents/LLMIntegration.jl")
+end
+
+const LLM = LLMHarness.LLMIntegration
+
+@testset "LLM Integration - Stream and Prompt Helpers" begin
+
+    @testset "each_json_object" begin
+        chunks = ["noise {\"a\":", " \"}\" ", "}{\"b\":{\"c\":1}}", " tail"]
+        objects = String[]
+        text = LLM.each_json_object(chunks) do obj
+            push!(objects, obj)
+        end
+        @test objects == ["{\"a\": \"}\" }", "{\"b\":{\"c\":1}}"]
+        @test text == join(chunks)
+        @test JSON3.read(objects[2])["b"]["c"] == 1
+
+        # Aspas escapadas não fecham a string
+        escaped = String[]
+        LLM.each_json_object(["{\"q\":\"a\\\"}\"}"]) do obj
+            push!(escaped, obj)
+        end
+        @test JSON3.read(only(escaped))["q"] == "a\"}"
+
+        # Retornar false interrompe o consumo no chunk que fechou o objeto
+        first_only = String[]
+        partial = LLM.each_json_object(chunks) do obj
+            push!(first_only, obj)
+            false
+        end
+        @test length(first_only) == 1
+        @test partial == join(chunks[1:3])
+
+        @test LLM.each_json_object(_ -> error("sem objeto"), ["no json here"]) == "no json here"
+    end
+
+    @testset "each_line" begin
+        lines = String[]
+        text = LLM.each_line(["one\ntw", "o\n", "three"]) do line
+            push!(lines, line)
+        end
+        @test lines == ["one", "two", "three"]
+        @test text == "one\ntwo\nthree"
+
+        trailing = String[]
+        LLM.each_line(l -> push!(trailing, l), ["a\n"])
+        @test trailing == ["a"]
+    end
+
+    @testset "_group_recent_transactions" begin
+        txs = [
+            Dict("type" => "transfer", "amount" => 1.234, "timestamp" => 100),
+            Dict("type" => "transfer", "amount" => 1.249, "timestamp" => 160),
+            Dict("type" => "swap", "amount" => 1.234, "timestamp" => 200),
+            Dict("type" => "transfer", "amount" => 5.0, "timestamp" => 300),
+            Dict("type" => "transfer", "amount" => 1.21, "timestamp" => 400)
+        ]
+        groups = LLM._group_recent_transactions(txs)
+        @test [(g.type, g.amount, g.count) for g in groups] ==
+              [("transfer", 1.2, 3), ("swap", 1.2, 1), ("transfer", 5.0, 1)]
+        @test groups[1].first_seen == 100
+        @test groups[1].last_seen == 400
+
+        # Campos ausentes viram os rótulos padrão
+        missing_fields = LLM._group_recent_transactions([Dict{String,Any}()])
+        @test only(missing_fields).type == "transfer"
+        @test only(missing_fields).amount == "unknown"
+
+        window = [Dict("type" => "transfer", "amount" => Float64(i), "timestamp" => i) for i in 1:LLM.PROMPT_TX_WINDOW + 10]
+        @test sum(g.count for g in LLM._group_recent_transactions(window)) == LLM.PROMPT_TX_WINDOW
+    end
+
+    @testset "transaction_amount_stats" begin
+        amounts = [1.0, 2.0, 3.0, 2.5]
+        timestamps = [100, 110, 130, 125]
+        txs = [Dict{String,Any}("amount" => a, "timestamp" => t) for (a, t) in zip(amounts, timestamps)]
+        push!(txs, Dict{String,Any}("amount" => "n/a", "timestamp" => "unknown"))
+
+        stats = LLM.transaction_amount_stats(txs)
+        @test stats.count == 4
+        @test stats.mean ≈ mean(amounts)
+        @test stats.std ≈ std(amounts)
+        @test stats.round_ratio ≈ 0.75
+        @test stats.gap_std_s ≈ std([10, 20, 5])
+
+        empty_stats = LLM.transaction_amount_stats(Dict{String,Any}[])
+        @test empty_stats == (count=0, mean=0.0, std=0.0, round_ratio=0.0, gap_std_s=0.0)
+    end
+
+    @testset "normalize_risk_level" begin
+        @test LLM.normalize_risk_level("Moderate") == "MEDIUM"
+        @test LLM.normalize_risk_level(" high ") == "HIGH"
+        @test LLM.normalize_risk_level("EXTREME") == "CRITICAL"
+        @test LLM.normalize_risk_level("none") == "LOW"
+        @test LLM.normalize_risk_level("banana") == "MEDIUM"
+        @test LLM.normalize_risk_level(nothing) == "MEDIUM"
+    end
+end
@@ -0,0 +1,90 @@
+# =============================================================================
+# 🧭 TESTE BEHAVIORAL FEATURES - TRIAGEM LOCAL ANTES DA IA
+# =============================================================================
+# Módulo: BehavioralFeatures - compute_behavioral_features (triagem do InvestigationHandlers)
+# Funcionalidades: slots simultâneos, valores redondos/pequenos, rajadas, contraparte dominante
+# NO MOCKS: transações no formato do SolanaService, sem chamadas externas
+# =============================================================================
+
+using Test
+using JSON3
+using Dates
+using Statistics
+
+# Carregar dependências de dados reais
+include("../../fixtures/real_wallets.jl")
+include("../../utils/test_helpers.jl")
+
+include("../../../src/analysis/BehavioralFeatures.jl")
+using .BehavioralFeatures
+
+const BF = BehavioralFeatures
+const WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+const COUNTERPARTY = "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"
+
+tx(; slot, time, amount, to=COUNTERPARTY, from=WALLET) = Dict{String,Any}(
+    "slot" => slot, "blockTime" => time, "amount" => amount, "to_address" => to, "from_address" => from
+)
+
+@testset "Behavioral Features - Local Screen" begin
+
+    @testset "Bot-like wallet trips every burst heuristic" begin
+        txs = [tx(slot=1000, time=100 + i, amount=1.0) for i in 0:5]
+        features, patterns = compute_behavioral_features(txs, WALLET)
+        @test features.simultaneous_max == 6
+        @test features.round_ratio == 1.0
+        @test features.small_ratio == 0.0
+        @test features.burst_ratio == 1.0
+        # A própria carteira não conta como contraparte
+        @test features.top_counterparties == [COUNTERPARTY]
+        @test features.top_counterparty_share == 1.0
+        @test patterns == ["Simultaneous same-slot transactions", "Round number transactions",
+                           "Unusual timing patterns", "Repeated counterparty interactions"]
+        @test features.fully_screened
+    end
+
+    @testset "Dust transfers to distinct counterparties" begin
+        txs = [tx(slot=2000 + i, time=3600 * i, amount=0.001, to="Counterparty$(i)") for i in 1:5]
+        features, patterns = compute_behavioral_features(txs, WALLET)
+        @test features.simultaneous_max == 1
+        @test features.small_ratio == 1.0
+        @test features.round_ratio == 0.0
+        @test features.burst_ratio == 0.0
+        @test features.top_counterparty_share ≈ 0.2
+        @test patterns == ["Frequent small transactions"]
+        @test !features.fully_screened  # cinco transações dão só quatro intervalos
+    end
+
+    @testset "Too few samples are not judged" begin
+        txs = [tx(slot=3000 + i, time=100 + i, amount=2.0) for i in 1:BF.FEATURE_MIN_SAMPLES - 1]
+        features, patterns = compute_behavioral_features(txs, WALLET)
+        @test features.round_ratio == 1.0
+        @test features.burst_ratio == 1.0
+        @test isempty(patterns)
+        @test !features.fully_screened
+    end
+
+    @testset "Signature listings are never fully screened" begin
+        # getSignaturesForAddress traz slot e blockTime, mas nem valor nem contraparte
+        sigs = [Dict{String,Any}("slot" => 4000 + i, "blockTime" => 3600 * i) for i in 1:20]
+        features, patterns = compute_behavioral_features(sigs, WALLET)
+        @test isempty(patterns)
+        @test !features.fully_screened
+    end
+
+    @testset "Missing fields and empty input" begin
+        features, patterns = compute_behavioral_features(Dict{String,Any}[], WALLET)
+        @test features.simultaneous_max == 0
+        @test features.top_counterparties == String[]
+        @test features.top_counterparty_share == 0.0
+        @test isempty(patterns)
+
+        # Mesmo segundo não é mesmo slot: blockTime sozinho não conta como slot
+        sparse = [Dict{String,Any}("amount" => "unknown"), Dict{String,Any}("blockTime" => 100),
+                  Dict{String,Any}("blockTime" => 100), Dict{String,Any}("blockTime" => 100)]
+        features, patterns = compute_behavioral_features(sparse, WALLET)
+        @test features.simultaneous_max == 0
+        @test features.round_ratio == 0.0
+        @test isempty(patterns)
+    end
+end
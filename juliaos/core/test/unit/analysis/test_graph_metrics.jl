@@ -0,0 +1,122 @@
+# =============================================================================
+# 🕸️ TESTE GRAPH METRICS - CSR TOPOLOGY
+# =============================================================================
+# Módulo: GraphMetrics / TxGraphBuilder - métricas de topologia sobre WalletCSR
+# Funcionalidades: construção CSR, betweenness exato e amostrado, Louvain, transitividade
+# NO MOCKS: grafos pequenos construídos com TxEdge reais, resultados conferidos à mão
+# =============================================================================
+
+using Test
+using JSON3
+using Dates
+using Statistics
+
+# Carregar dependências de dados reais
+include("../../fixtures/real_wallets.jl")
+include("../../utils/test_helpers.jl")
+
+include("../../../src/analysis/Analysis.jl")
+using .Analysis
+
+edge(from, to, value=1.0) = TxEdge(from, to, value, nothing, nothing, "system", "$(from)_$(to)_$(value)", "out")
+graph_of(pairs...) = build_graph([edge(p...) for p in pairs])
+
+const PATH_GRAPH = graph_of(("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"))
+const STAR_GRAPH = graph_of([("HUB", "L$i") for i in 1:6]...)
+# Dois triângulos ligados por uma aresta fraca C-D
+const TWO_TRIANGLES = graph_of(("A", "B", 5.0), ("B", "C", 5.0), ("C", "A", 5.0),
+                               ("D", "E", 5.0), ("E", "F", 5.0), ("F", "D", 5.0),
+                               ("C", "D", 0.1))
+
+@testset "Graph Metrics - CSR Topology" begin
+
+    @testset "build_wallet_csr" begin
+        # Transferências paralelas somam, valor zero pesa 1.0, auto-transferência some
+        csr = build_wallet_csr(graph_of(("A", "B", 1.0), ("A", "B", 2.0), ("B", "C", 0.0), ("C", "C", 4.0)))
+        @test csr_node_count(csr) == 3
+        @test csr.addresses == ["A", "B", "C"]
+        @test csr.indptr == Int32[1, 2, 4, 5]
+        @test csr.indices == Int32[2, 1, 3, 2]
+        @test csr.weights == Float32[3.0, 3.0, 1.0, 1.0]
+        @test all(csr.address_ids[a] == i for (i, a) in enumerate(csr.addresses))
+
+        @test csr_node_count(build_wallet_csr(TxGraph())) == 0
+    end
+
+    @testset "csr_arrays merges duplicate pairs" begin
+        indptr, indices, weights = csr_arrays(3, Int32[2, 1, 2, 1], Int32[1, 3, 1, 2], [1.0, 2.0, 3.0, 4.0])
+        @test indptr == Int32[1, 3, 4, 4]
+        @test indices == Int32[2, 3, 1]
+        @test weights == Float32[4.0, 2.0, 4.0]
+    end
+
+    @testset "Exact betweenness" begin
+        csr = build_wallet_csr(PATH_GRAPH)
+        bc = calculate_betweenness(csr)
+        @test bc ≈ [0.0, 0.5, 2 / 3, 0.5, 0.0]
+
+        star = build_wallet_csr(STAR_GRAPH)
+        sbc = calculate_betweenness(star)
+        @test sbc[star.address_ids["HUB"]] ≈ 1.0
+        @test all(iszero, sbc[i] for i in 1:csr_node_count(star) if star.addresses[i] != "HUB")
+
+        # Até dois nós não há intermediários
+        @test calculate_betweenness(build_wallet_csr(graph_of(("A", "B")))) == [0.0, 0.0]
+    end
+
+    @testset "Sampled betweenness" begin
+        csr = build_wallet_csr(PATH_GRAPH)
+        n = csr_node_count(csr)
+        # samples >= n cai no cálculo exato
+        @test calculate_betweenness(csr; samples=n) == calculate_betweenness(csr)
+
+        star = build_wallet_csr(STAR_GRAPH)
+        k = csr_node_count(star) - 1
+        a = calculate_betweenness(star; samples=k, seed=7)
+        @test a == calculate_betweenness(star; samples=k, seed=7)
+        @test length(a) == csr_node_count(star)
+        @test a[star.address_ids["HUB"]] > 0.0
+        @test all(iszero, a[i] for i in 1:csr_node_count(star) if star.addresses[i] != "HUB")
+    end
+
+    @testset "Louvain communities" begin
+        csr = build_wallet_csr(TWO_TRIANGLES)
+        membership = detect_communities_louvain(csr)
+        id(a) = csr.address_ids[a]
+        @test length(membership) == csr_node_count(csr)
+        @test membership[id("A")] == membership[id("B")] == membership[id("C")]
+        @test membership[id("D")] == membership[id("E")] == membership[id("F")]
+        @test membership[id("A")] != membership[id("D")]
+        @test sort(unique(membership)) == [1, 2]
+
+        # Grafo vazio: nenhum rótulo
+        @test detect_communities_louvain(build_wallet_csr(TxGraph())) == Int[]
+    end
+
+    @testset "Transitivity and PageRank" begin
+        @test calculate_transitivity(build_wallet_csr(graph_of(("A", "B"), ("B", "C"), ("C", "A")))) ≈ 1.0
+        @test calculate_transitivity(build_wallet_csr(PATH_GRAPH)) == 0.0
+
+        pr = calculate_pagerank(build_wallet_csr(STAR_GRAPH))
+        @test sum(pr) ≈ 1.0 atol=1e-6
+        @test argmax(pr) == build_wallet_csr(STAR_GRAPH).address_ids["HUB"]
+    end
+
+    @testset "compute_network_topology summary" begin
+        topo = compute_network_topology(TWO_TRIANGLES, "C"; betweenness_samples=0)
+        @test topo["enabled"] == true
+        @test topo["nodes"] == 6
+        @test topo["edges"] == 7
+        @test topo["community_count"] == 2
+        @test topo["largest_community"] == 3
+        @test topo["top_community_sizes"] == [3, 3]
+        @test topo["betweenness_sampled"] == false
+        @test !haskey(topo, "communities")
+        @test topo["center_wallet"]["community_size"] == 3
+        @test topo["center_wallet"]["degree"] == 3
+
+        @test compute_network_topology(TxGraph(), "C")["enabled"] == false
+        # O resumo precisa continuar serializável para os prompts
+        @test JSON3.read(JSON3.write(topo))["community_count"] == 2
+    end
+end
@@ -0,0 +1,86 @@
+# =============================================================================
+# 🌐 TESTE RPC BATCH REQUEST - REMAPEAMENTO DE IDS
+# =============================================================================
+# Módulo: ProviderPool - rpc_batch_request
+# Funcionalidades: respostas fora de ordem, itens com erro, ids ausentes ou inválidos,
+#                  endpoint que recusa batch
+# NO MOCKS: um nó JSON-RPC local (HTTP.serve!) responde ao POST real do pool
+# =============================================================================
+
+using Test
+using HTTP
+using JSON3
+using Dates
+using Sockets
+using Statistics
+
+# Carregar dependências de dados reais
+include("../../fixtures/real_wallets.jl")
+include("../../utils/test_helpers.jl")
+
+include("../../../src/providers/ProviderPool.jl")
+using .ProviderPool
+
+const BATCH_MODE = Ref(:shuffled)
+const BATCH_POSTS = Ref(0)
+
+# Responde ao batch como um nó real pode responder: ordem invertida, o id 2 com erro,
+# o último id ausente e dois itens que não pertencem ao batch
+function batch_node(req::HTTP.Request)
+    BATCH_POSTS[] += 1
+    calls = collect(JSON3.read(String(req.body)))
+    body = if BATCH_MODE[] == :refuse
+        JSON3.write((jsonrpc="2.0", id=nothing, error=(code=-32600, message="batch requests are disabled")))
+    else
+        items = Any[]
+        for call in Iterators.reverse(calls[1:end-1])
+            push!(items, call[:id] == 2 ?
+                (jsonrpc="2.0", id=2, error=(code=-32005, message="node is behind")) :
+                (jsonrpc="2.0", id=call[:id], result=(value=100 * call[:id], method=call[:method])))
+        end
+        push!(items, (jsonrpc="2.0", id=99, result=0), (jsonrpc="2.0", id=nothing, result=0))
+        JSON3.write(items)
+    end
+    return HTTP.Response(200, ["Content-Type" => "application/json"], body)
+end
+
+const CALLS = [("getBalance", Any[DEFI_WALLETS["raydium_amm_v4"]]), ("getBalance", Any[CEX_WALLETS["binance_hot_1"]]),
+               ("getSlot", Any[]), ("getBalance", Any[CEX_WALLETS["coinbase_1"]])]
+
+@testset "RPC Batch Request - Id Remapping" begin
+    port, probe = listenany(ip"127.0.0.1", 18900)
+    close(probe)
+    server = HTTP.serve!(batch_node, "127.0.0.1", port)
+    try
+        ProviderPool.SOLANA_POOL[] = SolanaProviderPool(["http://127.0.0.1:$(port)"])
+
+        @testset "Out-of-order batch is remapped to call order" begin
+            BATCH_MODE[] = :shuffled
+            BATCH_POSTS[] = 0
+            out = rpc_batch_request(CALLS)
+            @test BATCH_POSTS[] == 1
+            @test length(out) == length(CALLS)
+            @test [env["id"] for env in out] == [1, 2, 3, 4]
+            @test out[1]["result"][:value] == 100
+            @test out[3]["result"][:value] == 300
+            @test out[3]["result"][:method] == "getSlot"
+            @test !haskey(out[1], "error")
+            @test out[2]["result"] === nothing
+            @test out[2]["error"][:message] == "node is behind"
+            @test out[4]["error"]["message"] == "missing from batch response"
+        end
+
+        @testset "Endpoint refusing batches fails every envelope" begin
+            BATCH_MODE[] = :refuse
+            BATCH_POSTS[] = 0
+            out = rpc_batch_request(CALLS; retries=2)
+            @test BATCH_POSTS[] == 2
+            @test length(out) == length(CALLS)
+            @test all(env -> env["result"] === nothing && env["_meta"]["failed"], out)
+            @test all(env -> occursin("batch requests are disabled", env["error"]["message"]), out)
+        end
+    finally
+        close(server)
+        ProviderPool.SOLANA_POOL[] = nothing
+    end
+end
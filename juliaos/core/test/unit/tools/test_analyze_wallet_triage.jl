@@ -0,0 +1,69 @@
+# =============================================================================
+# 🔧 TESTE ANALYZE WALLET - AI TRIAGE E FAIXAS DE RISCO
+# =============================================================================
+# Tool: analyze_wallet - decisão de pular o veredito da IA e faixa de risco do score
+# Funcionalidades: _triage_ai sobre snapshots base, risk_level_for nos limites
+# NO MOCKS: snapshots montados no formato real do tool, sem chamadas externas
+# =============================================================================
+
+using Test
+using JSON3
+using Dates
+using Statistics
+
+# Carregar dependências de dados reais
+include("../../fixtures/real_wallets.jl")
+include("../../utils/test_helpers.jl")
+
+include("../../../src/tools/Tools.jl")
+using .Tools
+
+function base_snapshot(; level="MEDIUM", engine_level="MEDIUM", total=50, patterns=["High transaction volume"],
+                       blacklisted=false, fallback=false)
+    Dict{String,Any}(
+        "blacklist" => Dict{String,Any}("is_blacklisted" => blacklisted),
+        "transaction_summary" => Dict{String,Any}("total_transactions" => total),
+        "risk_assessment" => Dict{String,Any}("risk_level" => level, "patterns" => patterns),
+        "risk_engine" => Dict{String,Any}("risk_level" => engine_level, "fallback_used" => fallback)
+    )
+end
+
+@testset "Analyze Wallet - AI Triage" begin
+
+    @testset "_triage_ai" begin
+        @test Tools._triage_ai(base_snapshot()) === nothing
+        @test Tools._triage_ai(base_snapshot(blacklisted=true)) == "public_blacklist_hit"
+        @test Tools._triage_ai(base_snapshot(level="LOW", total=Tools.AI_TRIAGE_MIN_TXS - 1, patterns=String[])) ==
+              "insufficient_activity"
+        # Por padrão LOW/CRITICAL concordantes ainda vão para a IA
+        @test Tools._triage_ai(base_snapshot(level="LOW", engine_level="LOW"); skip_agreed=false) === nothing
+        @test Tools._triage_ai(base_snapshot(level="CRITICAL", engine_level="CRITICAL"); skip_agreed=false) === nothing
+        @test Tools._triage_ai(base_snapshot(blacklisted=true); skip_agreed=false) == "public_blacklist_hit"
+
+        # Com skip_agreed, pattern scan e motor concordando dispensam a IA
+        @test Tools._triage_ai(base_snapshot(level="LOW", engine_level="LOW"); skip_agreed=true) == "low_risk"
+        @test Tools._triage_ai(base_snapshot(level="CRITICAL", engine_level="CRITICAL"); skip_agreed=true) == "critical_risk"
+
+        # Motor de risco em fallback não confirma LOW nem CRITICAL
+        @test Tools._triage_ai(base_snapshot(level="LOW", engine_level="LOW", fallback=true); skip_agreed=true) === nothing
+        @test Tools._triage_ai(base_snapshot(level="CRITICAL", engine_level="CRITICAL", fallback=true); skip_agreed=true) === nothing
+        # Pattern scan e motor discordando vão para a IA
+        @test Tools._triage_ai(base_snapshot(level="LOW", engine_level="HIGH"); skip_agreed=true) === nothing
+        # Poucas transações mas com padrão detectado ainda merecem a IA
+        @test Tools._triage_ai(base_snapshot(level="LOW", engine_level="HIGH", total=1)) === nothing
+
+        # Snapshot sem as seções opcionais conta como carteira sem atividade
+        @test Tools._triage_ai(Dict{String,Any}()) == "insufficient_activity"
+    end
+
+    @testset "risk_level_for" begin
+        @test Tools.risk_level_for(0) == "LOW"
+        @test Tools.risk_level_for(29.9) == "LOW"
+        @test Tools.risk_level_for(30) == "MEDIUM"
+        @test Tools.risk_level_for(60) == "HIGH"
+        @test Tools.risk_level_for(80) == "CRITICAL"
+        @test Tools.risk_level_for(100) == "CRITICAL"
+        @test Tools.risk_level_for(NaN) == "LOW"
+        @test Tools.risk_levels_for([10, 45, 70, 95]) == ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+    end
+end